@@ -1,14 +1,16 @@
 from PySide2.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QToolButton, QMenu, QWidget
 from PySide2.QtCore import Qt, Signal
+from models import Money
 
-def format_currency(amount: float, currency_symbol: str = "TT$") -> str:
-    return f"{currency_symbol}{amount:,.2f}"
+def format_currency(amount: int, currency_symbol: str = "TT$") -> str:
+    """Formats an amount in cents."""
+    return f"{currency_symbol}{Money(amount):,.2f}"
 
 class AccountCard(QFrame):
-    editRequested = Signal(str) #emits account_id
-    deleteRequested = Signal(str) #emits account_id
+    editRequested = Signal(int) #emits account_id
+    deleteRequested = Signal(int) #emits account_id
 
-    def __init__(self, account_id:str, name: str, balance: float, parent=None):
+    def __init__(self, account_id: int, name: str, balance: int, parent=None):
         super().__init__(parent)
         self.account_id = account_id
         self.name = name
@@ -117,7 +119,7 @@ class AccountCard(QFrame):
             self.balanceLbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
             layout.addWidget(self.balanceLbl)
 
-    def updateData(self, name:str, balance: float):
+    def updateData(self, name:str, balance: int):
         self.name = name
         self.balance = balance
         self.nameLbl.setText(name)
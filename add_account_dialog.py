@@ -1,10 +1,11 @@
 from PySide2.QtWidgets import QDialog, QMessageBox
 from PySide2.QtGui import QDoubleValidator
 from ui.ui_addAccountDialog import Ui_createAccountDialog
+from models import Money
 
 
 class AddAccountDialog(QDialog):
-    def __init__(self,parent=None,initial_name: str = "",initial_amount:float = None ):
+    def __init__(self,parent=None,initial_name: str = "",initial_amount:int = None ):
         super().__init__(parent)
         self.ui = Ui_createAccountDialog()
         self.ui.setupUi(self)
@@ -24,7 +25,7 @@ class AddAccountDialog(QDialog):
         if initial_name:
             self.ui.accNameLe.setText(initial_name)
         if initial_amount is not None:
-            self.ui.accBalanceLe.setText(f"{initial_amount:.2f}")
+            self.ui.accBalanceLe.setText(str(Money(initial_amount)))
 
         #Holds the result tuple(name,account) after accept
         self._result = None
@@ -40,7 +41,7 @@ class AddAccountDialog(QDialog):
         
 
         try:
-            amount = float(amount_text)
+            amount = Money.parse(amount_text)
         except ValueError:
             QMessageBox.warning(self,"Invalid amount","Please enter a valid number.")
             return
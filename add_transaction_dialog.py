@@ -1,6 +1,7 @@
 from PySide2.QtWidgets import (QDialog, QVBoxLayout, QPushButton, 
                                QLineEdit, QLabel, QComboBox, QDateEdit, QMessageBox)
 from PySide2.QtCore import QDate, Qt
+from models import Money
 
 class AddTransactionDialog(QDialog):
     def __init__(self, parent=None, accounts=None, categories=None, initial_data=None):
@@ -55,7 +56,7 @@ class AddTransactionDialog(QDialog):
         self.amount_input = QLineEdit()
         self.amount_input.setPlaceholderText("0.00")
         if initial_data:
-            self.amount_input.setText(str(initial_data["amount"]))
+            self.amount_input.setText(str(Money(initial_data["amount"])))
         layout.addWidget(self.amount_input)
 
         # Type (Income/Expense)
@@ -91,7 +92,7 @@ class AddTransactionDialog(QDialog):
 
     def save(self):
         try:
-            amount = float(self.amount_input.text())
+            amount = Money.parse(self.amount_input.text())
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid amount.")
             return
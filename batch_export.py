@@ -0,0 +1,120 @@
+"""Headless PDF report export, e.g. for scheduled monthly reports.
+
+    python batch_export.py ledger.db 2024-01 2024-02 -o reports/
+    python batch_export.py ledger.db 2024-01..2024-12 --monthly --workers 4 -o reports/
+    python batch_export.py ledger.db 2024 2024-Q1 -o reports/
+
+A YYYY-MM period becomes a monthly report; any other period accepted by
+DateRange.parse becomes one range report, or with --monthly one report per
+month it touches. Runs on Qt's offscreen platform, so no display is needed.
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from controllers import MainController
+from date_range import DateRange, MONTH_RE, SPAN_SEPARATOR
+
+
+def plan_jobs(periods, output_dir, monthly=False):
+    """Expands the requested periods into (period, pdf path) export jobs, without duplicates."""
+    jobs = []
+    for period in periods:
+        names = DateRange.parse(period).months() if monthly else [period.strip()]
+        for name in names:
+            file_name = f"Budget_Report_{name.replace(SPAN_SEPARATOR, '_to_')}.pdf"
+            jobs.append((name, os.path.join(output_dir, file_name)))
+    return list(dict.fromkeys(jobs))
+
+
+def export_jobs(db_path, jobs, debug_html=None):
+    """Exports jobs in this process through one controller and one ReportPipeline.
+
+    Returns (period, path, error message or None) per job.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide2.QtWidgets import QApplication
+    from export_engine import PDFExporter, ReportPipeline
+    from export_diagnostics import ExportDiagnostics, DATA_FETCH
+
+    app = QApplication.instance() or QApplication([])  # Needed by QPrinter and fonts
+    # main() has migrated the database; exports only read it
+    controller = MainController(db_path, profile="reporting")
+    pipeline = ReportPipeline(debug_html)
+    results = []
+    try:
+        for period, path in jobs:
+            try:
+                diagnostics = ExportDiagnostics(path, debug_html)
+                monthly = MONTH_RE.match(period)
+                with diagnostics.phase(DATA_FETCH):
+                    if monthly:
+                        data = controller.get_report_data(period)
+                    else:
+                        data = controller.get_range_report_data(period)
+                export = PDFExporter.export_monthly_report if monthly else PDFExporter.export_range_report
+                ok = export(data, path, pipeline=pipeline, diagnostics=diagnostics)
+                results.append((period, path, None if ok else "Failed to generate PDF report."))
+            except Exception as e:
+                results.append((period, path, str(e)))
+    finally:
+        controller.close()
+    return results
+
+
+def run(db_path, jobs, workers=1, debug_html=None):
+    """Exports all jobs, split across `workers` processes when more than one."""
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        return export_jobs(db_path, jobs, debug_html)
+
+    # Every process sets up Qt, the controller and the pipeline once for its share
+    batches = [jobs[i::workers] for i in range(workers)]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        per_batch = pool.map(export_jobs, [db_path] * workers, batches, [debug_html] * workers)
+        finished = [r for batch in per_batch for r in batch]
+    order = {job: i for i, job in enumerate(jobs)}
+    return sorted(finished, key=lambda r: order[(r[0], r[1])])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export Budget App PDF reports without the GUI")
+    parser.add_argument("db", help="path to the budget database")
+    parser.add_argument("periods", nargs="+", help="YYYY-MM, YYYY-Qn, YYYY or FIRST..LAST periods")
+    parser.add_argument("-o", "--output-dir", default=".", help="directory for the PDFs (default: .)")
+    parser.add_argument("--monthly", action="store_true", help="one report per month of each period")
+    parser.add_argument("--workers", type=int, default=1, help="parallel export processes (default: 1)")
+    parser.add_argument("--debug-html", action="store_true", default=None,
+                        help="write a .debug.html with phase timings next to each PDF "
+                             "(default: BUDGET_EXPORT_DEBUG environment variable)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        parser.error(f"database not found: {args.db}")
+    for period in args.periods:
+        try:
+            DateRange.parse(period)
+        except ValueError as e:
+            parser.error(f"invalid period {period!r}: {e}")
+    jobs = plan_jobs(args.periods, args.output_dir, args.monthly)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    # Apply pending migrations once, before any worker opens the database
+    MainController(args.db).close()
+
+    failures = 0
+    for period, path, error in run(args.db, jobs, max(1, args.workers), args.debug_html):
+        if error:
+            failures += 1
+            print(f"FAILED {period}: {error}")
+        else:
+            print(f"OK     {period}: {path}")
+    print(f"{len(jobs) - failures} of {len(jobs)} reports exported")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
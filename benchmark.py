@@ -0,0 +1,523 @@
+"""Micro-benchmarks for the data layer.
+
+Run all benchmarks with `python benchmark.py`, or pick some by name:
+`python benchmark.py connections`. Every benchmark works on a throwaway
+database in a temporary directory, never on budget.db.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+
+from controllers import MainController
+from database import DEFAULT_POOL_SIZE, PROFILES
+
+
+@contextmanager
+def temp_db_path():
+    """Yields a path for a scratch database that is removed afterwards."""
+    tmp_dir = tempfile.mkdtemp(prefix="budget_bench_")
+    try:
+        yield os.path.join(tmp_dir, "bench.db")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def timed(func, iterations):
+    """Runs func `iterations` times and returns the mean latency in microseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def print_table(title, headers, rows):
+    print(f"\n{title}")
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(str(c).ljust(w) for c, w in zip(row, widths)))
+
+
+def bench_connections(iterations=2000):
+    """Per-operation latency with a fresh connection per query vs. the pool."""
+    rows = []
+    for label, pool_size in (("per-query connect", 0), (f"pooled ({DEFAULT_POOL_SIZE})", DEFAULT_POOL_SIZE)):
+        with temp_db_path() as db_path:
+            controller = MainController(db_path, pool_size=pool_size)
+            acc = controller.add_account("Bench", 1000_00)
+            db = controller.db
+
+            fetch_one = timed(lambda: db.fetch_one("SELECT balance FROM accounts WHERE id = ?", (acc.id,)), iterations)
+            fetch_all = timed(lambda: db.fetch_all("SELECT * FROM categories"), iterations)
+            execute = timed(lambda: db.execute_query("UPDATE accounts SET name = ? WHERE id = ?", ("Bench", acc.id)), iterations // 4)
+            add_t = timed(lambda: controller.add_transaction(acc.id, "2024-01-15", 1_00, "Food", "Expense", ""), iterations // 4)
+            summary = timed(lambda: controller.get_monthly_summary("2024-01"), iterations // 4)
+            controller.close()
+
+        rows.append((label, f"{fetch_one:.1f}", f"{fetch_all:.1f}", f"{execute:.1f}", f"{add_t:.1f}", f"{summary:.1f}"))
+
+    print_table(
+        "Connection handling (mean µs per operation)",
+        ["mode", "fetch_one", "fetch_all", "execute_query", "add_transaction", "monthly_summary"],
+        rows,
+    )
+
+
+def bench_import(rows=100_000):
+    """Bulk CSV import throughput vs. calling add_transaction per row."""
+    import csv
+    from importer import TransactionImporter
+
+    categories = ["Food", "Rent", "Salary", "Transport", "Coffee", "Books"]
+    with temp_db_path() as db_path:
+        csv_path = db_path + ".csv"
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["date", "amount", "category", "note"])
+            for i in range(rows):
+                amount = 2500.0 if i % 50 == 0 else -(i % 97 + 1.25)
+                writer.writerow([f"20{10 + i % 14}-{i % 12 + 1:02d}-{i % 28 + 1:02d}", amount, categories[i % 6], f"row {i}"])
+
+        controller = MainController(db_path)
+        acc = controller.add_account("Bench", 0)
+
+        start = time.perf_counter()
+        result = TransactionImporter(controller.db).import_file(csv_path, acc.id)
+        bulk = time.perf_counter() - start
+
+        sample = min(rows, 2000)
+        start = time.perf_counter()
+        for i in range(sample):
+            controller.add_transaction(acc.id, "2024-01-01", 1_00, categories[i % 6], "Expense", "")
+        per_row = (time.perf_counter() - start) / sample
+        controller.close()
+
+    print_table(
+        f"Importing {rows:,} CSV rows",
+        ["path", "seconds", "rows/s"],
+        [
+            ("TransactionImporter", f"{bulk:.2f}", f"{result['imported'] / bulk:,.0f}"),
+            ("add_transaction (extrapolated)", f"{per_row * rows:.2f}", f"{1 / per_row:,.0f}"),
+        ],
+    )
+
+
+def bench_transaction_view(rows=50_000, steps=200):
+    """Scroll latency of the lazy transaction list over a large history.
+
+    Needs PySide2; runs on the offscreen platform so no display is required.
+    Constant-time scrolling shows up as similar latencies for the first and
+    last scroll steps even though the model keeps growing.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide2.QtWidgets import QApplication, QListView
+    from importer import TransactionImporter
+    from transaction_model import TransactionTableModel, TransactionDelegate
+
+    app = QApplication.instance() or QApplication([])
+    with temp_db_path() as db_path:
+        controller = MainController(db_path)
+        acc = controller.add_account("Bench", 0)
+        TransactionImporter(controller.db).import_rows(
+            ((f"20{10 + i % 14}-{i % 12 + 1:02d}-{i % 28 + 1:02d}", (i % 97 + 1) * 100, "Food", "Expense", f"row {i}", None)
+             for i in range(rows)),
+            acc.id
+        )
+
+        model = TransactionTableModel(controller)
+        view = QListView()
+        view.setModel(model)
+        view.setItemDelegate(TransactionDelegate(view))
+        view.setUniformItemSizes(True)
+        view.resize(900, 700)
+        view.show()
+
+        start = time.perf_counter()
+        model.load()
+        app.processEvents()
+        first_paint = (time.perf_counter() - start) * 1000
+
+        bar = view.verticalScrollBar()
+        latencies = []
+        for _ in range(steps):
+            start = time.perf_counter()
+            bar.setValue(bar.maximum())
+            app.processEvents()
+            view.viewport().repaint()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        loaded = model.rowCount()
+        view.close()
+        controller.close()
+
+    head, tail = latencies[:10], latencies[-10:]
+    print_table(
+        f"Transaction list with {rows:,} rows ({loaded:,} fetched after {steps} scroll steps)",
+        ["metric", "ms"],
+        [
+            ("first page + paint", f"{first_paint:.2f}"),
+            ("mean scroll step (first 10)", f"{sum(head) / len(head):.2f}"),
+            ("mean scroll step (last 10)", f"{sum(tail) / len(tail):.2f}"),
+        ],
+    )
+
+
+def bench_models(rows=100_000):
+    """Load time and retained memory of 100k transactions: dict rows + dataclass vs. tuples + NamedTuple."""
+    import tracemalloc
+    from dataclasses import dataclass
+    from importer import TransactionImporter
+    from models import Transaction, TRANSACTION_COLUMNS, TRANSACTION_SOURCE
+
+    @dataclass
+    class DictTransaction:
+        # The previous model, built from dict(row) copies
+        id: str
+        account_id: str
+        date: str
+        amount: float
+        category: str
+        type: str
+        note: str
+
+    def load_dicts(db):
+        return [DictTransaction(**row) for row in db.fetch_all(f"SELECT {TRANSACTION_COLUMNS} FROM {TRANSACTION_SOURCE}")]
+
+    def load_tuples(db):
+        return db.fetch_all_as(Transaction, f"SELECT {TRANSACTION_COLUMNS} FROM {TRANSACTION_SOURCE}")
+
+    results = []
+    with temp_db_path() as db_path:
+        controller = MainController(db_path)
+        acc = controller.add_account("Bench", 0)
+        TransactionImporter(controller.db).import_rows(
+            ((f"20{10 + i % 14}-{i % 12 + 1:02d}-{i % 28 + 1:02d}", (i % 97 + 1) * 100, "Food", "Expense", f"row {i}", None)
+             for i in range(rows)),
+            acc.id
+        )
+        for label, load in (("dict rows + dataclass", load_dicts), ("tuples + NamedTuple._make", load_tuples)):
+            seconds = min(timed(lambda: load(controller.db), 1) for _ in range(3)) / 1_000_000
+            tracemalloc.start()
+            loaded = load(controller.db)
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results.append((label, f"{seconds:.3f}", f"{len(loaded) / seconds:,.0f}",
+                            f"{retained / 2**20:.1f}", f"{peak / 2**20:.1f}"))
+            del loaded
+        controller.close()
+
+    print_table(
+        f"Loading {rows:,} transactions",
+        ["path", "seconds", "rows/s", "retained MiB", "peak MiB"],
+        results,
+    )
+
+
+def bench_profiles(writes=2000, rows=100_000, reads=200):
+    """Write and read throughput of each database profile against SQLite's defaults.
+
+    Writes are single add_transaction commits (one fsync each, unless the
+    profile turns that off) and one bulk import; reads run a monthly
+    aggregate and a full-history scan, bypassing the controller's read cache.
+    """
+    from importer import TransactionImporter
+
+    # SQLite's defaults, which every connection used before profiles existed
+    profiles = {"sqlite defaults": {"journal_mode": "DELETE"}, **PROFILES}
+    import_rows = [(f"20{10 + i % 14}-{i % 12 + 1:02d}-{i % 28 + 1:02d}", (i % 97 + 1) * 100, "Food", "Expense", f"row {i}", None)
+                   for i in range(rows)]
+    month_sql = "SELECT category_id, SUM(amount) FROM transactions WHERE date >= ? AND date < ? GROUP BY category_id"
+    scan_sql = "SELECT SUM(amount), COUNT(*) FROM transactions WHERE note LIKE 'row 1%'"
+
+    results = []
+    for name, profile in profiles.items():
+        with temp_db_path() as db_path:
+            writable = "desktop" if profile.get("read_only") else profile
+            controller = MainController(db_path, profile=writable)
+            acc = controller.add_account("Bench", 0)
+            start = time.perf_counter()
+            for i in range(writes):
+                controller.add_transaction(acc.id, "2024-01-01", 1_00, "Food", "Expense", "")
+            single = writes / (time.perf_counter() - start)
+            start = time.perf_counter()
+            TransactionImporter(controller.db).import_rows(iter(import_rows), acc.id)
+            bulk = rows / (time.perf_counter() - start)
+            controller.close()
+
+            if profile.get("read_only"):
+                # Seeded through "desktop"; only the reads below use this profile
+                single = bulk = None
+            controller = MainController(db_path, profile=profile)
+            db = controller.db
+            month = timed(lambda: db.fetch_all(month_sql, ("2016-03-01", "2016-04-01")), reads)
+            scan = timed(lambda: db.fetch_all(scan_sql), max(1, reads // 10))
+            controller.close()
+
+        results.append((
+            name,
+            f"{single:,.0f}" if single else "-",
+            f"{bulk:,.0f}" if bulk else "-",
+            f"{month:,.0f}",
+            f"{scan / 1000:,.1f}",
+        ))
+
+    print_table(
+        f"Database profiles ({writes:,} commits, {rows:,} imported rows)",
+        ["profile", "commits/s", "import rows/s", "month query us", "full scan ms"],
+        results,
+    )
+
+
+def bench_money(rows=1_000_000, reps=5):
+    """Summing amounts stored as REAL dollars vs. INTEGER cents, in SQLite, Python and NumPy."""
+    import random
+    import sqlite3
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    rng = random.Random(42)
+    cents = [rng.randint(1, 250_000) for _ in range(rows)]
+    dollars = [c / 100 for c in cents]
+    exact = sum(cents)
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE real_dollars (amount REAL NOT NULL)")
+    conn.execute("CREATE TABLE integer_cents (amount INTEGER NOT NULL)")
+    conn.executemany("INSERT INTO real_dollars VALUES (?)", ((d,) for d in dollars))
+    conn.executemany("INSERT INTO integer_cents VALUES (?)", ((c,) for c in cents))
+    try:
+        sizes = dict(conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"))
+    except sqlite3.OperationalError:  # SQLite built without the dbstat table
+        sizes = {}
+
+    def best_ms(func):
+        return f"{min(timed(func, 1) for _ in range(reps)) / 1000:.2f}"
+
+    def drift(total_cents):
+        return f"{abs(total_cents - exact):.4f}"
+
+    results = []
+    for table, scale in (("real_dollars", 100), ("integer_cents", 1)):
+        sql = f"SELECT SUM(amount) FROM {table}"
+        total = conn.execute(sql).fetchone()[0]
+        size = f"{sizes[table] / 2**20:.1f}" if table in sizes else "-"
+        results.append((f"SQLite SUM, {table}", best_ms(lambda: conn.execute(sql).fetchone()), drift(total * scale), size))
+    conn.close()
+    results.append(("Python sum, float dollars", best_ms(lambda: sum(dollars)), drift(sum(dollars) * 100), "-"))
+    results.append(("Python sum, int cents", best_ms(lambda: sum(cents)), drift(sum(cents)), "-"))
+    if numpy is not None:
+        float_array = numpy.array(dollars, dtype=numpy.float64)
+        int_array = numpy.array(cents, dtype=numpy.int64)
+        results.append(("NumPy sum, float64 dollars", best_ms(float_array.sum), drift(float(float_array.sum()) * 100),
+                        f"{float_array.nbytes / 2**20:.1f}"))
+        results.append(("NumPy sum, int64 cents", best_ms(int_array.sum), drift(int(int_array.sum())),
+                        f"{int_array.nbytes / 2**20:.1f}"))
+
+    print_table(
+        f"Summing {rows:,} amounts" + ("" if numpy is not None else " (NumPy not installed)"),
+        ["path", "ms", "error (cents)", "MiB"],
+        results,
+    )
+
+
+def bench_keys(rows=200_000, accounts=50, lookups=2000):
+    """File size, id lookups and joins with uuid4 hex TEXT keys vs. INTEGER PRIMARY KEY ids.
+
+    The same ledger is built at schema version 4 (text keys), measured,
+    migrated to integer keys and measured again.
+    """
+    import random
+    import uuid
+    from database import open_connection
+    from migrations import migrate
+
+    join_sql = """
+        SELECT a.name, SUM(t.amount) FROM transactions t JOIN accounts a ON a.id = t.account_id
+        WHERE t.date >= '2020-01-01' GROUP BY a.id
+    """
+    rng = random.Random(7)
+
+    def measure(conn, db_path, label):
+        conn.execute("VACUUM")
+        # The desktop profile runs in WAL mode; fold the log back in before sizing the file
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        ids = [row[0] for row in conn.execute("SELECT id FROM transactions")]
+        account_ids = [row[0] for row in conn.execute("SELECT id FROM accounts")]
+        sample = rng.sample(ids, lookups)
+
+        def best_of_5(func):
+            return min(timed(func, 1) for _ in range(5))
+
+        lookup = best_of_5(lambda: [conn.execute("SELECT * FROM transactions WHERE id = ?", (i,)).fetchone()
+                                    for i in sample]) / lookups
+        by_account = best_of_5(lambda: [conn.execute("SELECT COUNT(*) FROM transactions WHERE account_id = ? "
+                                                     "AND date >= '2023-01-01'", (a,)).fetchone()
+                                        for a in account_ids]) / len(account_ids)
+        join = best_of_5(lambda: conn.execute(join_sql).fetchall()) / 1000
+        return (label, f"{os.path.getsize(db_path) / 2**20:.1f}", f"{lookup:.1f}", f"{by_account:.0f}", f"{join:.1f}")
+
+    results = []
+    with temp_db_path() as db_path:
+        conn = open_connection(db_path)
+        migrate(conn, target=4)
+        account_keys = [uuid.uuid4().hex for _ in range(accounts)]
+        conn.executemany("INSERT INTO accounts (id, name, balance) VALUES (?, ?, 0)",
+                         [(key, f"Account {i}") for i, key in enumerate(account_keys)])
+        conn.executemany(
+            "INSERT INTO transactions (id, account_id, date, amount, category, type, note) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((uuid.uuid4().hex, account_keys[i % accounts], f"20{10 + i % 14}-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+              (i % 97 + 1) * 100, "Food", "Expense", "") for i in range(rows))
+        )
+        conn.commit()
+        results.append(measure(conn, db_path, "uuid4 hex TEXT keys"))
+
+        start = time.perf_counter()
+        migrate(conn, target=5)
+        migration = time.perf_counter() - start
+        results.append(measure(conn, db_path, "INTEGER PRIMARY KEY"))
+        conn.close()
+
+    print_table(
+        f"{rows:,} transactions over {accounts} accounts (migration took {migration:.2f} s)",
+        ["keys", "file MiB", "lookup by id us", "account filter us", "join ms"],
+        results,
+    )
+
+
+def bench_categories(rows=200_000, categories=40):
+    """File size, category grouping and rename with category names on every row vs. integer ids.
+
+    The same ledger is built at schema version 5 (TEXT category column),
+    measured, migrated to category_id references and measured again.
+    """
+    from database import open_connection
+    from migrations import migrate
+
+    names = [f"Category {i}" for i in range(categories)]
+
+    def best_of_5(func):
+        return min(timed(func, 1) for _ in range(5))
+
+    def measure(conn, db_path, label, group_sql, rename_sql):
+        conn.execute("VACUUM")
+        # The desktop profile runs in WAL mode; fold the log back in before sizing the file
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        group = best_of_5(lambda: conn.execute(group_sql).fetchall()) / 1000
+        rename = best_of_5(lambda: (conn.execute(rename_sql, ("Renamed", names[0])),
+                                    conn.execute(rename_sql, (names[0], "Renamed")))) / 2000
+        conn.commit()
+        return (label, f"{os.path.getsize(db_path) / 2**20:.1f}", f"{group:.1f}", f"{rename:.2f}")
+
+    results = []
+    with temp_db_path() as db_path:
+        conn = open_connection(db_path)
+        migrate(conn, target=5)
+        conn.execute("INSERT INTO accounts (name, balance) VALUES ('Bench', 0)")
+        conn.executemany("INSERT OR IGNORE INTO categories (name) VALUES (?)", [(name,) for name in names])
+        conn.executemany(
+            "INSERT INTO transactions (account_id, date, amount, category, type, note) VALUES (1, ?, ?, ?, 'Expense', '')",
+            ((f"20{10 + i % 14}-{i % 12 + 1:02d}-{i % 28 + 1:02d}", (i % 97 + 1) * 100, names[i % categories])
+             for i in range(rows))
+        )
+        conn.commit()
+        results.append(measure(conn, db_path, "name on every row",
+                               "SELECT category, SUM(amount) FROM transactions GROUP BY category",
+                               "UPDATE transactions SET category = ? WHERE category = ?"))
+
+        start = time.perf_counter()
+        migrate(conn, target=6)
+        migration = time.perf_counter() - start
+        results.append(measure(conn, db_path, "category_id + name dict",
+                               "SELECT category_id, SUM(amount) FROM transactions GROUP BY category_id",
+                               "UPDATE categories SET name = ? WHERE name = ?"))
+        conn.close()
+
+    print_table(
+        f"{rows:,} transactions over {categories} categories (migration took {migration:.2f} s)",
+        ["categories", "file MiB", "group by ms", "rename ms"],
+        results,
+    )
+
+
+def bench_buckets(rows=200_000, reads=20):
+    """Day-of-month and ISO-week grouping: Python date parsing vs. stored generated columns."""
+    from datetime import date
+    from importer import TransactionImporter
+
+    def daily_in_python(db):
+        # The previous get_daily_transaction_summary loop
+        summary = {}
+        for row in db.fetch_all("SELECT date, type FROM transactions WHERE date >= ? AND date < ?",
+                                ("2016-03-01", "2016-04-01")):
+            day = summary.setdefault(int(row["date"].split("-")[2]), {"has_income": False, "has_expense": False})
+            day["has_income" if row["type"] == "Income" else "has_expense"] = True
+        return summary
+
+    def weekly_in_python(db):
+        weeks = {}
+        for row in db.fetch_all("SELECT date, amount FROM transactions WHERE date >= ? AND date < ?",
+                                ("2016-01-01", "2017-01-01")):
+            year, week, _ = date.fromisoformat(row["date"]).isocalendar()
+            key = f"{year}-W{week:02d}"
+            weeks[key] = weeks.get(key, 0) + row["amount"]
+        return weeks
+
+    results = []
+    with temp_db_path() as db_path:
+        controller = MainController(db_path)
+        acc = controller.add_account("Bench", 0)
+        TransactionImporter(controller.db).import_rows(
+            ((f"20{10 + i % 14}-{i % 12 + 1:02d}-{i % 28 + 1:02d}", (i % 97 + 1) * 100, "Food",
+              "Income" if i % 5 == 0 else "Expense", "", None) for i in range(rows)),
+            acc.id
+        )
+        db = controller.db
+        # Call the engine unwrapped so the read cache doesn't answer repeats
+        aggregate = MainController.aggregate.__wrapped__
+        cases = (
+            ("daily summary, split in Python", lambda: daily_in_python(db)),
+            ("daily summary, aggregate(day_of_month)",
+             lambda: aggregate(controller, "2016-03", bucket="day_of_month", by="type")),
+            ("weekly totals, isocalendar in Python", lambda: weekly_in_python(db)),
+            ("weekly totals, aggregate(week)",
+             lambda: aggregate(controller, "2016-01-01..2016-12-31", bucket="week")),
+        )
+        for label, run in cases:
+            results.append((label, f"{timed(run, reads) / 1000:.2f}"))
+        controller.close()
+
+    print_table(f"Time buckets over {rows:,} transactions", ["path", "ms"], results)
+
+
+BENCHMARKS = {
+    "connections": bench_connections,
+    "import": bench_import,
+    "transaction_view": bench_transaction_view,
+    "models": bench_models,
+    "profiles": bench_profiles,
+    "money": bench_money,
+    "keys": bench_keys,
+    "categories": bench_categories,
+    "buckets": bench_buckets,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Budget App data layer benchmarks")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(unknown)}")
+    for name in args.names or BENCHMARKS:
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import pytest
+from controllers import MainController
+
+
+@pytest.fixture
+def make_controller(tmp_path):
+    """Opens controllers on databases in tmp_path; all are closed after the test, pass or fail."""
+    controllers = []
+
+    def make(name="budget.db", **kwargs):
+        controller = MainController(str(tmp_path / name), **kwargs)
+        controllers.append(controller)
+        return controller
+
+    yield make
+    for controller in controllers:
+        controller.close()
+
+
+@pytest.fixture
+def controller(make_controller):
+    """A controller on a fresh, fully migrated database."""
+    return make_controller()
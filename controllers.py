@@ -1,75 +1,221 @@
-import uuid
-from database import DatabaseManager
-from models import Account
+import sqlite3
+from contextlib import contextmanager
+import rollups
+from database import DatabaseManager, DB_NAME, DEFAULT_POOL_SIZE, DEFAULT_PROFILE
+from models import Money, Account, ACCOUNT_COLUMNS, Transaction, TRANSACTION_COLUMNS, TRANSACTION_SOURCE
+from date_range import DateRange
+from read_cache import ReadCache, cached, invalidates, ALL
+from events import (EventBus, publishes, AccountAdded, AccountUpdated, AccountDeleted,
+                    AccountBalanceChanged, TransactionAdded, TransactionUpdated, TransactionDeleted,
+                    TransactionsImported, TransactionsDeleted, RollupsRebuilt, CategoryCreated, CategoryDeleted,
+                    CategoryRenamed)
+
+ID_BATCH_SIZE = 500
+PAGE_SIZE = 200
+
+# Time buckets of aggregate(), as stored generated columns of transactions
+BUCKETS = {"day": "date", "day_of_month": "day", "week": "week", "month": "month", "year": "year"}
+# The same buckets on monthly_rollups, used for whole-month periods
+ROLLUP_BUCKETS = {"month": "month", "year": "CAST(substr(month, 1, 4) AS INTEGER)"}
+# Optional second grouping of aggregate(); NULLs match the rollup keys
+GROUPINGS = {"type": "COALESCE(type, '')", "account": "account_id", "category": "COALESCE(category_id, 0)"}
 
 class MainController:
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(self, db_name=DB_NAME, pool_size=DEFAULT_POOL_SIZE, profile=DEFAULT_PROFILE):
+        self.db = DatabaseManager(db_name, pool_size=pool_size, profile=profile)
+        # Results of read methods, dropped by the write methods below
+        self.cache = ReadCache()
+        # Change events for views; published after each committed write
+        self.events = EventBus()
+
+    def close(self):
+        """Releases the database connections held by this controller."""
+        self.db.close()
+
+    def cache_stats(self) -> dict:
+        """Hit/miss counters of the read cache."""
+        return self.cache.stats()
 
+    @cached("accounts")
     def get_all_accounts(self):
         """Retrieves all accounts from the database."""
-        accounts_data = self.db.fetch_all("SELECT * FROM accounts")
-        return [Account.from_dict(data) for data in accounts_data]
+        return self.db.fetch_all_as(Account, f"SELECT {ACCOUNT_COLUMNS} FROM accounts")
 
-    def add_account(self, name: str, balance: float) -> Account:
-        """Adds a new account to the database."""
-        new_id = uuid.uuid4().hex
-        if self.db.execute_query(
-            "INSERT INTO accounts (id, name, balance) VALUES (?, ?, ?)",
-            (new_id, name, balance)
-        ):
-            return Account(id=new_id, name=name, balance=balance)
+    @cached("accounts")
+    def get_account(self, account_id: int):
+        """Fetches a single account by id, or None."""
+        return self.db.fetch_one_as(Account, f"SELECT {ACCOUNT_COLUMNS} FROM accounts WHERE id = ?", (account_id,))
+
+    @publishes
+    @invalidates("accounts", "summary")
+    def add_account(self, name: str, balance: int) -> Account:
+        """Adds a new account to the database. The balance is in cents."""
+        balance = Money(balance)
+        new_id = self.db.insert(
+            "INSERT INTO accounts (name, balance) VALUES (?, ?)",
+            (name, balance)
+        )
+        if new_id is not None:
+            account = Account(id=new_id, name=name, balance=balance)
+            self.events.queue(AccountAdded(account))
+            return account
         return None
 
-    def update_account(self, account_id: str, name: str, balance: float) -> bool:
-        """Updates an existing account's details."""
-        return self.db.execute_query(
+    @publishes
+    @invalidates("accounts", "summary")
+    def update_account(self, account_id: int, name: str, balance: int) -> bool:
+        """Updates an existing account's details. The balance is in cents."""
+        balance = Money(balance)
+        if self.db.execute_query(
             "UPDATE accounts SET name = ?, balance = ? WHERE id = ?",
             (name, balance, account_id)
-        )
+        ):
+            self.events.queue(AccountUpdated(Account(id=account_id, name=name, balance=balance)))
+            return True
+        return False
 
-    def delete_account(self, account_id: str) -> bool:
-        """Deletes an account from the database."""
-        return self.db.execute_query(
-            "DELETE FROM accounts WHERE id = ?",
-            (account_id,)
-        )
+    @publishes
+    @invalidates(ALL)
+    def delete_account(self, account_id: int) -> bool:
+        """Deletes an account; its transactions go with it (ON DELETE CASCADE)."""
+        try:
+            with self.db.transaction() as conn:
+                count = conn.execute(
+                    "SELECT COUNT(*) FROM transactions WHERE account_id = ?", (account_id,)
+                ).fetchone()[0]
+                conn.execute("DELETE FROM accounts WHERE id = ?", (account_id,))
+                conn.execute("DELETE FROM monthly_rollups WHERE account_id = ?", (account_id,))
+        except sqlite3.Error as e:
+            print(f"Delete account error: {e}")
+            return False
+
+        self.events.queue(AccountDeleted(account_id))
+        if count:
+            self.events.queue(TransactionsDeleted(count, (account_id,)))
+        return True
 
     # --- Transaction Methods ---
 
-    def add_transaction(self, account_id: str, date: str, amount: float, category: str, type: str, note: str) -> bool:
-        """Adds a transaction and updates the account balance."""
-        new_id = uuid.uuid4().hex
-        
-        # Ensure category exists in DB
-        self.ensure_category_exists(category)
-        
-        # 1. Add Transaction
-        success = self.db.execute_query(
-            """INSERT INTO transactions (id, account_id, date, amount, category, type, note) 
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (new_id, account_id, date, amount, category, type, note)
-        )
-        
-        if success:
-            # 2. Update Account Balance
-            # Expense subtracts, Income adds
-            balance_adjustment = amount if type == "Income" else -amount
-            
-            # Get current balance
-            account = self.db.fetch_one("SELECT balance FROM accounts WHERE id = ?", (account_id,))
-            if account:
-                new_balance = account["balance"] + balance_adjustment
-                self.db.execute_query(
-                    "UPDATE accounts SET balance = ? WHERE id = ?", 
-                    (new_balance, account_id)
+    @staticmethod
+    def _balance_delta(type: str, amount: int) -> int:
+        """Income adds to an account balance, everything else subtracts."""
+        return amount if type == "Income" else -amount
+
+    @publishes
+    @invalidates(ALL)
+    def add_transaction(self, account_id: int, date: str, amount: int, category: str, type: str, note: str) -> bool:
+        """Adds a transaction and updates the account balance in one unit of work.
+
+        The amount is a positive number of cents; Money.parse() converts dollars.
+        """
+        amount = Money(amount)
+        category = (category or "").strip()
+        try:
+            with self.db.transaction() as conn:
+                category_id = self._category_id(category)
+                new_id = conn.execute(
+                    """INSERT INTO transactions (account_id, date, amount, category_id, type, note) 
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    (account_id, date, amount, category_id, type, note)
+                ).lastrowid
+                # Adjust in SQL so concurrent writers cannot overwrite each other's balance
+                conn.execute(
+                    "UPDATE accounts SET balance = balance + ? WHERE id = ?",
+                    (self._balance_delta(type, amount), account_id)
                 )
-            return True
-        return False
+                rollups.record(conn, date, account_id, category_id, type, amount)
+        except sqlite3.Error as e:
+            print(f"Add transaction error: {e}")
+            self.events.discard()  # A category created in the rolled back unit
+            return False
+
+        self.events.queue(
+            TransactionAdded(Transaction(new_id, account_id, date, amount, category, type, note)),
+            AccountBalanceChanged(account_id)
+        )
+        return True
+
+    @publishes
+    @invalidates(ALL)
+    def import_transactions(self, file_path: str, account_id: int) -> dict:
+        """Bulk imports a CSV/OFX bank export into the given account.
+
+        However many rows arrive, subscribers get one TransactionsImported
+        event plus one event per touched account and new category. Returns
+        None if the database rejects the import (e.g. an unknown account),
+        in which case nothing is imported.
+        """
+        from importer import TransactionImporter
+        try:
+            result = TransactionImporter(self.db).import_file(file_path, account_id)
+        except sqlite3.Error as e:
+            print(f"Import transactions error: {e}")
+            return None
+        changed = tuple(result["balance_changes"])
+        self.events.queue(
+            TransactionsImported(result["imported"], changed),
+            *(AccountBalanceChanged(acc_id) for acc_id in changed),
+            *(CategoryCreated(name) for name in result["new_categories"])
+        )
+        return result
+
+    @cached("transactions")
+    def get_transactions(self, account_id: int = None, month_str: str = None):
+        """Fetches transactions, optionally filtered by account and month (YYYY-MM).
+
+        month_str also accepts any period understood by DateRange.parse.
+        """
+        query, params = self._transactions_query(account_id, month_str)
+        query += " ORDER BY date DESC"
+        return self.db.fetch_all_as(Transaction, query, tuple(params))
+
+    def get_transactions_page(self, account_id: int = None, month_str: str = None,
+                              after: tuple = None, limit: int = PAGE_SIZE):
+        """Fetches one page of transactions, newest first, for lazy-loading views.
+
+        `after` is the (date, id) of the last row of the previous page. Paging
+        by key instead of OFFSET keeps every page as cheap as the first.
+        """
+        query, params = self._transactions_query(account_id, month_str)
+        if after:
+            last_date, last_id = after
+            query += " AND date <= ? AND (date < ? OR transactions.id < ?)"
+            params.extend([last_date, last_date, last_id])
+        query += " ORDER BY date DESC, transactions.id DESC LIMIT ?"
+        params.append(limit)
+        return self.db.fetch_all_as(Transaction, query, tuple(params))
 
-    def get_transactions(self, account_id: str = None, month_str: str = None):
-        """Fetches transactions, optionally filtered by account and month (YYYY-MM)."""
-        query = "SELECT * FROM transactions WHERE 1=1"
+    def iter_transactions(self, account_id: int = None, month_str: str = None, page_size: int = PAGE_SIZE):
+        """Yields matching transactions newest first, reading one keyset page at a time."""
+        after = None
+        while True:
+            page = self.get_transactions_page(account_id, month_str, after, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = (page[-1].date, page[-1].id)
+
+    @contextmanager
+    def transaction_cursor(self, account_id: int = None, month_str: str = None):
+        """Yields a cursor over matching transactions as plain tuples, oldest first.
+
+        Rows are read from SQLite as the cursor is iterated, without building
+        Transaction objects; the connection is held until the block exits.
+        """
+        query, params = self._transactions_query(account_id, month_str)
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query + " ORDER BY date, transactions.id", tuple(params))
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _transactions_query(account_id: int = None, month_str: str = None):
+        """Builds the filtered SELECT shared by the transaction list methods."""
+        query = f"SELECT {TRANSACTION_COLUMNS} FROM {TRANSACTION_SOURCE} WHERE 1=1"
         params = []
         
         if account_id:
@@ -77,34 +223,84 @@ class MainController:
             params.append(account_id)
         
         if month_str:
-            query += " AND date LIKE ?"
-            params.append(f"{month_str}%")
-        
-        query += " ORDER BY date DESC"
-        data = self.db.fetch_all(query, tuple(params))
-        from models import Transaction
-        return [Transaction.from_dict(row) for row in data]
+            clause, bounds = DateRange.parse(month_str).sql()
+            query += f" AND {clause}"
+            params.extend(bounds)
+        return query, params
 
-    def get_monthly_summary(self, month_str: str = None):
-        """Calculates Net Worth (current) and Income/Expenses for a specific month (YYYY-MM)."""
-        # 1. Net Worth: Current total sum of all account balances (independent of month)
-        net_worth_data = self.db.fetch_one("SELECT SUM(balance) as total FROM accounts")
-        net_worth = net_worth_data["total"] if net_worth_data and net_worth_data["total"] is not None else 0.0
+    @cached("transactions")
+    def get_transaction(self, transaction_id: int):
+        """Fetches a single transaction by id, or None."""
+        return self.db.fetch_one_as(Transaction,
+                                    f"SELECT {TRANSACTION_COLUMNS} FROM {TRANSACTION_SOURCE} WHERE transactions.id = ?",
+                                    (transaction_id,))
 
+    def get_transactions_by_ids(self, transaction_ids):
+        """Fetches transactions by id, in the order given. Unknown ids are skipped."""
+        ids = list(dict.fromkeys(transaction_ids))
+        found = {}
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(ids), ID_BATCH_SIZE):
+            chunk = ids[start:start + ID_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            query = f"SELECT {TRANSACTION_COLUMNS} FROM {TRANSACTION_SOURCE} WHERE transactions.id IN ({placeholders})"
+            for t in self.db.fetch_all_as(Transaction, query, tuple(chunk)):
+                found[t.id] = t
+        return [found[tid] for tid in ids if tid in found]
+
+    @staticmethod
+    def _aggregate_source(date_range: DateRange):
+        """Picks the table to aggregate a period from.
+
+        Whole-month periods read the monthly_rollups table; anything else falls
+        back to raw transactions. Returns (table, amount column, WHERE clause,
+        params).
+        """
+        if date_range.whole_months:
+            clause, bounds = date_range.month_sql()
+            return "monthly_rollups", "total", clause, bounds
+        clause, bounds = date_range.sql()
+        return "transactions", "amount", clause, bounds
+
+    @publishes
+    @invalidates("summary", "transactions")
+    def rebuild_rollups(self) -> bool:
+        """Recomputes the monthly_rollups table from all transactions."""
+        try:
+            with self.db.transaction() as conn:
+                rollups.rebuild(conn)
+            self.events.queue(RollupsRebuilt())
+            return True
+        except sqlite3.Error as e:
+            print(f"Rebuild rollups error: {e}")
+            return False
+
+    def get_monthly_summary(self, month_str: str = None):
+        """Calculates Net Worth (current) and Income/Expenses for a specific month (YYYY-MM) or period."""
         # Use current month if none provided
         if not month_str:
             from datetime import datetime
             month_str = datetime.now().strftime("%Y-%m")
+        return self._period_summary(month_str)
 
-        # 2. Monthly Income
-        income_query = "SELECT SUM(amount) as total FROM transactions WHERE type = 'Income' AND date LIKE ?"
-        income_data = self.db.fetch_one(income_query, (f"{month_str}%",))
-        income = income_data["total"] if income_data and income_data["total"] is not None else 0.0
+    @cached("summary")
+    def _period_summary(self, month_str):
+        source, amount, clause, bounds = self._aggregate_source(DateRange.parse(month_str))
 
-        # 3. Monthly Expenses
-        expense_query = "SELECT SUM(amount) as total FROM transactions WHERE type = 'Expense' AND date LIKE ?"
-        expense_data = self.db.fetch_one(expense_query, (f"{month_str}%",))
-        expense = expense_data["total"] if expense_data and expense_data["total"] is not None else 0.0
+        # One pass over the period's totals; Net Worth is the current
+        # total of all account balances (independent of month)
+        data = self.db.fetch_one(f"""
+            SELECT
+                (SELECT SUM(balance) FROM accounts) as net_worth,
+                SUM(CASE WHEN type = 'Income' THEN {amount} END) as income,
+                SUM(CASE WHEN type = 'Expense' THEN {amount} END) as expenses
+            FROM {source}
+            WHERE {clause}
+        """, bounds) or {}
+
+        net_worth = Money(data.get("net_worth") or 0)
+        income = Money(data.get("income") or 0)
+        expense = Money(data.get("expenses") or 0)
 
         return {
             "net_worth": net_worth,
@@ -113,142 +309,328 @@ class MainController:
             "net_income": income - expense
         }
 
+    @cached("summary")
+    def get_monthly_summaries(self, period) -> dict:
+        """Returns {YYYY-MM: {income, expenses, net_income}} for every month in a period.
+
+        All months are computed in a single grouped scan; months without
+        transactions are included with zero totals.
+        """
+        date_range = DateRange.parse(period)
+        totals = self.aggregate(date_range, bucket="month", by="type")
+
+        summaries = {}
+        for month in date_range.months():
+            by_type = totals.get(month, {})
+            income = by_type.get("Income", Money(0))
+            expense = by_type.get("Expense", Money(0))
+            summaries[month] = {"income": income, "expenses": expense, "net_income": income - expense}
+        return summaries
+
+    @cached("transactions")
+    def aggregate(self, period, bucket: str = "month", by: str = None, type: str = None) -> dict:
+        """Sums amounts per time bucket of a period in one grouped query.
+
+        `bucket` is a key of BUCKETS and `by` an optional key of GROUPINGS;
+        `type` keeps only "Income" or "Expense" rows. Returns
+        {bucket: Money}, or {bucket: {group: Money}} when `by` is given, in
+        bucket order. Categories are keyed by name. Month and year buckets of
+        whole-month periods are read from monthly_rollups.
+        """
+        if bucket not in BUCKETS:
+            raise ValueError(f"Unknown bucket: {bucket!r}")
+        if by is not None and by not in GROUPINGS:
+            raise ValueError(f"Unknown grouping: {by!r}")
+        date_range = DateRange.parse(period)
+        if date_range.whole_months and bucket in ROLLUP_BUCKETS:
+            source, amount, column = "monthly_rollups", "total", ROLLUP_BUCKETS[bucket]
+            clause, bounds = date_range.month_sql()
+        else:
+            source, amount, column = "transactions", "amount", BUCKETS[bucket]
+            clause, bounds = date_range.sql()
+        params = list(bounds)
+        if type:
+            clause += " AND type = ?"
+            params.append(type)
+
+        data = self.db.fetch_all(f"""
+            SELECT {column} as bucket, {GROUPINGS[by] if by else "NULL"} as grp, SUM({amount}) as total
+            FROM {source}
+            WHERE {clause}
+            GROUP BY 1, 2
+            ORDER BY 1
+        """, tuple(params))
+
+        names = self._category_names() if by == "category" else None
+        result = {}
+        for row in data:
+            total = Money(row["total"])
+            if by is None:
+                result[row["bucket"]] = total
+            else:
+                group = names.get(row["grp"], "") if names is not None else row["grp"]
+                result.setdefault(row["bucket"], {})[group] = total
+        return result
+
     def get_transaction_date_range(self):
         """Returns the first transaction month and the current month."""
         from datetime import datetime
         now = datetime.now()
         
-        first = self.db.fetch_one("SELECT MIN(date) as first_date FROM transactions")
-        if first and first["first_date"]:
-            first_date = datetime.strptime(first["first_date"], "%Y-%m-%d")
+        first = self._first_transaction_date()
+        if first:
+            first_date = datetime.strptime(first, "%Y-%m-%d")
         else:
             first_date = now
             
         return first_date, now
 
-    def update_transaction(self, transaction_id: str, data: dict) -> bool:
-        """Updates a transaction and corrects account balances."""
-        # 1. Get old transaction to revert balance
-        old_t = self.db.fetch_one("SELECT * FROM transactions WHERE id = ?", (transaction_id,))
-        if not old_t:
+    @cached("date_range")
+    def _first_transaction_date(self):
+        first = self.db.fetch_one("SELECT MIN(date) as first_date FROM transactions")
+        return first["first_date"] if first else None
+
+    @publishes
+    @invalidates(ALL)
+    def update_transaction(self, transaction_id: int, data: dict) -> bool:
+        """Updates a transaction and corrects account balances in one unit of work.
+
+        data["amount"] is in cents, like add_transaction.
+        """
+        data = dict(data, amount=Money(data["amount"]))
+        try:
+            with self.db.transaction() as conn:
+                # 1. Get old transaction to revert balance
+                old_t = conn.execute(f"SELECT {TRANSACTION_COLUMNS}, category_id FROM {TRANSACTION_SOURCE} "
+                                     "WHERE transactions.id = ?", (transaction_id,)).fetchone()
+                if not old_t:
+                    return False
+
+                # Ensure category exists in DB
+                category = (data.get("category") or "").strip()
+                category_id = self._category_id(category)
+
+                # 2. Update Transaction
+                conn.execute(
+                    """UPDATE transactions 
+                       SET account_id = ?, date = ?, amount = ?, category_id = ?, type = ?, note = ? 
+                       WHERE id = ?""",
+                    (data["account_id"], data["date"], data["amount"], 
+                     category_id, data["type"], data["note"], transaction_id)
+                )
+
+                # 3. Correct Balances: revert old, apply new
+                conn.execute("UPDATE accounts SET balance = balance + ? WHERE id = ?", 
+                             (-self._balance_delta(old_t["type"], old_t["amount"]), old_t["account_id"]))
+                conn.execute("UPDATE accounts SET balance = balance + ? WHERE id = ?", 
+                             (self._balance_delta(data["type"], data["amount"]), data["account_id"]))
+
+                # 4. Move the amount between rollup rows
+                rollups.record(conn, old_t["date"], old_t["account_id"], old_t["category_id"],
+                               old_t["type"], old_t["amount"], sign=-1)
+                rollups.record(conn, data["date"], data["account_id"], category_id,
+                               data["type"], data["amount"])
+        except sqlite3.Error as e:
+            print(f"Update transaction error: {e}")
+            self.events.discard()  # A category created in the rolled back unit
             return False
-        
-        old_amount = old_t["amount"]
-        old_type = old_t["type"]
-        old_account_id = old_t["account_id"]
-
-        # Ensure category exists in DB
-        if "category" in data:
-            self.ensure_category_exists(data["category"])
-
-        # 2. Update Transaction
-        success = self.db.execute_query(
-            """UPDATE transactions 
-               SET account_id = ?, date = ?, amount = ?, category = ?, type = ?, note = ? 
-               WHERE id = ?""",
-            (data["account_id"], data["date"], data["amount"], 
-             data["category"], data["type"], data["note"], transaction_id)
-        )
 
-        if success:
-            # 3. Correct Balances
-            # Revert old
-            old_adj = -old_amount if old_type == "Income" else old_amount
-            self.db.execute_query("UPDATE accounts SET balance = balance + ? WHERE id = ?", 
-                                (old_adj, old_account_id))
-            
-            # Apply new
-            new_adj = data["amount"] if data["type"] == "Income" else -data["amount"]
-            self.db.execute_query("UPDATE accounts SET balance = balance + ? WHERE id = ?", 
-                                (new_adj, data["account_id"]))
-            return True
-        return False
+        old = Transaction._make(tuple(old_t)[:len(Transaction._fields)])
+        new = Transaction(transaction_id, data["account_id"], data["date"], data["amount"],
+                          category, data["type"], data["note"])
+        self.events.queue(TransactionUpdated(old, new),
+                          *(AccountBalanceChanged(acc_id) for acc_id in dict.fromkeys((old.account_id, new.account_id))))
+        return True
 
-    def delete_transaction(self, transaction_id: str) -> bool:
-        """Deletes a transaction and reverts account balance."""
-        old_t = self.db.fetch_one("SELECT * FROM transactions WHERE id = ?", (transaction_id,))
-        if not old_t: return False
+    @publishes
+    @invalidates(ALL)
+    def delete_transaction(self, transaction_id: int) -> bool:
+        """Deletes a transaction and reverts account balance in one unit of work."""
+        try:
+            with self.db.transaction() as conn:
+                old_t = conn.execute(f"SELECT {TRANSACTION_COLUMNS}, category_id FROM {TRANSACTION_SOURCE} "
+                                     "WHERE transactions.id = ?", (transaction_id,)).fetchone()
+                if not old_t:
+                    return False
 
-        if self.db.execute_query("DELETE FROM transactions WHERE id = ?", (transaction_id,)):
-            adj = -old_t["amount"] if old_t["type"] == "Income" else old_t["amount"]
-            self.db.execute_query("UPDATE accounts SET balance = balance + ? WHERE id = ?", 
-                                (adj, old_t["account_id"]))
-            return True
-        return False
+                conn.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
+                conn.execute("UPDATE accounts SET balance = balance + ? WHERE id = ?", 
+                             (-self._balance_delta(old_t["type"], old_t["amount"]), old_t["account_id"]))
+                rollups.record(conn, old_t["date"], old_t["account_id"], old_t["category_id"],
+                               old_t["type"], old_t["amount"], sign=-1)
+        except sqlite3.Error as e:
+            print(f"Delete transaction error: {e}")
+            return False
+
+        self.events.queue(TransactionDeleted(Transaction._make(tuple(old_t)[:len(Transaction._fields)])),
+                          AccountBalanceChanged(old_t["account_id"]))
+        return True
 
+    @cached("transactions")
     def get_transactions_for_day(self, date_str: str):
         """Fetches all transactions for a specific YYYY-MM-DD."""
-        query = "SELECT * FROM transactions WHERE date = ? ORDER BY type DESC"
-        data = self.db.fetch_all(query, (date_str,))
-        from models import Transaction
-        return [Transaction.from_dict(row) for row in data]
+        query = f"SELECT {TRANSACTION_COLUMNS} FROM {TRANSACTION_SOURCE} WHERE date = ? ORDER BY type DESC"
+        return self.db.fetch_all_as(Transaction, query, (date_str,))
 
     def get_daily_transaction_summary(self, month_str: str):
         """Returns a dict mapping days of the month to their transaction types (Income/Expense)."""
-        query = "SELECT date, type FROM transactions WHERE date LIKE ?"
-        data = self.db.fetch_all(query, (f"{month_str}%",))
-        
-        summary = {} # { day_int: {has_income: bool, has_expense: bool} }
-        for row in data:
-            try:
-                day = int(row["date"].split("-")[2])
-            except (IndexError, ValueError):
-                continue
-                
-            if day not in summary:
-                summary[day] = {"has_income": False, "has_expense": False}
-            
-            if row["type"] == "Income":
-                summary[day]["has_income"] = True
-            else:
-                summary[day]["has_expense"] = True
-        return summary
+        by_day = self.aggregate(DateRange.month(month_str), bucket="day_of_month", by="type")
+        # { day_int: {has_income: bool, has_expense: bool} }
+        return {day: {"has_income": "Income" in types, "has_expense": any(t != "Income" for t in types)}
+                for day, types in by_day.items()}
+
+    @cached("categories")
+    def _category_ids(self) -> dict:
+        """{name: id} of the categories offered to the user (not hidden)."""
+        data = self.db.fetch_all("SELECT id, name FROM categories WHERE hidden = 0")
+        return {row["name"]: row["id"] for row in data}
+
+    @cached("categories")
+    def _category_names(self) -> dict:
+        """{id: name} of every category, hidden ones included, for labelling history."""
+        data = self.db.fetch_all("SELECT id, name FROM categories")
+        return {row["id"]: row["name"] for row in data}
+
+    def _category_id(self, name: str):
+        """Id of a category name, creating the category if needed; None for no category."""
+        name = (name or "").strip()
+        if not name:
+            return None
+        category_id = self._category_ids().get(name)
+        if category_id is None:
+            self.ensure_category_exists(name)
+            category_id = self._category_ids().get(name)
+        return category_id
 
     def get_unique_categories(self):
-        """Fetches distinct categories from the categories table."""
-        data = self.db.fetch_all("SELECT name FROM categories ORDER BY name ASC")
-        return [row["name"] for row in data]
+        """Names of the categories offered to the user, from the cached name dict."""
+        return sorted(self._category_ids())
 
-    def ensure_category_exists(self, category_name: str):
-        """Checks if a category exists, if not, adds it to the database."""
+    @publishes
+    @invalidates("categories")
+    def ensure_category_exists(self, category_name: str) -> bool:
+        """Checks if a category exists, if not, adds it to the database.
+
+        A hidden (deleted) category of the same name is shown again.
+        Returns True when a new category was created.
+        """
         if not category_name:
-            return
+            return False
         
         # Trim whitespace
         category_name = category_name.strip()
         if not category_name:
-            return
+            return False
 
-        exists = self.db.fetch_one("SELECT id FROM categories WHERE name = ?", (category_name,))
-        if not exists:
-            new_id = uuid.uuid4().hex
-            self.db.execute_query("INSERT INTO categories (id, name) VALUES (?, ?)", (new_id, category_name))
+        # The cached name dict answers the common "already exists" case
+        # without touching the database
+        if category_name in self._category_ids():
+            return False
+
+        # Name is UNIQUE, so a single statement checks and inserts atomically
+        if self.db.execute_query(
+            "INSERT INTO categories (name) VALUES (?) ON CONFLICT (name) DO UPDATE SET hidden = 0",
+            (category_name,)
+        ):
+            self.events.queue(CategoryCreated(category_name))
+            return True
+        return False
 
+    @publishes
+    @invalidates("categories")
     def delete_category(self, name: str) -> bool:
-        """Deletes a category from the database."""
-        return self.db.execute_query("DELETE FROM categories WHERE name = ?", (name,))
+        """Removes a category from the pickers.
+
+        Transactions keep referencing it by id, so the row is hidden
+        rather than deleted and their category is still shown.
+        """
+        if self.db.execute_query("UPDATE categories SET hidden = 1 WHERE name = ?", (name,)):
+            self.events.queue(CategoryDeleted(name))
+            return True
+        return False
 
+    @publishes
+    @invalidates(ALL)
+    def rename_category(self, old_name: str, new_name: str) -> bool:
+        """Renames a category; every transaction in it follows, as it refers to the id."""
+        new_name = (new_name or "").strip()
+        if not new_name or new_name == old_name:
+            return False
+        try:
+            with self.db.transaction() as conn:
+                renamed = conn.execute("UPDATE categories SET name = ?, hidden = 0 WHERE name = ?",
+                                       (new_name, old_name)).rowcount
+        except sqlite3.Error as e:
+            print(f"Rename category error: {e}")
+            return False
+        if not renamed:
+            return False  # No such category
+        self.events.queue(CategoryRenamed(old_name, new_name))
+        return True
+
+    @cached("transactions")
     def get_category_spending(self, month_str: str):
-        """Returns a dict of {category: total_amount} for expenses in a given month."""
-        query = """
-            SELECT category, SUM(amount) as total 
-            FROM transactions 
-            WHERE type = 'Expense' AND date LIKE ? 
-            GROUP BY category
+        """Returns a dict of {category: total_amount} for expenses in a given month or period."""
+        source, amount, clause, bounds = self._aggregate_source(DateRange.parse(month_str))
+        query = f"""
+            SELECT category_id, SUM({amount}) as total 
+            FROM {source} 
+            WHERE type = 'Expense' AND {clause} 
+            GROUP BY category_id
+        """
+        data = self.db.fetch_all(query, bounds)
+        names = self._category_names()
+        return {names.get(row["category_id"], ""): Money(row["total"]) for row in data if row["total"] is not None}
+
+    def get_monthly_category_spending(self, period) -> dict:
+        """Returns {YYYY-MM: {category: total}} of expenses for every month in a period, in one grouped scan."""
+        date_range = DateRange.parse(period)
+        totals = self.aggregate(date_range, bucket="month", by="category", type="Expense")
+        return {month: dict(totals.get(month, {})) for month in date_range.months()}
+
+    def get_range_report_data(self, period):
+        """Aggregates a multi-month report (quarter, year or any span).
+
+        Totals, per-month summaries, per-month category spending and the same
+        months a year earlier each come from one grouped query, however many
+        months the period covers. Each month's transaction log is a generator
+        that reads keyset pages as the report is laid out.
         """
-        data = self.db.fetch_all(query, (f"{month_str}%",))
-        return {row["category"]: row["total"] for row in data if row["total"] is not None}
+        date_range = DateRange.parse(period)
+        months = date_range.months()
+        summaries = self.get_monthly_summaries(date_range)
+        spending = self.get_monthly_category_spending(date_range)
+        previous = self.get_monthly_summaries(date_range.shift_years(-1))
+
+        categories = {}
+        for month_spending in spending.values():
+            for cat, total in month_spending.items():
+                categories[cat] = categories.get(cat, Money(0)) + total
+
+        return {
+            "period": str(period),
+            "summary": self._period_summary(date_range),
+            "categories": categories,
+            "months": {
+                m: {"summary": summaries[m], "categories": spending[m], "transactions": self.iter_transactions(month_str=m)}
+                for m in months
+            },
+            # Keyed by the month it is compared with
+            "previous_year": dict(zip(months, previous.values())),
+            "accounts": self.get_all_accounts()
+        }
 
     def get_report_data(self, month_str: str):
-        """Aggregates all data needed for a monthly report."""
-        print(f"DEBUG: Aggregating report data for {month_str}")
+        """Aggregates all data needed for a monthly report.
+
+        "transactions" is a generator of keyset pages, so the log is never
+        held in memory as one list.
+        """
         summary = self.get_monthly_summary(month_str)
         categories = self.get_category_spending(month_str)
-        transactions = self.get_transactions(month_str=month_str)
+        transactions = self.iter_transactions(month_str=month_str)
         accounts = self.get_all_accounts()
-        
-        print(f"DEBUG: Found {len(transactions)} transactions and {len(categories)} categories for {month_str}")
-        
+
         return {
             "month": month_str,
             "summary": summary,
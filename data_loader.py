@@ -0,0 +1,101 @@
+import itertools
+import traceback
+from PySide2.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+# Each worker holds a pooled DB connection while it runs; size the
+# controller's pool for these plus every other background thread
+LOADER_THREADS = 3
+
+
+class _LoaderSignals(QObject):
+    # key, request id, result / error message
+    finished = Signal(str, int, object)
+    failed = Signal(str, int, str)
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, key, request_id, func, args, signals):
+        super().__init__()
+        self.key = key
+        self.request_id = request_id
+        self.func = func
+        self.args = args
+        self.signals = signals
+        # DataLoader keeps the Python reference; Qt must not delete the task
+        # behind its back while it may still be passed to tryTake()
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(self.key, self.request_id, str(e))
+            return
+        self.signals.finished.emit(self.key, self.request_id, result)
+
+
+class DataLoader(QObject):
+    """Runs controller queries on a worker pool and hands results back on the GUI thread.
+
+    Requests are grouped by a key such as "month_summary". Only the newest
+    request per key is delivered: starting a new one cancels any queued
+    older request and drops the result of one that is already running, so
+    clicking quickly through month tabs only paints the last month.
+
+    The controller's connection pool must have a connection for each of
+    the max_threads workers on top of the GUI thread's own.
+    """
+
+    def __init__(self, parent=None, max_threads: int = None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads or LOADER_THREADS)
+        self._ids = itertools.count(1)
+        self._pending = {}  # key -> (request id, task, on_result, on_error)
+        self._signals = _LoaderSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+
+    def request(self, key: str, func, *args, on_result, on_error=None) -> int:
+        """Runs func(*args) in the background and calls on_result(result) when done."""
+        self.cancel(key)
+        request_id = next(self._ids)
+        task = _LoadTask(key, request_id, func, args, self._signals)
+        self._pending[key] = (request_id, task, on_result, on_error)
+        self.pool.start(task)
+        return request_id
+
+    def cancel(self, key: str):
+        """Forgets the pending request for key; a queued task is not started at all."""
+        pending = self._pending.pop(key, None)
+        if pending:
+            self.pool.tryTake(pending[1])
+
+    def is_loading(self, key: str) -> bool:
+        return key in self._pending
+
+    def shutdown(self, timeout_ms: int = 3000):
+        """Drops queued work and waits for running queries to finish."""
+        self._pending.clear()
+        self.pool.clear()
+        self.pool.waitForDone(timeout_ms)
+
+    def _take(self, key, request_id):
+        pending = self._pending.get(key)
+        if not pending or pending[0] != request_id:
+            return None  # Superseded or cancelled
+        del self._pending[key]
+        return pending
+
+    @Slot(str, int, object)
+    def _on_finished(self, key, request_id, result):
+        pending = self._take(key, request_id)
+        if pending:
+            pending[2](result)
+
+    @Slot(str, int, str)
+    def _on_failed(self, key, request_id, message):
+        pending = self._take(key, request_id)
+        if pending and pending[3]:
+            pending[3](message)
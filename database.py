@@ -1,121 +1,377 @@
 import sqlite3
 import os
-import uuid
+import queue
+import threading
+from contextlib import contextmanager
+from urllib.request import pathname2url
+from migrations import migrate, get_version, LATEST_VERSION
 
 # Get the directory where database.py is located
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_NAME = os.path.join(BASE_DIR, "budget.db")
 
+# Number of long-lived connections kept open per database. 0 disables pooling
+# and falls back to opening a fresh connection for every query.
+DEFAULT_POOL_SIZE = 4
+POOL_TIMEOUT = 5.0
+
+# Connection settings by profile name, applied as PRAGMAs in this order each
+# time a connection opens. "read_only" is not a PRAGMA: it opens the file
+# with mode=ro, so every write fails and schema migrations are not run.
+# journal_mode=WAL is persistent in the file and lets readers run alongside
+# a writer; synchronous=NORMAL is durable except for the last commits before
+# a power loss in WAL mode, which is the usual desktop trade-off.
+PROFILES = {
+    # Interactive app: safe commits, modest memory use
+    "desktop": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16_000,        # KiB (negative) -> ~16 MB page cache
+        "mmap_size": 64 * 2**20,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+    # Imports and rebuilds: no fsync at all, large caches. A crash or power
+    # loss during the load can lose or corrupt it, so only use it for data
+    # that can be imported again.
+    "bulk-load": {
+        "busy_timeout": 30_000,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -128_000,
+        "mmap_size": 256 * 2**20,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+    # Report exports: read-only connections with large caches for the
+    # aggregate queries; the database must already be migrated.
+    "reporting": {
+        "read_only": True,
+        "busy_timeout": 5000,
+        "cache_size": -64_000,
+        "mmap_size": 256 * 2**20,
+        "temp_store": "MEMORY",
+        "query_only": "ON",
+    },
+}
+DEFAULT_PROFILE = "desktop"
+
+
+def get_profile(profile) -> dict:
+    """Resolves a profile name; a dict is taken as the settings themselves."""
+    if isinstance(profile, dict):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown database profile: {profile} (choose from {', '.join(PROFILES)})") from None
+
+
+def open_connection(db_name, profile=DEFAULT_PROFILE):
+    """Opens a new SQLite connection with rows accessible by column name.
+
+    The PRAGMAs of `profile` (see PROFILES) are applied before it is returned.
+    """
+    settings = get_profile(profile)
+    if settings.get("read_only"):
+        conn = sqlite3.connect(f"file:{pathname2url(os.path.abspath(db_name))}?mode=ro",
+                               uri=True, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(db_name, check_same_thread=False)
+    try:
+        for pragma, value in settings.items():
+            if pragma != "read_only":
+                # PRAGMA arguments cannot be bound parameters; values come from PROFILES
+                conn.execute(f"PRAGMA {pragma} = {value}")
+    except sqlite3.Error:
+        conn.close()
+        raise
+    conn.row_factory = sqlite3.Row  # Access columns by name
+    return conn
+
+
+class ConnectionPool:
+    """Keeps a bounded set of open SQLite connections.
+
+    A thread checks out one connection and keeps it for any nested calls until
+    its outermost block finishes, so a single controller operation never opens
+    more than one connection. When all connections are checked out, callers
+    wait up to `timeout` seconds for one to be returned.
+    """
+
+    def __init__(self, db_name, pool_size=DEFAULT_POOL_SIZE, timeout=POOL_TIMEOUT, profile=DEFAULT_PROFILE):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.db_name = db_name
+        self.profile = profile
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._closed = False
+
+    @property
+    def opened(self):
+        """Total number of connections this pool has opened."""
+        return self._opened
+
+    def _acquire(self):
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed")
+        if not self._slots.acquire(timeout=self.timeout):
+            raise sqlite3.OperationalError("Timed out waiting for a pooled connection")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            conn = open_connection(self.db_name, self.profile)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._opened += 1
+        return conn
+
+    def _release(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            if self._closed:
+                conn.close()
+            else:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Yields the calling thread's connection, checking one out if needed."""
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is not None:
+            local.depth += 1
+            try:
+                yield conn
+            finally:
+                local.depth -= 1
+            return
+
+        conn = self._acquire()
+        local.conn = conn
+        local.depth = 1
+        try:
+            yield conn
+        finally:
+            local.conn = None
+            local.depth = 0
+            self._release(conn)
+
+    def close(self):
+        """Closes idle connections; checked-out ones close when returned."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+
 class DatabaseManager:
-    def __init__(self, db_name=DB_NAME):
+    def __init__(self, db_name=DB_NAME, pool_size=DEFAULT_POOL_SIZE, profile=DEFAULT_PROFILE):
         self.db_name = db_name
+        self.profile = profile
+        self.read_only = bool(get_profile(profile).get("read_only"))
+        self.pool = ConnectionPool(db_name, pool_size, profile=profile) if pool_size else None
+        self._local = threading.local()  # Per-thread unit of work state
         self.initialize_db()
 
+    @property
+    def read_failures(self) -> int:
+        """How many fetch_* calls on this thread have failed and returned an empty result.
+
+        Compare the value before and after a read to tell an empty result
+        from a failed one, e.g. so it is not cached.
+        """
+        return getattr(self._local, "read_failures", 0)
+
+    def _read_failed(self, message, error):
+        print(f"{message}: {error}")
+        self._local.read_failures = self.read_failures + 1
+
     def get_connection(self):
-        """Returns a connection to the SQLite database."""
+        """Returns a new, unpooled connection to the SQLite database."""
         try:
-            conn = sqlite3.connect(self.db_name)
-            conn.row_factory = sqlite3.Row  # Access columns by name
-            return conn
+            return open_connection(self.db_name, self.profile)
         except sqlite3.Error as e:
             print(f"Error connecting to database: {e}")
             return None
 
+    @contextmanager
+    def connection(self):
+        """Yields a connection from the pool, or a short-lived one if pooling is off."""
+        unit_conn = getattr(self._local, "conn", None)
+        if unit_conn is not None:
+            yield unit_conn
+            return
+
+        if self.pool:
+            with self.pool.connection() as conn:
+                yield conn
+            return
+
+        conn = open_connection(self.db_name, self.profile)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def in_transaction(self):
+        """True while the calling thread is inside a `transaction()` block."""
+        return getattr(self._local, "conn", None) is not None
+
+    @contextmanager
+    def transaction(self):
+        """Runs the enclosed statements as one unit of work.
+
+        Everything executed through the yielded connection, or through
+        execute_query/fetch_* on this thread, shares a single
+        BEGIN IMMEDIATE ... COMMIT. Any exception rolls the whole unit back
+        and is re-raised. Nested blocks join the outer unit.
+        """
+        if self.in_transaction():
+            yield self._local.conn
+            return
+
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._local.conn = conn
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._local.conn = None
+
+    def close(self):
+        """Closes all pooled connections. Safe to call more than once."""
+        if self.pool:
+            self.pool.close()
+
     def initialize_db(self):
-        """Creates tables if they do not exist."""
+        """Creates tables if they do not exist and applies pending schema migrations.
+
+        Read-only profiles cannot migrate; they only report an outdated schema.
+        """
         conn = self.get_connection()
         if conn:
             try:
-                cursor = conn.cursor()
-                # Create Accounts Table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS accounts (
-                        id TEXT PRIMARY KEY,
-                        name TEXT NOT NULL,
-                        balance REAL DEFAULT 0.0
-                    )
-                """)
-                
-                # Create Transactions Table (Planned for Phase 3, but good to have prepared)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS transactions (
-                        id TEXT PRIMARY KEY,
-                        account_id TEXT NOT NULL,
-                        date TEXT NOT NULL,
-                        amount REAL NOT NULL,
-                        category TEXT,
-                        type TEXT,
-                        note TEXT,
-                        FOREIGN KEY (account_id) REFERENCES accounts (id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Create Categories Table
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS categories (
-                        id TEXT PRIMARY KEY,
-                        name TEXT NOT NULL UNIQUE
-                    )
-                """)
-
-                # Seed Default Categories if empty
-                cursor.execute("SELECT COUNT(*) as count FROM categories")
-                if cursor.fetchone()["count"] == 0:
-                    import uuid
-                    defaults = ["Food", "Rent", "Salary", "Entertainment", "Transport", "Shopping", "Utilities", "Health"]
-                    for cat in defaults:
-                        cursor.execute("INSERT INTO categories (id, name) VALUES (?, ?)", (uuid.uuid4().hex, cat))
-                
-                conn.commit()
+                if self.read_only:
+                    version = get_version(conn)
+                    if version != LATEST_VERSION:
+                        print(f"Database schema version {version} does not match this app "
+                              f"({LATEST_VERSION}); open it read-write once to migrate")
+                    return
+                applied = migrate(conn)
+                if applied:
+                    print(f"Applied schema migrations: {applied}")
             except sqlite3.Error as e:
                 print(f"Database initialization error: {e}")
             finally:
                 conn.close()
 
     def execute_query(self, query, params=()):
-        """Executes a query (INSERT, UPDATE, DELETE) and commits changes."""
-        conn = self.get_connection()
-        if conn:
-            try:
+        """Executes a query (INSERT, UPDATE, DELETE) and commits changes.
+
+        Inside a `transaction()` block the commit is left to the unit of work
+        and errors are re-raised so the whole unit rolls back.
+        """
+        if self.in_transaction():
+            self._local.conn.execute(query, params)
+            return True
+
+        try:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(query, params)
                 conn.commit()
                 return True
-            except sqlite3.Error as e:
-                print(f"Query execution error: {e}")
-                return False
-            finally:
-                conn.close()
-        return False
+        except sqlite3.Error as e:
+            print(f"Query execution error: {e}")
+            return False
+
+    def insert(self, query, params=()):
+        """Executes an INSERT like execute_query and returns the new row id, or None on error."""
+        if self.in_transaction():
+            return self._local.conn.execute(query, params).lastrowid
+
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                conn.commit()
+                return cursor.lastrowid
+        except sqlite3.Error as e:
+            print(f"Query execution error: {e}")
+            return None
 
     def fetch_all(self, query, params=()):
         """Fetches all results from a SELECT query."""
-        conn = self.get_connection()
         results = []
-        if conn:
-            try:
+        try:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(query, params)
                 results = [dict(row) for row in cursor.fetchall()]
-            except sqlite3.Error as e:
-                print(f"Fetch error: {e}")
-            finally:
-                conn.close()
+        except sqlite3.Error as e:
+            self._read_failed("Fetch error", e)
         return results
 
     def fetch_one(self, query, params=()):
         """Fetches a single result from a SELECT query."""
-        conn = self.get_connection()
         result = None
-        if conn:
-            try:
+        try:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(query, params)
                 row = cursor.fetchone()
                 if row:
                     result = dict(row)
-            except sqlite3.Error as e:
-                print(f"Fetch one error: {e}")
-            finally:
-                conn.close()
+        except sqlite3.Error as e:
+            self._read_failed("Fetch one error", e)
         return result
+
+    def fetch_all_as(self, model, query, params=()):
+        """Like fetch_all, but builds model._make(row) straight from each cursor tuple.
+
+        The SELECT must list the model's columns in field order.
+        """
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(query, params)
+                return list(map(model._make, cursor.fetchall()))
+        except sqlite3.Error as e:
+            self._read_failed("Fetch error", e)
+        return []
+
+    def fetch_one_as(self, model, query, params=()):
+        """Like fetch_one, but returns model._make(row) or None."""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(query, params)
+                row = cursor.fetchone()
+                return model._make(row) if row else None
+        except sqlite3.Error as e:
+            self._read_failed("Fetch one error", e)
+        return None
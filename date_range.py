@@ -0,0 +1,126 @@
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+MONTH_RE = re.compile(r"^(\d{4})-(\d{2})$")
+QUARTER_RE = re.compile(r"^(\d{4})-Q([1-4])$", re.IGNORECASE)
+YEAR_RE = re.compile(r"^(\d{4})$")
+SPAN_SEPARATOR = ".."
+
+
+def _add_months(d: date, months: int) -> date:
+    total = d.year * 12 + (d.month - 1) + months
+    return date(total // 12, total % 12 + 1, 1)
+
+
+def _add_years(d: date, years: int) -> date:
+    try:
+        return d.replace(year=d.year + years)
+    except ValueError:  # Feb 29 in a non-leap year
+        return d.replace(year=d.year + years, day=28)
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """A half-open span of days, [start, end).
+
+    Transaction dates are stored as YYYY-MM-DD text, which sorts the same way
+    as the dates themselves, so a range becomes `date >= ? AND date < ?` and
+    can be answered from the date indexes instead of a `LIKE` scan.
+    """
+    start: date
+    end: date
+
+    @staticmethod
+    def month(month_str: str) -> "DateRange":
+        """The calendar month for a YYYY-MM string."""
+        start = datetime.strptime(month_str, "%Y-%m").date()
+        return DateRange(start, _add_months(start, 1))
+
+    @staticmethod
+    def quarter(year: int, quarter: int) -> "DateRange":
+        if not 1 <= quarter <= 4:
+            raise ValueError(f"Quarter must be 1-4, got {quarter}")
+        start = date(year, (quarter - 1) * 3 + 1, 1)
+        return DateRange(start, _add_months(start, 3))
+
+    @staticmethod
+    def year(year: int) -> "DateRange":
+        return DateRange(date(year, 1, 1), date(year + 1, 1, 1))
+
+    @staticmethod
+    def months_between(first_month: str, last_month: str) -> "DateRange":
+        """Every month from first_month to last_month inclusive (YYYY-MM)."""
+        return DateRange(DateRange.month(first_month).start, DateRange.month(last_month).end)
+
+    @staticmethod
+    def days(first_day: str, last_day: str) -> "DateRange":
+        """A custom span from first_day to last_day inclusive (YYYY-MM-DD)."""
+        start = datetime.strptime(first_day, "%Y-%m-%d").date()
+        last = datetime.strptime(last_day, "%Y-%m-%d").date()
+        if last < start:
+            raise ValueError(f"Range ends before it starts: {first_day}..{last_day}")
+        return DateRange(start, last + timedelta(days=1))
+
+    @staticmethod
+    def parse(value) -> "DateRange":
+        """Builds a range from "YYYY-MM", "YYYY-Qn", "YYYY" or "YYYY-MM-DD..YYYY-MM-DD".
+
+        DateRange instances are returned unchanged.
+        """
+        if isinstance(value, DateRange):
+            return value
+        value = value.strip()
+        if SPAN_SEPARATOR in value:
+            first, last = (part.strip() for part in value.split(SPAN_SEPARATOR, 1))
+            if MONTH_RE.match(first) and MONTH_RE.match(last):
+                return DateRange.months_between(first, last)
+            return DateRange.days(first, last)
+        if MONTH_RE.match(value):
+            return DateRange.month(value)
+        match = QUARTER_RE.match(value)
+        if match:
+            return DateRange.quarter(int(match.group(1)), int(match.group(2)))
+        if YEAR_RE.match(value):
+            return DateRange.year(int(value))
+        raise ValueError(f"Unrecognised period: {value!r}")
+
+    @property
+    def bounds(self):
+        """(start, end) as YYYY-MM-DD strings, end exclusive."""
+        return self.start.isoformat(), self.end.isoformat()
+
+    @property
+    def whole_months(self) -> bool:
+        """True when the range starts and ends on month boundaries."""
+        return self.start.day == 1 and self.end.day == 1
+
+    @property
+    def month_bounds(self):
+        """(first month, end month) as YYYY-MM strings, end exclusive."""
+        return self.start.strftime("%Y-%m"), self.end.strftime("%Y-%m")
+
+    def shift_years(self, years: int) -> "DateRange":
+        """The same span moved by whole years, e.g. -1 for year-over-year comparisons."""
+        return DateRange(_add_years(self.start, years), _add_years(self.end, years))
+
+    def sql(self, column: str = "date"):
+        """Returns a sargable WHERE fragment and its parameters."""
+        return f"{column} >= ? AND {column} < ?", self.bounds
+
+    def month_sql(self, column: str = "month"):
+        """Like sql(), but against a YYYY-MM column. Only valid for whole_months ranges."""
+        return f"{column} >= ? AND {column} < ?", self.month_bounds
+
+    def months(self):
+        """YYYY-MM keys of every month the range touches, in order."""
+        keys = []
+        current = date(self.start.year, self.start.month, 1)
+        while current < self.end:
+            keys.append(current.strftime("%Y-%m"))
+            current = _add_months(current, 1)
+        return keys
+
+    def __contains__(self, day: str) -> bool:
+        start, end = self.bounds
+        return start <= day < end
@@ -0,0 +1,45 @@
+from PySide2.QtCore import QObject, QTimer, Signal, Slot
+
+
+class EventHub(QObject):
+    """Re-publishes controller change events on the GUI thread, one batch per event-loop tick.
+
+    Events may be published from any thread (e.g. a background import);
+    they are queued to the hub's thread and collected until control returns
+    to the event loop, then emitted together through `changed`. A burst of
+    writes therefore costs views a single refresh.
+    """
+    # List of ChangeEvent objects, in publishing order
+    changed = Signal(object)
+    _received = Signal(object)
+
+    def __init__(self, bus, parent=None):
+        super().__init__(parent)
+        self.bus = bus
+        self._batch = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._flush)
+        # Emitting from a worker thread makes this a queued call
+        self._received.connect(self._enqueue)
+        self._forward = self._received.emit
+        bus.subscribe(self._forward)
+
+    def close(self):
+        """Stops listening to the bus and drops undelivered events."""
+        self.bus.unsubscribe(self._forward)
+        self._timer.stop()
+        self._batch = []
+
+    @Slot(object)
+    def _enqueue(self, event):
+        self._batch.append(event)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @Slot()
+    def _flush(self):
+        batch, self._batch = self._batch, []
+        if batch:
+            self.changed.emit(batch)
@@ -0,0 +1,160 @@
+import functools
+import threading
+import traceback
+from dataclasses import dataclass, field
+from typing import Tuple
+
+
+class ChangeEvent:
+    """Base class of every change event."""
+
+
+class AccountEvent(ChangeEvent):
+    """Something about an account (name, balance, existence) changed."""
+
+
+class TransactionEvent(ChangeEvent):
+    """Transaction rows, and therefore summaries and charts, changed."""
+
+
+class CategoryEvent(ChangeEvent):
+    """The categories table changed."""
+
+
+@dataclass(frozen=True)
+class AccountAdded(AccountEvent):
+    account: object
+
+
+@dataclass(frozen=True)
+class AccountUpdated(AccountEvent):
+    account: object
+
+
+@dataclass(frozen=True)
+class AccountDeleted(AccountEvent):
+    account_id: int
+
+
+@dataclass(frozen=True)
+class AccountBalanceChanged(AccountEvent):
+    account_id: int
+
+
+@dataclass(frozen=True)
+class TransactionAdded(TransactionEvent):
+    transaction: object
+
+
+@dataclass(frozen=True)
+class TransactionUpdated(TransactionEvent):
+    old: object
+    new: object
+
+
+@dataclass(frozen=True)
+class TransactionDeleted(TransactionEvent):
+    transaction: object
+
+
+@dataclass(frozen=True)
+class TransactionsImported(TransactionEvent):
+    count: int
+    account_ids: Tuple[int, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True)
+class TransactionsDeleted(TransactionEvent):
+    """Transactions removed together with their account."""
+    count: int
+    account_ids: Tuple[int, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True)
+class RollupsRebuilt(TransactionEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class CategoryCreated(CategoryEvent):
+    name: str
+
+
+@dataclass(frozen=True)
+class CategoryDeleted(CategoryEvent):
+    name: str
+
+
+@dataclass(frozen=True)
+class CategoryRenamed(CategoryEvent):
+    old_name: str
+    new_name: str
+
+
+class EventBus:
+    """Synchronous publish/subscribe for change events.
+
+    Callbacks run on the publishing thread; a failing subscriber is
+    reported and does not stop delivery to the others. Writers queue()
+    events while they work and flush() them once their changes are
+    committed; the queue is per thread.
+    """
+
+    def __init__(self):
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def subscribe(self, callback, event_type=ChangeEvent):
+        """Calls callback(event) for every published event of event_type."""
+        with self._lock:
+            self._subscribers.append((callback, event_type))
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = [(cb, t) for cb, t in self._subscribers if cb != callback]
+
+    def publish(self, *events):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for callback, event_type in subscribers:
+                if isinstance(event, event_type):
+                    try:
+                        callback(event)
+                    except Exception:
+                        traceback.print_exc()
+
+    def queue(self, *events):
+        """Holds events on this thread until the next flush()."""
+        if not hasattr(self._local, "events"):
+            self._local.events = []
+        self._local.events.extend(events)
+
+    def discard(self):
+        """Drops the events queued on this thread, e.g. after a rollback."""
+        self._local.events = []
+
+    def flush(self):
+        """Publishes and clears the events queued on this thread."""
+        events = getattr(self._local, "events", None)
+        if events:
+            self._local.events = []
+            self.publish(*events)
+
+
+def publishes(method):
+    """Flushes self.events after a controller write method, once no unit of work is open.
+
+    Stack it above @invalidates so subscribers never read stale cached data.
+    Writes nested in another write's transaction leave publishing to the
+    outer one, after its commit.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            if not self.db.in_transaction():
+                self.events.flush()
+    return wrapper
@@ -0,0 +1,90 @@
+import os
+import time
+from contextlib import contextmanager
+from report_html import REPORT_CSS
+
+# Set to 1/true/yes/on to write a .debug.html next to every exported PDF
+DEBUG_ENV = "BUDGET_EXPORT_DEBUG"
+
+DATA_FETCH = "data fetch"
+HTML_BUILD = "html build"
+LAYOUT = "layout"
+PAINT = "paint"
+PHASES = (DATA_FETCH, HTML_BUILD, LAYOUT, PAINT)
+
+
+def diagnostics_enabled(setting: bool = None) -> bool:
+    """An explicit setting wins; otherwise the BUDGET_EXPORT_DEBUG environment variable decides."""
+    if setting is not None:
+        return setting
+    return os.environ.get(DEBUG_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def debug_html_path(file_path: str) -> str:
+    """report.pdf -> report.debug.html; only a trailing .pdf extension is replaced."""
+    root, ext = os.path.splitext(file_path)
+    return (root if ext.lower() == ".pdf" else file_path) + ".debug.html"
+
+
+class ExportDiagnostics:
+    """Per-export timings and, when enabled, a streamed copy of the report HTML.
+
+    Off by default. When enabled, HTML fragments are appended to
+    <report>.debug.html as they are produced, and close() ends the file with
+    a table of the time spent in each phase (data fetch, HTML build, layout,
+    paint). Timings are always collected; they cost a clock read per phase.
+    """
+
+    def __init__(self, file_path: str, enabled: bool = None):
+        self.enabled = diagnostics_enabled(enabled)
+        self.path = debug_html_path(file_path)
+        self.timings = dict.fromkeys(PHASES, 0.0)
+        self._file = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Adds the time spent in the block to phase `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def write(self, html: str):
+        if not self.enabled:
+            return
+        if self._file is None:
+            try:
+                self._file = open(self.path, "w", encoding="utf-8")
+            except OSError as e:
+                print(f"Could not save debug HTML: {e}")
+                self.enabled = False
+                return
+            self._file.write(f"<html><head><style>{REPORT_CSS}</style></head><body>")
+        self._file.write(html)
+
+    def timings_html(self) -> str:
+        rows = "".join(f"<tr><td>{name}</td><td class=\"text-right\">{seconds * 1000:.1f} ms</td></tr>"
+                       for name, seconds in self.timings.items())
+        total = sum(self.timings.values())
+        return ("<h2>Export Timings</h2><table><thead><tr><th>Phase</th><th class=\"text-right\">Time</th>"
+                f"</tr></thead><tbody>{rows}<tr><td><b>Total</b></td>"
+                f"<td class=\"text-right\"><b>{total * 1000:.1f} ms</b></td></tr></tbody></table>")
+
+    def close(self):
+        """Finishes the debug file with the phase timings."""
+        if self._file is None:
+            return
+        self._file.write(self.timings_html())
+        self._file.write("</body></html>")
+        self._file.close()
+        self._file = None
+        print(f"Debug HTML saved to {self.path}")
+
+    def discard(self):
+        """Closes and deletes a partial debug file, e.g. after a cancelled export."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.enabled and os.path.exists(self.path):
+            os.remove(self.path)
@@ -1,167 +1,133 @@
 import os
-from PySide2.QtWidgets import QTextEdit
-from PySide2.QtGui import QTextDocument
+from PySide2.QtGui import QTextDocument, QPainter
 from PySide2.QtPrintSupport import QPrinter
-from PySide2.QtCore import QSizeF
+from PySide2.QtCore import QRectF, QSizeF
+import export_diagnostics
+from export_diagnostics import ExportDiagnostics
+from report_html import (REPORT_CSS, ROWS_PER_CHUNK, report_sections, range_report_sections,
+                         section_count, range_section_count)
 
-class PDFExporter:
-    @staticmethod
-    def export_monthly_report(data, file_path):
-        """Generates a PDF report from the provided data."""
-        doc = QTextDocument()
-        
-        # HTML Template with internal CSS
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: sans-serif; color: #333; }}
-                h1 {{ color: #5288c1; text-align: center; margin-bottom: 5px; }}
-                .subtitle {{ text-align: center; color: #666; margin-bottom: 20px; font-size: 16px; font-weight: bold; }}
-                
-                table {{ width: 100%; border-collapse: collapse; margin-bottom: 20px; }}
-                th {{ background-color: #f2f2f2; border: 1px solid #ddd; padding: 10px; text-align: left; font-weight: bold; }}
-                td {{ border: 1px solid #ddd; padding: 8px; vertical-align: top; }}
-                
-                .summary-box {{ background-color: #f9f9f9; border: 1px solid #ddd; padding: 15px; text-align: center; }}
-                .amount {{ font-size: 18px; font-weight: bold; display: block; margin-top: 5px; }}
-                .income {{ color: #2e7d32; }}
-                .expense {{ color: #c62828; }}
-                
-                h2 {{ border-bottom: 2px solid #5288c1; color: #5288c1; padding-bottom: 5px; margin-top: 30px; font-size: 18px; }}
-                .text-right {{ text-align: right; }}
-            </style>
-        </head>
-        <body>
-            <h1>Budget App Report</h1>
-            <div class="subtitle">Monthly Summary: {data['month']}</div>
-
-            <table style="width: 100%; border: none;">
-                <tr>
-                    <td style="border: none; width: 25%;">
-                        <div class="summary-box">
-                            <b>Net Worth</b><br/>
-                            <span class="amount">${data['summary']['net_worth']:,.2f}</span>
-                        </div>
-                    </td>
-                    <td style="border: none; width: 25%;">
-                        <div class="summary-box">
-                            <b>Income</b><br/>
-                            <span class="amount income">+${data['summary']['income']:,.2f}</span>
-                        </div>
-                    </td>
-                    <td style="border: none; width: 25%;">
-                        <div class="summary-box">
-                            <b>Expenses</b><br/>
-                            <span class="amount expense">-${data['summary']['expenses']:,.2f}</span>
-                        </div>
-                    </td>
-                    <td style="border: none; width: 25%;">
-                        <div class="summary-box">
-                            <b>Net Income</b><br/>
-                            <span class="amount {'income' if data['summary']['net_income'] >= 0 else 'expense'}">
-                                {'+$' if data['summary']['net_income'] >= 0 else '-$'}{abs(data['summary']['net_income']):,.2f}
-                            </span>
-                        </div>
-                    </td>
-                </tr>
-            </table>
-
-            <h2>Category Breakdown</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Category</th>
-                        <th class="text-right">Amount</th>
-                        <th class="text-right">Percentage</th>
-                    </tr>
-                </thead>
-                <tbody>
-        """
+# Progress phases reported to the optional progress(phase, current, total) callback
+QUERYING = "querying"
+LAYOUT = "layout"    # current/total: section being laid out / number of sections
+PAGE = "page"        # current/total: page painted / estimated page count
+WRITING = "writing"
 
-        total_expense = sum(data['categories'].values())
-        for cat, amount in sorted(data['categories'].items(), key=lambda x: x[1], reverse=True):
-            percentage = (amount / total_expense * 100) if total_expense > 0 else 0
-            html += f"""
-                <tr>
-                    <td>{cat}</td>
-                    <td class="text-right">${amount:,.2f}</td>
-                    <td class="text-right">{percentage:.1f}%</td>
-                </tr>
-            """
-        
-        if not data['categories']:
-            html += "<tr><td colspan='3' style='text-align:center;'>No expense data found.</td></tr>"
-
-        html += """
-                </tbody>
-            </table>
-
-            <h2>Transaction Log</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Date</th>
-                        <th>Category</th>
-                        <th>Note</th>
-                        <th class="text-right">Amount</th>
-                    </tr>
-                </thead>
-                <tbody>
-        """
 
-        for t in data['transactions']:
-            amount_str = f"+${t.amount:,.2f}" if t.type == "Income" else f"-${t.amount:,.2f}"
-            amount_style = 'color: #2e7d32;' if t.type == "Income" else 'color: #c62828;'
-            html += f"""
-                <tr>
-                    <td>{t.date}</td>
-                    <td>{t.category}</td>
-                    <td>{t.note}</td>
-                    <td class="text-right" style="{amount_style} font-weight: bold;">{amount_str}</td>
-                </tr>
-            """
-
-        if not data['transactions']:
-            html += "<tr><td colspan='4' style='text-align:center;'>No transactions found.</td></tr>"
-
-        html += """
-                </tbody>
-            </table>
-
-            <div style="margin-top: 50px; text-align: center; color: #999; font-size: 12px;">
-                Generated by Budget App
-            </div>
-        </body>
-        </html>
+class ExportCancelled(Exception):
+    """Raised from a progress callback to stop an export; the partial PDF is removed."""
+
+
+class ReportPipeline:
+    """A QPrinter and QTextDocument reused for every report written through it.
+
+    Batch exports create one pipeline and write many PDFs with it instead of
+    setting up a printer and a document per report and per chunk.
+    """
+
+    def __init__(self, debug_html: bool = None):
+        # None defers to the BUDGET_EXPORT_DEBUG environment variable
+        self.debug_html = debug_html
+        self.printer = QPrinter(QPrinter.ScreenResolution)
+        self.printer.setOutputFormat(QPrinter.PdfFormat)
+        self.printer.setPageSize(QPrinter.A4)
+        self.doc = QTextDocument()
+        self.doc.setDefaultStyleSheet(REPORT_CSS)
+
+    def write(self, sections, file_path, sections_total=None, progress=None, diagnostics=None):
+        """Paints HTML fragments into one PDF; every fragment starts on a new page.
+
+        progress(phase, current, total) is called before each section and
+        page. Total page counts are estimated from the sections laid out so
+        far and become exact with the last one. `diagnostics` (an
+        ExportDiagnostics) times the phases and, if enabled, keeps the HTML.
         """
-        
-        # Debug: Save HTML for internal verification
-        debug_html_path = file_path.replace(".pdf", ".debug.html")
-        try:
-            with open(debug_html_path, "w", encoding="utf-8") as f:
-                f.write(html)
-            print(f"Debug HTML saved to {debug_html_path}")
-        except Exception as e:
-            print(f"Could not save debug HTML: {e}")
-
-        doc.setHtml(html)
-        
-        # Setup Printer
-        printer = QPrinter(QPrinter.ScreenResolution)
-        printer.setOutputFormat(QPrinter.PdfFormat)
+        report = progress or (lambda phase, current, total: None)
+        diag = diagnostics or ExportDiagnostics(file_path, self.debug_html)
+        printer = self.printer
+        doc = self.doc
         printer.setOutputFileName(file_path)
-        printer.setPageSize(QPrinter.A4)
-        
-        from PySide2.QtGui import QPainter
+
         painter = QPainter()
         if not painter.begin(printer):
             print("ERROR: Failed to begin painting on printer.")
             return False
-            
-        # Draw the document onto the printer
-        doc.drawContents(painter)
-        painter.end()
-        
-        print(f"PDF Exported successfully to {file_path}")
+        page = printer.pageRect()
+        page_size = QSizeF(page.width(), page.height())
+
+        sections = iter(sections)
+        pages = 0
+        number = 0
+        cancelled = False
+        try:
+            while True:
+                with diag.phase(export_diagnostics.HTML_BUILD):
+                    html = next(sections, None)
+                if html is None:
+                    break
+                number += 1
+                report(LAYOUT, number, sections_total or 0)
+                diag.write(html)
+                with diag.phase(export_diagnostics.LAYOUT):
+                    doc.setHtml(html)
+                    doc.setPageSize(page_size)
+                    page_count = doc.pageCount()
+
+                # Pages so far plus, for the sections still to come, this one's size again
+                remaining = (sections_total - number) if sections_total else 0
+                estimate = pages + page_count * (1 + remaining)
+                for i in range(page_count):
+                    report(PAGE, pages + i + 1, estimate)
+                    with diag.phase(export_diagnostics.PAINT):
+                        if pages or i:
+                            printer.newPage()
+                        self._paint_page(painter, i, page_size)
+                pages += page_count
+            report(WRITING, pages, pages)
+        except ExportCancelled:
+            cancelled = True
+            raise
+        finally:
+            with diag.phase(export_diagnostics.PAINT):
+                painter.end()
+            doc.clear()
+            if cancelled:
+                diag.discard()
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            else:
+                diag.close()
+
+        print(f"PDF Exported successfully to {file_path} ({pages} pages)")
         return True
+
+    def _paint_page(self, painter, index, page_size):
+        """Paints page `index` of the paginated document onto the current printer page."""
+        painter.save()
+        # Shift the page to the top of the printed page
+        painter.translate(0, -index * page_size.height())
+        self.doc.drawContents(painter, QRectF(0, index * page_size.height(), page_size.width(), page_size.height()))
+        painter.restore()
+
+
+class PDFExporter:
+    @staticmethod
+    def export_monthly_report(data, file_path, rows_per_chunk: int = ROWS_PER_CHUNK, progress=None,
+                              pipeline: ReportPipeline = None, diagnostics: ExportDiagnostics = None):
+        """Generates a paginated PDF report from the provided data.
+
+        The report is laid out in chunks of rows_per_chunk transactions. Each
+        chunk is paginated to the printer's page size and painted page by
+        page before the next chunk is built, so nothing is cut off and memory
+        does not grow with the log.
+        """
+        return (pipeline or ReportPipeline()).write(report_sections(data, rows_per_chunk), file_path,
+                                                    section_count(data, rows_per_chunk), progress, diagnostics)
+
+    @staticmethod
+    def export_range_report(data, file_path, rows_per_chunk: int = ROWS_PER_CHUNK, progress=None,
+                            pipeline: ReportPipeline = None, diagnostics: ExportDiagnostics = None):
+        """Generates a multi-month PDF report from MainController.get_range_report_data()."""
+        return (pipeline or ReportPipeline()).write(range_report_sections(data, rows_per_chunk), file_path,
+                                                    range_section_count(data, rows_per_chunk), progress,
+                                                    diagnostics)
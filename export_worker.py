@@ -0,0 +1,143 @@
+import itertools
+import threading
+import traceback
+from PySide2.QtCore import QObject, QRunnable, QThreadPool, Signal
+from date_range import MONTH_RE
+from export_diagnostics import ExportDiagnostics, DATA_FETCH
+from export_engine import PDFExporter, ExportCancelled, QUERYING, LAYOUT, PAGE, WRITING
+
+# Exports run one after another; each holds one pooled DB connection
+EXPORT_THREADS = 1
+
+PHASE_LABELS = {
+    QUERYING: "Querying data...",
+    LAYOUT: "Laying out section {current} of {total}...",
+    PAGE: "Page {current} of {total}...",
+    WRITING: "Writing PDF...",
+}
+
+
+def describe_progress(phase: str, current: int, total: int) -> str:
+    """Human readable text for a progress signal."""
+    return PHASE_LABELS.get(phase, phase).format(current=current, total=total or "?")
+
+
+class _ExportSignals(QObject):
+    # job id, phase, current, total
+    progress = Signal(int, str, int, int)
+    # job id, file path / error message
+    finished = Signal(int, str)
+    failed = Signal(int, str)
+    cancelled = Signal(int)
+
+
+class _ExportTask(QRunnable):
+    def __init__(self, job_id, controller, period, file_path, signals):
+        super().__init__()
+        self.job_id = job_id
+        self.controller = controller
+        self.period = period
+        self.file_path = file_path
+        self.signals = signals
+        self.cancel_requested = threading.Event()
+        # ExportQueue keeps the Python reference for tryTake()
+        self.setAutoDelete(False)
+
+    def _progress(self, phase, current, total):
+        if self.cancel_requested.is_set():
+            raise ExportCancelled()
+        self.signals.progress.emit(self.job_id, phase, current, total)
+
+    def run(self):
+        try:
+            self._progress(QUERYING, 0, 0)
+            diagnostics = ExportDiagnostics(self.file_path)
+            monthly = MONTH_RE.match(self.period)
+            with diagnostics.phase(DATA_FETCH):
+                if monthly:
+                    data = self.controller.get_report_data(self.period)
+                else:
+                    data = self.controller.get_range_report_data(self.period)
+            self._progress(QUERYING, 1, 1)
+            export = PDFExporter.export_monthly_report if monthly else PDFExporter.export_range_report
+            ok = export(data, self.file_path, progress=self._progress, diagnostics=diagnostics)
+        except ExportCancelled:
+            self.signals.cancelled.emit(self.job_id)
+            return
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(self.job_id, str(e))
+            return
+
+        if ok:
+            self.signals.finished.emit(self.job_id, self.file_path)
+        else:
+            self.signals.failed.emit(self.job_id, "Failed to generate PDF report.")
+
+
+class ExportQueue(QObject):
+    """Runs report exports on a background thread, one after another.
+
+    submit() returns immediately with a job id; the queue reports progress,
+    completion, failure and cancellation through its signals on the GUI
+    thread. A period is a YYYY-MM month (monthly report) or anything else
+    DateRange.parse accepts (range report).
+    """
+    progress = Signal(int, str, int, int)
+    finished = Signal(int, str)
+    failed = Signal(int, str)
+    cancelled = Signal(int)
+
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(EXPORT_THREADS)
+        self._ids = itertools.count(1)
+        self._tasks = {}  # job id -> _ExportTask, until it reports back
+        self._signals = _ExportSignals()
+        self._signals.progress.connect(self.progress)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+        self._signals.cancelled.connect(self._on_cancelled)
+
+    def submit(self, period: str, file_path: str) -> int:
+        job_id = next(self._ids)
+        task = _ExportTask(job_id, self.controller, period, file_path, self._signals)
+        self._tasks[job_id] = task
+        self.pool.start(task)
+        return job_id
+
+    def cancel(self, job_id: int):
+        """Cancels a queued export, or stops a running one at its next section or page."""
+        task = self._tasks.get(job_id)
+        if not task:
+            return
+        task.cancel_requested.set()
+        if self.pool.tryTake(task):
+            self._on_cancelled(job_id)
+
+    def cancel_all(self):
+        for job_id in list(self._tasks):
+            self.cancel(job_id)
+
+    def pending(self) -> int:
+        """Exports queued or running."""
+        return len(self._tasks)
+
+    def shutdown(self, timeout_ms: int = 5000):
+        """Cancels every export and waits for the running one to stop."""
+        self.cancel_all()
+        self.pool.waitForDone(timeout_ms)
+
+    def _on_finished(self, job_id, file_path):
+        self._tasks.pop(job_id, None)
+        self.finished.emit(job_id, file_path)
+
+    def _on_failed(self, job_id, message):
+        self._tasks.pop(job_id, None)
+        self.failed.emit(job_id, message)
+
+    def _on_cancelled(self, job_id):
+        self._tasks.pop(job_id, None)
+        self.cancelled.emit(job_id)
@@ -0,0 +1,110 @@
+"""Streaming data exporters that need neither Qt nor model objects.
+
+Rows come straight from a SQLite cursor as tuples and are written one at a
+time, so exporting the whole history uses constant memory:
+
+    python exporters.py budget.db csv transactions.csv [period]
+"""
+import csv
+import json
+import sys
+from abc import ABC, abstractmethod
+from models import Money
+
+EXPORTERS = {}
+
+
+def register_exporter(cls):
+    """Class decorator that makes an Exporter available by its format name."""
+    EXPORTERS[cls.format] = cls
+    return cls
+
+
+def get_exporter(fmt: str) -> "Exporter":
+    try:
+        return EXPORTERS[fmt.lower()]()
+    except KeyError:
+        raise ValueError(f"Unsupported export format: {fmt} (choose from {', '.join(EXPORTERS)})") from None
+
+
+class Exporter(ABC):
+    """Writes (columns, rows) to a text stream.
+
+    Subclasses set `format` and `extension` and implement write(); rows may
+    be any iterable of tuples, typically a cursor, and must be consumed
+    lazily. Returns the number of rows written.
+    """
+    format = None
+    extension = None
+    newline = None  # Passed to open(); csv needs ""
+
+    @abstractmethod
+    def write(self, columns, rows, stream) -> int:
+        """Writes a header (if any) and every row to stream."""
+
+    def write_file(self, columns, rows, file_path: str) -> int:
+        with open(file_path, "w", encoding="utf-8", newline=self.newline) as f:
+            return self.write(columns, rows, f)
+
+
+@register_exporter
+class CSVExporter(Exporter):
+    format = "csv"
+    extension = ".csv"
+    newline = ""
+
+    def write(self, columns, rows, stream) -> int:
+        writer = csv.writer(stream)
+        writer.writerow(columns)
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+
+@register_exporter
+class JSONLinesExporter(Exporter):
+    """One JSON object per line, keyed by column name."""
+    format = "jsonl"
+    extension = ".jsonl"
+
+    def write(self, columns, rows, stream) -> int:
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        count = 0
+        for row in rows:
+            stream.write(encode(dict(zip(columns, row))))
+            stream.write("\n")
+            count += 1
+        return count
+
+
+def _amounts_as_dollars(rows, index: int):
+    """Rewrites the cents column at `index` as exact "12.50" strings."""
+    for row in rows:
+        yield row[:index] + (str(Money(row[index])),) + row[index + 1:]
+
+
+def export_transactions(controller, fmt: str, file_path: str, month_str=None, account_id=None) -> int:
+    """Streams matching transactions to file_path in the given format; returns the row count.
+
+    Amounts are written in dollars as decimal strings, never as floats.
+    """
+    exporter = get_exporter(fmt)
+    with controller.transaction_cursor(account_id, month_str) as cursor:
+        columns = [d[0] for d in cursor.description]
+        return exporter.write_file(columns, _amounts_as_dollars(cursor, columns.index("amount")), file_path)
+
+
+if __name__ == "__main__":
+    from controllers import MainController
+
+    if len(sys.argv) < 4:
+        sys.exit(f"usage: python exporters.py DB {{{'|'.join(EXPORTERS)}}} OUTPUT [PERIOD]")
+    controller = MainController(sys.argv[1])
+    try:
+        count = export_transactions(controller, sys.argv[2], sys.argv[3],
+                                    sys.argv[4] if len(sys.argv) > 4 else None)
+    finally:
+        controller.close()
+    print(f"Exported {count} transactions to {sys.argv[3]}")
@@ -1,7 +1,8 @@
-import uuid
 from PySide2.QtWidgets import (QDialog, QMessageBox, QApplication, QPushButton, 
                                QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QFrame,
-                               QStackedWidget, QCalendarWidget, QTabBar, QFileDialog)
+                               QStackedWidget, QCalendarWidget, QTabBar, QFileDialog, QInputDialog,
+                               QProgressDialog,
+                               QListView, QAbstractItemView)
 from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainter, QColor
 from PySide2.QtCharts import QtCharts
@@ -11,21 +12,39 @@ from add_transaction_dialog import AddTransactionDialog
 from account_card import AccountCard
 from stat_card import StatCard
 from controllers import MainController
+from models import Money
+from data_loader import DataLoader, LOADER_THREADS
+from export_worker import ExportQueue, EXPORT_THREADS, describe_progress
+from event_hub import EventHub
+from events import AccountEvent, TransactionEvent, CategoryEvent, CategoryRenamed
+from reconcile import diff_ops
+from transaction_model import TransactionTableModel, TransactionDelegate, TransactionRole
 from theme_manager import ThemeManager
 
 class TransactionCalendar(QCalendarWidget):
-    def __init__(self, controller, parent=None):
+    def __init__(self, controller, loader=None, parent=None):
         super().__init__(parent)
         self.controller = controller
+        self.loader = loader
         self.daily_summary = {} # { day: {has_income, has_expense} }
         self.currentPageChanged.connect(self.update_summary)
         self.update_summary(self.yearShown(), self.monthShown())
 
     def update_summary(self, year, month):
         month_str = f"{year}-{month:02d}"
-        self.daily_summary = self.controller.get_daily_transaction_summary(month_str)
+        if self.loader:
+            # Markers for the previous page stay hidden until the new month arrives
+            self.daily_summary = {}
+            self.loader.request("calendar_summary", self.controller.get_daily_transaction_summary,
+                                month_str, on_result=self._set_summary)
+        else:
+            self._set_summary(self.controller.get_daily_transaction_summary(month_str))
         self.update() # Trigger repaint
 
+    def _set_summary(self, summary):
+        self.daily_summary = summary
+        self.update()
+
     def paintCell(self, painter, rect, date):
         super().paintCell(painter, rect, date)
         
@@ -63,8 +82,26 @@ class HomeScreen(QDialog):
         super().__init__(parent)
         self.view_mode = "grid" # grid or list
 
-        # Initialize Controller
-        self.controller = MainController()
+        # Initialize Controller: one pooled connection per background worker
+        # below, plus one so the GUI thread never waits for a free connection
+        self.controller = MainController(pool_size=LOADER_THREADS + EXPORT_THREADS + 1)
+        # Runs controller queries off the GUI thread
+        self.loader = DataLoader(self, max_threads=LOADER_THREADS)
+        # Controller writes arrive here as batched change events
+        self.hub = EventHub(self.controller.events, self)
+        self.hub.changed.connect(self._on_data_changed)
+        # PDF exports run one at a time in the background
+        self.exports = ExportQueue(self.controller, self)
+        self.exports.progress.connect(self._on_export_progress)
+        self.exports.finished.connect(self._on_export_finished)
+        self.exports.failed.connect(self._on_export_failed)
+        self.exports.cancelled.connect(self._on_export_done)
+        self._export_jobs = {}  # job id -> period
+        self._export_current = None
+        self._export_dialog = None
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self._shutdown)
 
         # Main Layout
         main_layout = QHBoxLayout(self)
@@ -174,9 +211,9 @@ class HomeScreen(QDialog):
         stats_layout = QHBoxLayout()
         stats_layout.setSpacing(20)
         
-        self.netWorthCard = StatCard("Net Worth", 0.0)
-        self.incomeCard = StatCard("Monthly Income", 0.0, color="#a6e3a1")
-        self.expenseCard = StatCard("Monthly Expenses", 0.0, color="#f38ba8")
+        self.netWorthCard = StatCard("Net Worth", 0)
+        self.incomeCard = StatCard("Monthly Income", 0, color="#a6e3a1")
+        self.expenseCard = StatCard("Monthly Expenses", 0, color="#f38ba8")
         
         stats_layout.addWidget(self.netWorthCard)
         stats_layout.addWidget(self.incomeCard)
@@ -211,13 +248,49 @@ class HomeScreen(QDialog):
         self.accounts_layout = QVBoxLayout(self.accScrollWidget)
         self.accounts_layout.setAlignment(Qt.AlignTop)
         self.accounts_layout.setSpacing(10)
+        # Mirror of the cards in the layout, for incremental refreshes
+        self._account_rows = []
+        self._account_cards = {}
         
         scroll.setWidget(self.accScrollWidget)
         layout.addWidget(scroll)
 
+    def _shutdown(self):
+        """Stops background loads before the controller's connections close."""
+        self.hub.close()
+        self.exports.shutdown()
+        self.loader.shutdown()
+        self.controller.close()
+
+    def _on_data_changed(self, events):
+        """Refreshes only the widgets a batch of change events affects."""
+        accounts = any(isinstance(e, AccountEvent) for e in events)
+        # A rename relabels existing transactions without touching their rows
+        transactions = any(isinstance(e, (TransactionEvent, CategoryRenamed)) for e in events)
+        categories = any(isinstance(e, CategoryEvent) for e in events)
+        view = self.contentArea.currentIndex()
+
+        # Hidden views reload when switch_view shows them again
+        if accounts:
+            self._load_accounts()
+        elif transactions:
+            self._refresh_stats()
+        if transactions and view == 1:
+            self._refresh_transactions_view()
+        if transactions and view == 2:
+            self.calendar.update_summary(self.calendar.yearShown(), self.calendar.monthShown())
+            self._on_calendar_date_changed()
+        if transactions and view == 3:
+            self._refresh_charts()
+        if categories and view == 3:
+            self._load_categories()
+
     def _refresh_stats(self):
         """Refreshes the summary statistics at the top of the dashboard and charts."""
-        summary = self.controller.get_monthly_summary()
+        self.loader.request("dashboard_stats", self.controller.get_monthly_summary,
+                            on_result=self._show_stats)
+
+    def _show_stats(self, summary):
         self.netWorthCard.updateValue(summary["net_worth"])
         self.incomeCard.updateValue(summary["income"])
         self.expenseCard.updateValue(summary["expenses"])
@@ -230,18 +303,24 @@ class HomeScreen(QDialog):
             index = self.categoryMonthTabs.currentIndex()
             month_str = self.categoryMonthTabs.tabData(index) if index != -1 else datetime.now().strftime("%Y-%m")
         
-        spending_data = self.controller.get_category_spending(month_str)
-        
+        self._show_chart_placeholder("Loading...")
+        self.loader.request("category_spending", self.controller.get_category_spending, month_str,
+                            on_result=self._show_category_chart)
+
+    def _show_chart_placeholder(self, title):
+        chart = QtCharts.QChart()
+        chart.setTitle(title)
+        chart.setTitleBrush(QColor("#a6adc8"))
+        chart.setBackgroundBrush(Qt.NoBrush)
+        self.pie_chart_view.setChart(chart)
+
+    def _show_category_chart(self, spending_data):
         series = QtCharts.QPieSeries()
         total_expense = sum(spending_data.values())
         
         if not spending_data:
             # Show empty state
-            chart = QtCharts.QChart()
-            chart.setTitle("No expense data for this month")
-            chart.setTitleBrush(QColor("#a6adc8"))
-            chart.setBackgroundBrush(Qt.NoBrush)
-            self.pie_chart_view.setChart(chart)
+            self._show_chart_placeholder("No expense data for this month")
             return
 
         # Color palette (Catppuccin inspired vibrant colors)
@@ -249,7 +328,7 @@ class HomeScreen(QDialog):
         
         for i, (cat, amount) in enumerate(spending_data.items()):
             percentage = (amount / total_expense * 100) if total_expense > 0 else 0
-            label = f"{cat}: ${amount:,.2f} ({percentage:.1f}%)"
+            label = f"{cat}: ${Money(amount):,.2f} ({percentage:.1f}%)"
             p_slice = series.append(label, amount)
             p_slice.setLabelVisible(True)
             p_slice.setBrush(QColor(colors[i % len(colors)]))
@@ -273,26 +352,52 @@ class HomeScreen(QDialog):
         self.pie_chart_view.setChart(chart)
 
     def _load_accounts(self):
-        """Loads accounts and refreshes stats."""
+        """Refreshes stats and patches the account list to match the database."""
         # 1. Update Stats
         self._refresh_stats()
 
-        # 2. Update Accounts List
-        while self.accounts_layout.count():
-            item = self.accounts_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # 2. Update Accounts List in the background
+        self.loader.request("accounts", self.controller.get_all_accounts, on_result=self._show_accounts)
 
-        accounts = self.controller.get_all_accounts()
-        for acc in accounts:
-            self._create_account_card(acc.id, acc.name, acc.balance)
+    def _show_accounts(self, accounts):
+        # Only changed cards are touched
+        self._patch_layout(
+            self.accounts_layout, self._account_rows, self._account_cards, accounts,
+            key=lambda acc: acc.id,
+            create=self._create_account_card,
+            update=lambda card, acc: card.updateData(acc.name, acc.balance)
+        )
 
-    def _create_account_card(self, account_id, name, balance):
-        card = AccountCard(account_id, name, balance)
+    def _create_account_card(self, acc):
+        card = AccountCard(acc.id, acc.name, acc.balance)
         card.set_view_mode("list") # Always list view now
         card.editRequested.connect(self._edit_account)
         card.deleteRequested.connect(self._delete_account)
-        self.accounts_layout.addWidget(card)
+        return card
+
+    def _patch_layout(self, layout, rows, widgets, new_rows, key, create, update=None):
+        """Patches a layout of row widgets so it shows new_rows.
+
+        `rows` mirrors the layout order and `widgets` maps key -> widget; both
+        are updated in place. Unchanged rows keep their widgets.
+        """
+        for op in diff_ops(rows, new_rows, key):
+            index = op[1]
+            if op[0] == "remove":
+                widget = widgets.pop(key(rows.pop(index)))
+                layout.removeWidget(widget)
+                widget.setParent(None)
+                widget.deleteLater()
+            elif op[0] == "insert":
+                item = op[2]
+                rows.insert(index, item)
+                widgets[key(item)] = widget = create(item)
+                layout.insertWidget(index, widget)
+            else:
+                item = op[2]
+                rows[index] = item
+                if update:
+                    update(widgets[key(item)], item)
 
     def setup_transactions_view(self):
         self.transWidget = QWidget()
@@ -371,17 +476,20 @@ class HomeScreen(QDialog):
         
         layout.addWidget(summary_frame)
 
-        # 3. Transaction List (Scroll Area)
-        self.transList = QScrollArea()
-        self.transList.setObjectName("TransactionsScroll")
-        self.transList.setWidgetResizable(True)
+        # 3. Transaction List (model/view: only visible rows are painted,
+        # further pages are fetched as the user scrolls)
+        self.transModel = TransactionTableModel(self.controller, self)
+        self.transList = QListView()
+        self.transList.setObjectName("TransactionsList")
+        self.transList.setModel(self.transModel)
+        self.transList.setItemDelegate(TransactionDelegate(self.transList))
+        self.transList.setUniformItemSizes(True)
+        self.transList.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.transList.setSelectionMode(QAbstractItemView.NoSelection)
         self.transList.setFrameShape(QFrame.NoFrame)
-        self.transListContent = QWidget()
-        self.transListContent.setObjectName("TransactionsContainer")
-        self.transListLayout = QVBoxLayout(self.transListContent)
-        self.transListLayout.setAlignment(Qt.AlignTop)
-        self.transListLayout.setSpacing(10)
-        self.transList.setWidget(self.transListContent)
+        self.transList.setMouseTracking(True)
+        self.transList.setCursor(Qt.PointingHandCursor)
+        self.transList.clicked.connect(self._on_transaction_clicked)
         
         layout.addWidget(self.transList)
 
@@ -397,7 +505,7 @@ class HomeScreen(QDialog):
         title.setStyleSheet("font-size: 28px; font-weight: bold; color: #cdd6f4; margin-bottom: 10px;")
         left_layout.addWidget(title)
         
-        self.calendar = TransactionCalendar(self.controller)
+        self.calendar = TransactionCalendar(self.controller, self.loader)
         self.calendar.setObjectName("MainCalendar")
         self.calendar.selectionChanged.connect(self._on_calendar_date_changed)
         left_layout.addWidget(self.calendar)
@@ -486,6 +594,8 @@ class HomeScreen(QDialog):
         self.cat_scroll_content.setObjectName("CategoryListContainer")
         self.cat_scroll_layout = QVBoxLayout(self.cat_scroll_content)
         self.cat_scroll_layout.setAlignment(Qt.AlignTop)
+        self._category_rows = []
+        self._category_widgets = {}
         self.cat_scroll.setWidget(self.cat_scroll_content)
         
         self.cat_list_layout.addWidget(self.cat_scroll)
@@ -494,42 +604,44 @@ class HomeScreen(QDialog):
         layout.addWidget(self.charts_container)
         
         # Initial chart load
-        self._populate_month_tabs(self.categoryMonthTabs)
-        self._refresh_charts()
+        self._populate_month_tabs(self.categoryMonthTabs, then=self._refresh_charts)
         self._load_categories()
 
     def _load_categories(self):
-        """Loads categories into the management list."""
-        while self.cat_scroll_layout.count():
-            item = self.cat_scroll_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Patches the management list to match the categories table."""
+        self.loader.request("categories", self.controller.get_unique_categories,
+                            on_result=self._show_categories)
+
+    def _show_categories(self, categories):
+        self._patch_layout(
+            self.cat_scroll_layout, self._category_rows, self._category_widgets, categories,
+            key=lambda name: name,
+            create=self._create_category_row
+        )
+
+    def _create_category_row(self, cat):
+        row = QFrame()
+        row.setObjectName("CategoryRow")
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(10, 5, 10, 5)
         
-        categories = self.controller.get_unique_categories()
-        for cat in categories:
-            row = QFrame()
-            row.setObjectName("CategoryRow")
-            row_layout = QHBoxLayout(row)
-            row_layout.setContentsMargins(10, 5, 10, 5)
-            
-            lbl = QLabel(cat)
-            lbl.setStyleSheet("font-size: 14px; color: #cdd6f4;")
-            row_layout.addWidget(lbl)
-            
-            row_layout.addStretch()
-            
-            del_btn = QPushButton("✕")
-            del_btn.setFixedSize(24, 24)
-            del_btn.setStyleSheet("""
-                QPushButton { 
-                    background-color: transparent; color: #f38ba8; font-weight: bold; border-radius: 4px; 
-                }
-                QPushButton:hover { background-color: #f38ba8; color: #181825; }
-            """)
-            del_btn.clicked.connect(lambda checked=False, name=cat: self._confirm_delete_category(name))
-            row_layout.addWidget(del_btn)
-            
-            self.cat_scroll_layout.addWidget(row)
+        lbl = QLabel(cat)
+        lbl.setStyleSheet("font-size: 14px; color: #cdd6f4;")
+        row_layout.addWidget(lbl)
+        
+        row_layout.addStretch()
+        
+        del_btn = QPushButton("✕")
+        del_btn.setFixedSize(24, 24)
+        del_btn.setStyleSheet("""
+            QPushButton { 
+                background-color: transparent; color: #f38ba8; font-weight: bold; border-radius: 4px; 
+            }
+            QPushButton:hover { background-color: #f38ba8; color: #181825; }
+        """)
+        del_btn.clicked.connect(lambda checked=False, name=cat: self._confirm_delete_category(name))
+        row_layout.addWidget(del_btn)
+        return row
 
     def _confirm_delete_category(self, name):
         confirm = QMessageBox.question(
@@ -538,9 +650,7 @@ class HomeScreen(QDialog):
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if confirm == QMessageBox.Yes:
-            if self.controller.delete_category(name):
-                self._load_categories()
-                self._refresh_charts()
+            self.controller.delete_category(name)
 
     def _on_calendar_date_changed(self):
         date = self.calendar.selectedDate()
@@ -548,15 +658,22 @@ class HomeScreen(QDialog):
         display_date = date.toString("MMMM d, yyyy")
         self.dailyTitle.setText(display_date)
         
-        # Load transactions for this day
-        # Clear existing
+        # Load transactions for this day in the background
+        self._clear_day_transactions()
+        loading_lbl = QLabel("Loading...")
+        loading_lbl.setStyleSheet("color: #a6adc8; font-style: italic;")
+        self.dayTransLayout.addWidget(loading_lbl)
+        self.loader.request("day_transactions", self.controller.get_transactions_for_day, date_str,
+                            on_result=self._show_day_transactions)
+
+    def _clear_day_transactions(self):
         while self.dayTransLayout.count():
             item = self.dayTransLayout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
-        
-        transactions = self.controller.get_transactions_for_day(date_str)
-        
+
+    def _show_day_transactions(self, transactions):
+        self._clear_day_transactions()
         if not transactions:
             empty_lbl = QLabel("No transactions for this day.")
             empty_lbl.setStyleSheet("color: #a6adc8; font-style: italic;")
@@ -573,7 +690,7 @@ class HomeScreen(QDialog):
             cat_lbl = QLabel(t.category)
             cat_lbl.setStyleSheet("font-weight: bold; font-size: 14px; color: #cdd6f4;")
             
-            amount_str = f"+${t.amount:,.2f}" if t.type == "Income" else f"-${t.amount:,.2f}"
+            amount_str = f"+${Money(t.amount):,.2f}" if t.type == "Income" else f"-${Money(t.amount):,.2f}"
             color = "#a6e3a1" if t.type == "Income" else "#f38ba8"
             amount_lbl = QLabel(amount_str)
             amount_lbl.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 14px;")
@@ -595,29 +712,32 @@ class HomeScreen(QDialog):
     def switch_view(self, index):
         self.contentArea.setCurrentIndex(index)
         if index == 1: # Transactions
-            self._populate_month_tabs(self.monthTabs)
-            self._on_month_tab_changed()
+            self._populate_month_tabs(self.monthTabs, then=self._on_month_tab_changed)
         elif index == 2: # Calendar
             self.calendar.update_summary(self.calendar.yearShown(), self.calendar.monthShown()) # Refresh markers
             self._on_calendar_date_changed() # Load transactions for selected day
         elif index == 3: # Categories
-            self._populate_month_tabs(self.categoryMonthTabs)
-            self._refresh_charts()
+            self._populate_month_tabs(self.categoryMonthTabs, then=self._refresh_charts)
             self._load_categories()
         
         # Update Nav State
         for i, btn in enumerate(self.nav_btns):
             btn.setChecked(i == index)
 
-    def _populate_month_tabs(self, tab_bar):
-        """Calculates and populates the given tab bar with month options."""
+    def _populate_month_tabs(self, tab_bar, then=None):
+        """Populates the given tab bar with month options, then calls then().
+
+        The first transaction date is looked up in the background.
+        """
+        self.loader.request(f"month_tabs_{id(tab_bar)}", self.controller.get_transaction_date_range,
+                            on_result=lambda date_range: self._show_month_tabs(tab_bar, *date_range, then))
+
+    def _show_month_tabs(self, tab_bar, first_date, now, then=None):
         tab_bar.blockSignals(True)
         # QTabBar does not have clear(), must remove individually
         while tab_bar.count() > 0:
             tab_bar.removeTab(0)
         
-        first_date, now = self.controller.get_transaction_date_range()
-        
         # Start from the first of the first month
         curr_year = first_date.year
         curr_month = first_date.month
@@ -645,6 +765,8 @@ class HomeScreen(QDialog):
                 break
         
         tab_bar.blockSignals(False)
+        if then:
+            then()
 
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts."""
@@ -673,64 +795,39 @@ class HomeScreen(QDialog):
         self._refresh_monthly_summary(month_str)
 
     def _refresh_monthly_summary(self, month_str):
-        summary = self.controller.get_monthly_summary(month_str)
-        self.monthIncomeLbl.setText(f"Income: ${summary['income']:,.2f}")
-        self.monthExpenseLbl.setText(f"Expenses: ${summary['expenses']:,.2f}")
-        self.monthNetLbl.setText(f"Net Income: ${summary['net_income']:,.2f}")
+        # Placeholders until the background query returns
+        self.monthIncomeLbl.setText("Income: ...")
+        self.monthExpenseLbl.setText("Expenses: ...")
+        self.monthNetLbl.setText("Net Income: ...")
+        self.loader.request("month_summary", self.controller.get_monthly_summary, month_str,
+                            on_result=self._show_monthly_summary)
+
+    def _show_monthly_summary(self, summary):
+        self.monthIncomeLbl.setText(f"Income: ${Money(summary['income']):,.2f}")
+        self.monthExpenseLbl.setText(f"Expenses: ${Money(summary['expenses']):,.2f}")
+        self.monthNetLbl.setText(f"Net Income: ${Money(summary['net_income']):,.2f}")
         
         color = "#a6e3a1" if summary['net_income'] >= 0 else "#f38ba8"
         self.monthNetLbl.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 16px;")
 
     def _load_transactions(self, month_str=None):
-        # Clear existing
-        while self.transListLayout.count():
-            item = self.transListLayout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-                
-        transactions = self.controller.get_transactions(month_str=month_str)
-        
-        for t in transactions:
-            row = QFrame()
-            row.setObjectName("TransactionRow")
-            row.setCursor(Qt.PointingHandCursor)
-            row_layout = QHBoxLayout(row)
-            row_layout.setContentsMargins(15, 10, 15, 10)
-            
-            # Date
-            date_lbl = QLabel(t.date)
-            date_lbl.setFixedWidth(100)
-            
-            # Category & Note
-            details_layout = QVBoxLayout()
-            cat_lbl = QLabel(t.category)
-            cat_lbl.setStyleSheet("font-weight: bold; font-size: 14px;")
-            note_lbl = QLabel(t.note)
-            note_lbl.setStyleSheet("color: #a6adc8; font-size: 12px;")
-            details_layout.addWidget(cat_lbl)
-            details_layout.addWidget(note_lbl)
-            
-            # Amount
-            amount_str = f"+${t.amount:,.2f}" if t.type == "Income" else f"-${t.amount:,.2f}"
-            color = "#a6e3a1" if t.type == "Income" else "#f38ba8" 
-            amount_lbl = QLabel(amount_str)
-            amount_lbl.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            amount_lbl.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 16px;")
-            
-            row_layout.addWidget(date_lbl)
-            row_layout.addLayout(details_layout)
-            row_layout.addStretch()
-            row_layout.addWidget(amount_lbl)
-            
-            # Connect row click to edit
-            row.mousePressEvent = lambda e, tid=t.id: self._edit_transaction(tid)
-            
-            self.transListLayout.addWidget(row)
+        self.transModel.load(month_str=month_str)
+
+    def _refresh_transactions_view(self):
+        """Patches the loaded transaction rows and month summary after a write."""
+        self.transModel.refresh()
+        index = self.monthTabs.currentIndex()
+        if index != -1:
+            self._refresh_monthly_summary(self.monthTabs.tabData(index))
+
+    def _on_transaction_clicked(self, index):
+        t = index.data(TransactionRole)
+        if t:
+            self._edit_transaction(t.id)
 
     def _edit_transaction(self, transaction_id):
         # Find transaction data
-        all_t = self.controller.get_transactions()
-        t = next((item for item in all_t if item.id == transaction_id), None)
+        t = self.controller.get_transaction(transaction_id)
         if not t: return
 
         # Open Dialog
@@ -750,8 +847,6 @@ class HomeScreen(QDialog):
         if dlg.exec_():
             updated_data = dlg.get_result()
             if updated_data and self.controller.update_transaction(transaction_id, updated_data):
-                self._on_month_tab_changed()
-                self._refresh_stats() # Update Net Worth on dashboard too
                 QMessageBox.information(self, "Success", "Transaction updated!")
 
 
@@ -774,34 +869,19 @@ class HomeScreen(QDialog):
                 name, balance = result
                 self._add_account(name, balance)
 
-    def _add_account(self, name: str, balance: float):
-        # Use controller to add to DB
-        new_acc = self.controller.add_account(name, balance)
-        if new_acc:
-            self._create_account_card(new_acc.id, new_acc.name, new_acc.balance)
-            self._refresh_stats()
+    def _add_account(self, name: str, balance: int):
+        # Use controller to add to DB; the dashboard refreshes from its change event
+        self.controller.add_account(name, balance)
 
-    def _edit_account(self, account_id: str):
-        
-        all_accs = self.controller.get_all_accounts()
-        acc = next((a for a in all_accs if a.id == account_id), None)
-        
+    def _edit_account(self, account_id: int):
+        acc = self.controller.get_account(account_id)
         if not acc:
             return
 
         dlg = AddAccountDialog(self, initial_name=acc.name, initial_amount=acc.balance)
         if dlg.exec_():
             name, balance = dlg.get_result()
-            if self.controller.update_account(account_id, name, balance):
-                # Update UI
-                for i in range(self.accounts_layout.count()):
-                    item = self.accounts_layout.itemAt(i)
-                    if not item: continue
-                    widget = item.widget()
-                    if isinstance(widget, AccountCard) and widget.account_id == account_id:
-                        widget.updateData(name, balance)
-                        self._refresh_stats()
-                        break
+            self.controller.update_account(account_id, name, balance)
 
     def open_add_transaction_dialog(self):
         # Pass all accounts to the dialog
@@ -825,16 +905,11 @@ class HomeScreen(QDialog):
                     data["type"], 
                     data["note"]
                 ):
-                    # Refresh viewing
-                    self._load_accounts()
-                    self._load_transactions()
-                    if self.contentArea.currentIndex() == 3:
-                        self._load_categories()
                     QMessageBox.information(self, "Success", "Transaction added successfully!")
                 else:
                     QMessageBox.critical(self, "Error", "Failed to add transaction.")
 
-    def _delete_account(self, account_id: str):
+    def _delete_account(self, account_id: int):
         confirm = QMessageBox.question(
             self, "Delete account",
             "Are you sure you want to delete this account?",
@@ -843,23 +918,10 @@ class HomeScreen(QDialog):
         if confirm != QMessageBox.Yes:
             return
 
-        if self.controller.delete_account(account_id):
-            # Remove from UI
-            for i in range(self.accounts_layout.count()):
-                item = self.accounts_layout.itemAt(i)
-                if not item: continue
-                widget = item.widget()
-                if isinstance(widget, AccountCard) and widget.account_id == account_id:
-                    self.accounts_layout.removeWidget(widget)
-                    widget.setParent(None)
-                    widget.deleteLater()
-                    self._refresh_stats()
-                    break
+        self.controller.delete_account(account_id)
 
     def _export_monthly_report(self):
-        """Triggers the PDF export engine for the currently selected month."""
-        from export_engine import PDFExporter
-        
+        """Queues a PDF export of the selected month, or its quarter or year."""
         # Determine month from tabs
         index = self.monthTabs.currentIndex()
         if index == -1:
@@ -867,27 +929,72 @@ class HomeScreen(QDialog):
             return
             
         month_str = self.monthTabs.tabData(index)
+        year, month = month_str.split("-")
+        periods = [month_str, f"{year}-Q{(int(month) - 1) // 3 + 1}", year]
+        labels = [f"Month ({periods[0]})", f"Quarter ({periods[1]})", f"Year ({periods[2]})"]
+        label, ok = QInputDialog.getItem(self, "Export Report", "Report period:", labels, 0, False)
+        if not ok:
+            return
+        period = periods[labels.index(label)]
         
         # Save File Dialog
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Monthly Report", 
-            f"Budget_Report_{month_str}.pdf",
+            self, "Save Report", 
+            f"Budget_Report_{period}.pdf",
             "PDF Files (*.pdf)"
         )
         
         if file_path:
-            try:
-                data = self.controller.get_report_data(month_str)
-                # Debug Check
-                print(f"Exporting {month_str}: {len(data['transactions'])} transactions found.")
-                
-                if PDFExporter.export_monthly_report(data, file_path):
-                    QMessageBox.information(self, "Success", f"Report saved successfully to:\n{file_path}")
-                else:
-                    QMessageBox.critical(self, "Error", "Failed to generate PDF report.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error during export: {str(e)}")
-
-
-
-
+            job_id = self.exports.submit(period, file_path)
+            self._export_jobs[job_id] = period
+            self._show_export_dialog()
+
+    def _show_export_dialog(self):
+        """Non-modal progress dialog shared by all queued exports."""
+        if self._export_dialog is None:
+            self._export_dialog = QProgressDialog(self)
+            self._export_dialog.setWindowTitle("Exporting Report")
+            self._export_dialog.setWindowModality(Qt.NonModal)
+            self._export_dialog.setAutoClose(False)
+            self._export_dialog.setAutoReset(False)
+            self._export_dialog.setMinimumDuration(0)
+            self._export_dialog.canceled.connect(self._cancel_export)
+        if self._export_current is None:
+            self._export_dialog.setMaximum(0)
+            self._update_export_label("Waiting...")
+        self._export_dialog.show()
+
+    def _update_export_label(self, text):
+        period = self._export_jobs.get(self._export_current, "")
+        queued = len(self._export_jobs) - 1
+        suffix = f"\n({queued} more queued)" if queued > 0 else ""
+        self._export_dialog.setLabelText(f"{period}: {text}{suffix}" if period else text + suffix)
+
+    def _cancel_export(self):
+        # Cancel the running export; the next queued one starts afterwards
+        if self._export_current is not None:
+            self.exports.cancel(self._export_current)
+
+    def _on_export_progress(self, job_id, phase, current, total):
+        self._export_current = job_id
+        if not self._export_dialog:
+            return
+        self._export_dialog.setMaximum(total)
+        self._export_dialog.setValue(min(current, total))
+        self._update_export_label(describe_progress(phase, current, total))
+
+    def _on_export_done(self, job_id):
+        self._export_jobs.pop(job_id, None)
+        if job_id == self._export_current:
+            self._export_current = None
+        if self._export_dialog and not self._export_jobs:
+            self._export_dialog.reset()
+            self._export_dialog.hide()
+
+    def _on_export_finished(self, job_id, file_path):
+        self._on_export_done(job_id)
+        QMessageBox.information(self, "Success", f"Report saved successfully to:\n{file_path}")
+
+    def _on_export_failed(self, job_id, message):
+        self._on_export_done(job_id)
+        QMessageBox.critical(self, "Error", f"Error during export: {message}")
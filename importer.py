@@ -0,0 +1,203 @@
+import csv
+import os
+import re
+import rollups
+from datetime import date, datetime
+from itertools import islice
+from models import Money
+
+BATCH_SIZE = 5000
+DEFAULT_CATEGORY = "Imported"
+
+# Date formats accepted in CSV files, tried in order
+CSV_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%Y/%m/%d")
+
+OFX_TAG = re.compile(r"<(\w+)>([^<\r\n]*)")
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
+
+def parse_date(value: str) -> str:
+    """Normalizes a CSV date to YYYY-MM-DD, raising ValueError if unrecognised."""
+    value = value.strip()
+    if ISO_DATE.match(value):
+        # Already stored format; fromisoformat is a cheap check that the day exists
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            raise ValueError(f"Unrecognised date: {value!r}") from None
+        return value
+    for fmt in CSV_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised date: {value!r}")
+
+
+def normalize_row(date: str, amount: str, category: str, type: str = None, note: str = "", account: str = None):
+    """Builds a (date, amount, category, type, note, account) tuple.
+
+    `amount` is in dollars as written in the file and comes back as Money
+    (cents). Without an explicit type the sign of the amount decides:
+    negative amounts are expenses. Stored amounts are always positive, like
+    add_transaction.
+    """
+    amount = Money.parse(amount)
+    if type not in ("Income", "Expense"):
+        type = "Expense" if amount < 0 else "Income"
+    category = (category or "").strip() or DEFAULT_CATEGORY
+    return (date, abs(amount), category, type, note or "", account or None)
+
+
+def read_csv_rows(file_path: str):
+    """Yields normalized rows from a CSV file with a header row.
+
+    Recognised columns (case-insensitive): date, amount, category, type, note
+    and account (an account name, overriding the importer's target account).
+    Rows that cannot be parsed are yielded as None so callers can count them.
+    """
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        for raw in reader:
+            row = {(k or "").strip().lower(): (v or "").strip() for k, v in raw.items()}
+            try:
+                yield normalize_row(parse_date(row["date"]), row["amount"], row.get("category"),
+                                    row.get("type", "").capitalize(), row.get("note", ""),
+                                    row.get("account"))
+            except (KeyError, ValueError):
+                yield None
+
+
+def read_ofx_rows(file_path: str):
+    """Yields normalized rows from the <STMTTRN> blocks of an OFX file.
+
+    Handles both SGML (unclosed tags) and XML flavoured OFX, one tag per line.
+    """
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        fields = None
+        for line in f:
+            line = line.strip()
+            upper = line.upper()
+            if upper.startswith("<STMTTRN>"):
+                fields = {}
+            elif upper.startswith("</STMTTRN>"):
+                if fields is not None:
+                    yield _ofx_row(fields)
+                fields = None
+            elif fields is not None:
+                match = OFX_TAG.match(line)
+                if match:
+                    fields[match.group(1).upper()] = match.group(2).strip()
+
+
+def _ofx_row(fields: dict):
+    try:
+        date = datetime.strptime(fields["DTPOSTED"][:8], "%Y%m%d").strftime("%Y-%m-%d")
+        note = fields.get("MEMO") or fields.get("NAME", "")
+        return normalize_row(date, fields["TRNAMT"], fields.get("CATEGORY"), None, note)
+    except (KeyError, ValueError):
+        return None
+
+
+def batched(iterable, size: int):
+    """Yields lists of up to `size` items from iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class TransactionImporter:
+    """Bulk-inserts transactions inside a single unit of work.
+
+    Rows are streamed in batches through executemany. Categories and account
+    names are loaded once up front as {name: id}; only unseen categories are
+    inserted (or un-hidden), once each.
+    Balance and monthly rollup changes are summed in memory and applied once
+    at the end.
+    """
+
+    READERS = {
+        ".csv": read_csv_rows,
+        ".ofx": read_ofx_rows,
+        ".qfx": read_ofx_rows,
+    }
+
+    def __init__(self, db, batch_size: int = BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+
+    def import_file(self, file_path: str, account_id: int) -> dict:
+        """Imports a CSV or OFX file, chosen by extension."""
+        ext = os.path.splitext(file_path)[1].lower()
+        reader = self.READERS.get(ext)
+        if reader is None:
+            raise ValueError(f"Unsupported import format: {ext or file_path}")
+        return self.import_rows(reader(file_path), account_id)
+
+    @staticmethod
+    def _add_category(conn, name: str) -> int:
+        """Creates a category, or shows a hidden one again; returns its id."""
+        conn.execute("INSERT INTO categories (name) VALUES (?) ON CONFLICT (name) DO UPDATE SET hidden = 0", (name,))
+        return conn.execute("SELECT id FROM categories WHERE name = ?", (name,)).fetchone()["id"]
+
+    def import_rows(self, rows, account_id: int) -> dict:
+        """Imports an iterable of (date, amount, category, type, note, account) tuples.
+
+        Amounts are positive int cents, as produced by normalize_row. Rows without an account name go to `account_id`. None entries and rows
+        naming an unknown account are counted as skipped. Returns
+        {"imported": int, "skipped": int, "new_categories": [str], "balance_changes": {account_id: cents}}.
+        """
+        imported = skipped = 0
+        balance_changes = {}
+        rollup_deltas = {}
+        new_categories = []
+
+        with self.db.transaction() as conn:
+            category_ids = {row["name"]: row["id"]
+                            for row in conn.execute("SELECT id, name FROM categories WHERE hidden = 0")}
+            account_ids = {row["name"]: row["id"] for row in conn.execute("SELECT id, name FROM accounts")}
+
+            for batch in batched(rows, self.batch_size):
+                params = []
+                for row in batch:
+                    if row is None:
+                        skipped += 1
+                        continue
+                    date, amount, category, type, note, account = row
+                    target = account_ids.get(account) if account else account_id
+                    if target is None:
+                        skipped += 1
+                        continue
+                    category_id = category_ids.get(category)
+                    if category_id is None:
+                        category_id = category_ids[category] = self._add_category(conn, category)
+                        new_categories.append(category)
+                    delta = amount if type == "Income" else -amount
+                    balance_changes[target] = balance_changes.get(target, 0) + delta
+                    key = rollups.rollup_key(date, target, category_id, type)
+                    total, count = rollup_deltas.get(key, (0, 0))
+                    rollup_deltas[key] = (total + amount, count + 1)
+                    params.append((target, date, amount, category_id, type, note))
+
+                conn.executemany(
+                    """INSERT INTO transactions (account_id, date, amount, category_id, type, note)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    params
+                )
+                imported += len(params)
+
+            conn.executemany(
+                "UPDATE accounts SET balance = balance + ? WHERE id = ?",
+                [(delta, acc_id) for acc_id, delta in balance_changes.items()]
+            )
+            rollups.apply_deltas(conn, rollup_deltas)
+
+        return {
+            "imported": imported,
+            "skipped": skipped,
+            "new_categories": new_categories,
+            "balance_changes": balance_changes,
+        }
@@ -0,0 +1,339 @@
+"""Versioned schema migrations tracked with PRAGMA user_version.
+
+Each migration is a (version, description, function) entry in MIGRATIONS.
+To evolve the schema, append a new entry with the next version number and
+never edit one that has already shipped. Pending migrations run in order,
+each in its own transaction together with the user_version bump, so a
+failure leaves the database at the last good version.
+"""
+import sqlite3
+import uuid
+
+DEFAULT_CATEGORIES = ["Food", "Rent", "Salary", "Entertainment", "Transport", "Shopping", "Utilities", "Health"]
+
+
+def _create_base_schema(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS accounts (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            balance REAL DEFAULT 0.0
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS transactions (
+            id TEXT PRIMARY KEY,
+            account_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            amount REAL NOT NULL,
+            category TEXT,
+            type TEXT,
+            note TEXT,
+            FOREIGN KEY (account_id) REFERENCES accounts (id) ON DELETE CASCADE
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS categories (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        )
+    """)
+
+    # Seed Default Categories if empty
+    if conn.execute("SELECT COUNT(*) FROM categories").fetchone()[0] == 0:
+        conn.executemany(
+            "INSERT INTO categories (id, name) VALUES (?, ?)",
+            [(uuid.uuid4().hex, cat) for cat in DEFAULT_CATEGORIES]
+        )
+
+
+def _add_transaction_indexes(conn):
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_transactions_account_date ON transactions (account_id, date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_transactions_type_date ON transactions (type, date)")
+
+
+def _add_monthly_rollups(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS monthly_rollups (
+            month TEXT NOT NULL,
+            account_id TEXT NOT NULL,
+            category TEXT NOT NULL DEFAULT '',
+            type TEXT NOT NULL DEFAULT '',
+            total REAL NOT NULL DEFAULT 0.0,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (month, account_id, category, type)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("DELETE FROM monthly_rollups")
+    conn.execute("""
+        INSERT INTO monthly_rollups (month, account_id, category, type, total, count)
+        SELECT substr(date, 1, 7), account_id, COALESCE(category, ''), COALESCE(type, ''),
+               SUM(amount), COUNT(*)
+        FROM transactions
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def _store_money_as_cents(conn):
+    # Column types cannot be altered in place: rebuild each table with
+    # INTEGER columns and copy the rounded cents across
+    conn.execute("""
+        CREATE TABLE accounts_new (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            balance INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("""
+        INSERT INTO accounts_new (id, name, balance)
+        SELECT id, name, CAST(round(COALESCE(balance, 0) * 100) AS INTEGER) FROM accounts
+    """)
+    conn.execute("DROP TABLE accounts")
+    conn.execute("ALTER TABLE accounts_new RENAME TO accounts")
+
+    conn.execute("""
+        CREATE TABLE transactions_new (
+            id TEXT PRIMARY KEY,
+            account_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            category TEXT,
+            type TEXT,
+            note TEXT,
+            FOREIGN KEY (account_id) REFERENCES accounts (id) ON DELETE CASCADE
+        )
+    """)
+    conn.execute("""
+        INSERT INTO transactions_new (id, account_id, date, amount, category, type, note)
+        SELECT id, account_id, date, CAST(round(amount * 100) AS INTEGER), category, type, note
+        FROM transactions
+    """)
+    conn.execute("DROP TABLE transactions")
+    conn.execute("ALTER TABLE transactions_new RENAME TO transactions")
+    _add_transaction_indexes(conn)
+
+    conn.execute("DROP TABLE monthly_rollups")
+    conn.execute("""
+        CREATE TABLE monthly_rollups (
+            month TEXT NOT NULL,
+            account_id TEXT NOT NULL,
+            category TEXT NOT NULL DEFAULT '',
+            type TEXT NOT NULL DEFAULT '',
+            total INTEGER NOT NULL DEFAULT 0,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (month, account_id, category, type)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        INSERT INTO monthly_rollups (month, account_id, category, type, total, count)
+        SELECT substr(date, 1, 7), account_id, COALESCE(category, ''), COALESCE(type, ''),
+               SUM(amount), COUNT(*)
+        FROM transactions
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def _use_integer_keys(conn):
+    # Old rows keep their implicit rowid as the new INTEGER PRIMARY KEY, so
+    # no mapping table is needed. Transactions whose account was deleted
+    # before foreign keys were enforced are dropped by the join.
+    # AUTOINCREMENT keeps SQLite from handing a deleted row's id out again,
+    # which exports, events and id-keyed views would confuse with the old row.
+    conn.execute("""
+        CREATE TABLE accounts_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            balance INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    conn.execute("INSERT INTO accounts_new (id, name, balance) SELECT rowid, name, balance FROM accounts")
+
+    conn.execute("""
+        CREATE TABLE transactions_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            account_id INTEGER NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+            date TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            category TEXT,
+            type TEXT,
+            note TEXT
+        )
+    """)
+    conn.execute("""
+        INSERT INTO transactions_new (id, account_id, date, amount, category, type, note)
+        SELECT t.rowid, a.rowid, t.date, t.amount, t.category, t.type, t.note
+        FROM transactions t JOIN accounts a ON a.id = t.account_id
+    """)
+
+    conn.execute("""
+        CREATE TABLE categories_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE
+        )
+    """)
+    conn.execute("INSERT INTO categories_new (id, name) SELECT rowid, name FROM categories")
+
+    for table in ("transactions", "accounts", "categories"):
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    _add_transaction_indexes(conn)
+
+    conn.execute("DROP TABLE monthly_rollups")
+    conn.execute("""
+        CREATE TABLE monthly_rollups (
+            month TEXT NOT NULL,
+            account_id INTEGER NOT NULL,
+            category TEXT NOT NULL DEFAULT '',
+            type TEXT NOT NULL DEFAULT '',
+            total INTEGER NOT NULL DEFAULT 0,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (month, account_id, category, type)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        INSERT INTO monthly_rollups (month, account_id, category, type, total, count)
+        SELECT substr(date, 1, 7), account_id, COALESCE(category, ''), COALESCE(type, ''),
+               SUM(amount), COUNT(*)
+        FROM transactions
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def _reference_categories_by_id(conn):
+    # Deleted categories stay as hidden rows, so transactions keep their name
+    conn.execute("ALTER TABLE categories ADD COLUMN hidden INTEGER NOT NULL DEFAULT 0")
+    conn.execute("""
+        INSERT OR IGNORE INTO categories (name, hidden)
+        SELECT DISTINCT category, 1 FROM transactions WHERE category IS NOT NULL AND category != ''
+    """)
+
+    conn.execute("""
+        CREATE TABLE transactions_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            account_id INTEGER NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+            date TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            category_id INTEGER REFERENCES categories (id),
+            type TEXT,
+            note TEXT
+        )
+    """)
+    conn.execute("""
+        INSERT INTO transactions_new (id, account_id, date, amount, category_id, type, note)
+        SELECT t.id, t.account_id, t.date, t.amount, c.id, t.type, t.note
+        FROM transactions t LEFT JOIN categories c ON c.name = t.category
+    """)
+    conn.execute("DROP TABLE transactions")
+    conn.execute("ALTER TABLE transactions_new RENAME TO transactions")
+    _add_transaction_indexes(conn)
+
+    conn.execute("DROP TABLE monthly_rollups")
+    conn.execute("""
+        CREATE TABLE monthly_rollups (
+            month TEXT NOT NULL,
+            account_id INTEGER NOT NULL,
+            category_id INTEGER NOT NULL DEFAULT 0,
+            type TEXT NOT NULL DEFAULT '',
+            total INTEGER NOT NULL DEFAULT 0,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (month, account_id, category_id, type)
+        ) WITHOUT ROWID
+    """)
+    conn.execute("""
+        INSERT INTO monthly_rollups (month, account_id, category_id, type, total, count)
+        SELECT substr(date, 1, 7), account_id, COALESCE(category_id, 0), COALESCE(type, ''),
+               SUM(amount), COUNT(*)
+        FROM transactions
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+# ISO 8601 weeks run Monday to Sunday and belong to the year of their
+# Thursday, which is three days before the week's Sunday ('weekday 0')
+ISO_THURSDAY = "date, 'weekday 0', '-3 days'"
+
+
+def _add_time_buckets(conn):
+    # Stored generated columns can't be added with ALTER TABLE; rebuild
+    conn.execute(f"""
+        CREATE TABLE transactions_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            account_id INTEGER NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+            date TEXT NOT NULL,
+            amount INTEGER NOT NULL,
+            category_id INTEGER REFERENCES categories (id),
+            type TEXT,
+            note TEXT,
+            year INTEGER GENERATED ALWAYS AS (CAST(substr(date, 1, 4) AS INTEGER)) STORED,
+            month TEXT GENERATED ALWAYS AS (substr(date, 1, 7)) STORED,
+            week TEXT GENERATED ALWAYS AS (
+                strftime('%Y', {ISO_THURSDAY}) || printf('-W%02d', (strftime('%j', {ISO_THURSDAY}) + 6) / 7)
+            ) STORED,
+            day INTEGER GENERATED ALWAYS AS (CAST(substr(date, 9, 2) AS INTEGER)) STORED
+        )
+    """)
+    conn.execute("""
+        INSERT INTO transactions_new (id, account_id, date, amount, category_id, type, note)
+        SELECT id, account_id, date, amount, category_id, type, note FROM transactions
+    """)
+    conn.execute("DROP TABLE transactions")
+    conn.execute("ALTER TABLE transactions_new RENAME TO transactions")
+    _add_transaction_indexes(conn)
+    # Day of month is only grouped within a date range, which idx_transactions_date narrows
+    conn.execute("CREATE INDEX idx_transactions_year ON transactions (year)")
+    conn.execute("CREATE INDEX idx_transactions_month ON transactions (month)")
+    conn.execute("CREATE INDEX idx_transactions_week ON transactions (week)")
+
+
+MIGRATIONS = [
+    (1, "Base accounts/transactions/categories schema", _create_base_schema),
+    (2, "Indexes for date, account and type filters on transactions", _add_transaction_indexes),
+    (3, "Materialized monthly_rollups table", _add_monthly_rollups),
+    (4, "Integer cents for balances, amounts and rollup totals", _store_money_as_cents),
+    (5, "INTEGER PRIMARY KEY ids instead of uuid4 hex text", _use_integer_keys),
+    (6, "Transactions reference categories by id; deleted categories are hidden", _reference_categories_by_id),
+    (7, "Stored year, month, ISO week and day-of-month columns on transactions", _add_time_buckets),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_version(conn) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn, target: int = LATEST_VERSION) -> list:
+    """Applies pending migrations up to `target` and returns the versions applied.
+
+    Databases created before versioning report user_version 0; the base
+    schema migration uses IF NOT EXISTS so it is safe to run on them.
+    """
+    current = get_version(conn)
+    if current > LATEST_VERSION:
+        raise sqlite3.DatabaseError(
+            f"Database schema version {current} is newer than this app supports ({LATEST_VERSION})"
+        )
+
+    applied = []
+    # Table rebuilds must not cascade deletes, and the PRAGMA is a no-op
+    # inside a transaction, so foreign keys are switched off around the run
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    conn.execute("PRAGMA foreign_keys = OFF")
+    try:
+        for version, _description, apply in MIGRATIONS:
+            if version <= current or version > target:
+                continue
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                apply(conn)
+                # PRAGMA arguments cannot be bound parameters; version is always an int
+                conn.execute(f"PRAGMA user_version = {int(version)}")
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            applied.append(version)
+    finally:
+        conn.execute(f"PRAGMA foreign_keys = {int(foreign_keys)}")
+    return applied
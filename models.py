@@ -1,18 +1,95 @@
-from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import NamedTuple
 
-@dataclass
-class Account:
-    id: str
+CENT = Decimal("0.01")
+
+
+class Money(int):
+    """An exact amount of money, held as an integer number of cents.
+
+    Balances, transaction amounts and every aggregate are stored, summed and
+    returned as plain int cents. Money converts only at the edges: parse()
+    turns user or file input into cents, and str()/format() show dollars, so
+    f"{Money(cents):,.2f}" renders "1,234.50". Adding or subtracting Money
+    and ints keeps Money; mixing in a float is a TypeError.
+    """
+    __slots__ = ()
+
+    def __new__(cls, cents=0):
+        # Only exact integers: int() would silently truncate a float or Decimal
+        if not isinstance(cents, int):
+            raise TypeError(f"Money takes integer cents, not {type(cents).__name__}; "
+                            "use Money.parse() for dollar amounts")
+        return super().__new__(cls, cents)
+
+    @classmethod
+    def parse(cls, value) -> "Money":
+        """Dollars as text, Decimal or float -> Money, rounded half up to the cent.
+
+        Text may contain thousands separators and a leading "$".
+        """
+        if isinstance(value, str):
+            value = value.strip().replace(",", "").replace("$", "")
+        try:
+            dollars = Decimal(str(value) if isinstance(value, float) else value)
+        except InvalidOperation:
+            raise ValueError(f"Not an amount of money: {value!r}") from None
+        if not dollars.is_finite():
+            raise ValueError(f"Not an amount of money: {value!r}")
+        return cls(int(dollars.quantize(CENT, ROUND_HALF_UP).scaleb(2)))
+
+    @property
+    def dollars(self) -> Decimal:
+        return Decimal(int(self)).scaleb(-2)
+
+    def __str__(self):
+        return f"{self.dollars:.2f}"
+
+    def __repr__(self):
+        return f"Money('{self}')"
+
+    def __format__(self, spec):
+        return format(self.dollars, spec) if spec else str(self)
+
+    def _int_op(op):
+        def method(self, other):
+            if isinstance(other, float):
+                raise TypeError("cannot mix Money with float; use Money.parse() first")
+            result = op(int(self), other)
+            return Money(result) if isinstance(result, int) else result
+        return method
+
+    __add__ = _int_op(int.__add__)
+    __radd__ = _int_op(int.__radd__)
+    __sub__ = _int_op(int.__sub__)
+    __rsub__ = _int_op(int.__rsub__)
+    __mul__ = _int_op(int.__mul__)
+    __rmul__ = _int_op(int.__rmul__)
+    del _int_op
+
+    def __neg__(self):
+        return Money(-int(self))
+
+    def __abs__(self):
+        return Money(abs(int(self)))
+
+
+# Column order of Account; SELECT these to build accounts with Account._make
+ACCOUNT_COLUMNS = "id, name, balance"
+
+class Account(NamedTuple):
+    """Immutable, tuple-backed account row."""
+    id: int
     name: str
-    balance: float
+    balance: int  # cents
 
     @staticmethod
     def from_dict(data):
         return Account(
             id=data.get("id"),
             name=data.get("name"),
-            balance=data.get("balance", 0.0)
+            balance=data.get("balance", 0)
         )
 
 # Re-export Transaction
-from models_transaction import Transaction
+from models_transaction import Transaction, TRANSACTION_COLUMNS, TRANSACTION_SOURCE
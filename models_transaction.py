@@ -1,11 +1,22 @@
-from dataclasses import dataclass
+from typing import NamedTuple
 
-@dataclass
-class Transaction:
-    id: str
-    account_id: str
+# Column order of Transaction; SELECT these FROM TRANSACTION_SOURCE to build
+# transactions with Transaction._make. Rows store a category id; the join
+# turns it back into the name.
+TRANSACTION_COLUMNS = "transactions.id, account_id, date, amount, categories.name AS category, type, note"
+TRANSACTION_SOURCE = "transactions LEFT JOIN categories ON categories.id = category_id"
+
+class Transaction(NamedTuple):
+    """Immutable, tuple-backed transaction row.
+
+    Instances carry no per-object __dict__, and Transaction._make(row)
+    turns a cursor tuple selected with TRANSACTION_COLUMNS into a
+    transaction without an intermediate dict.
+    """
+    id: int
+    account_id: int
     date: str
-    amount: float
+    amount: int  # cents
     category: str
     type: str # "Income" or "Expense"
     note: str
@@ -16,7 +27,7 @@ class Transaction:
             id=data.get("id"),
             account_id=data.get("account_id"),
             date=data.get("date"),
-            amount=data.get("amount", 0.0),
+            amount=data.get("amount", 0),
             category=data.get("category", ""),
             type=data.get("type", "Expense"),
             note=data.get("note", "")
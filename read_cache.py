@@ -0,0 +1,124 @@
+import functools
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 128
+
+# Pass to @invalidates to drop every cached entry
+ALL = "*"
+
+
+class LoadFailed(Exception):
+    """Raised by a loader to hand `value` back to the caller without caching it."""
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+class ReadCache:
+    """A thread-safe LRU cache of controller query results.
+
+    Entries are keyed by (namespace, call arguments). Namespaces group
+    results that go stale together, so a write only drops what it affects.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so a load that raced a write is not stored
+        self._generation = 0
+
+    def get_or_load(self, namespace: str, key, loader):
+        """Returns the cached value for key, calling loader() on a miss.
+
+        A loader that raises LoadFailed has its value returned but not stored,
+        so the next call tries again.
+        """
+        full_key = (namespace, key)
+        with self._lock:
+            if full_key in self._entries:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return self._entries[full_key]
+            self.misses += 1
+            generation = self._generation
+
+        try:
+            value = loader()
+        except LoadFailed as failed:
+            return failed.value
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._entries[full_key] = value
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, *namespaces):
+        """Drops entries in the given namespaces, or everything for ALL."""
+        with self._lock:
+            self._generation += 1
+            if ALL in namespaces:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] in namespaces]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _copy_containers(value):
+    """Copies nested lists and dicts; the immutable rows inside are shared."""
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    return value
+
+
+def cached(namespace: str):
+    """Caches a controller read method's result in `self.cache` under namespace.
+
+    Results of calls during which a `self.db` read failed are returned but
+    not cached. Lists and dicts are copied at every level on the way out, so
+    callers cannot change the cached value through nested summaries either.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            def load():
+                failures = self.db.read_failures
+                value = method(self, *args, **kwargs)
+                if self.db.read_failures != failures:
+                    raise LoadFailed(value)
+                return value
+
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            value = self.cache.get_or_load(namespace, key, load)
+            return _copy_containers(value)
+        return wrapper
+    return decorator
+
+
+def invalidates(*namespaces):
+    """Drops the given cache namespaces after a controller write method runs."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.cache.invalidate(*namespaces)
+        return wrapper
+    return decorator
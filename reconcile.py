@@ -0,0 +1,52 @@
+def diff_ops(current, new, key):
+    """Returns the edits that turn list `current` into list `new`.
+
+    Items are matched by key(item). The result is a list of
+    ("remove", index), ("insert", index, item) and ("update", index, item)
+    operations which, applied in order, patch `current` in place; indices
+    refer to the list as it is at the time each operation runs. Rows whose
+    key and value are unchanged produce no operation at all, so adding one
+    transaction to a long list yields a single insert.
+    """
+    new_keys = {key(item) for item in new}
+    items = list(current)
+    ops = []
+
+    # Removals first, from the bottom so earlier indices stay valid
+    for i in range(len(items) - 1, -1, -1):
+        if key(items[i]) not in new_keys:
+            ops.append(("remove", i))
+            del items[i]
+
+    keys = [key(item) for item in items]
+    for i, item in enumerate(new):
+        k = key(item)
+        if i < len(items) and keys[i] == k:
+            if items[i] != item:
+                ops.append(("update", i, item))
+                items[i] = item
+            continue
+
+        # Moved (e.g. a transaction whose date changed): take it out first
+        if k in keys[i:]:
+            j = keys.index(k, i)
+            ops.append(("remove", j))
+            del items[j]
+            del keys[j]
+        ops.append(("insert", i, item))
+        items.insert(i, item)
+        keys.insert(i, k)
+
+    return ops
+
+
+def apply_ops(items: list, ops):
+    """Applies diff_ops output to a plain list; mainly useful for tests."""
+    for op in ops:
+        if op[0] == "remove":
+            del items[op[1]]
+        elif op[0] == "insert":
+            items.insert(op[1], op[2])
+        else:
+            items[op[1]] = op[2]
+    return items
@@ -0,0 +1,209 @@
+from datetime import datetime
+from html import escape
+from itertools import islice
+from models import Money
+
+# Rows per QTextDocument when laying out the transaction log. Each chunk is
+# built, paginated and painted before the next one is read, so memory stays
+# flat however long the log is.
+ROWS_PER_CHUNK = 500
+
+REPORT_CSS = """
+    body { font-family: sans-serif; color: #333; }
+    h1 { color: #5288c1; text-align: center; margin-bottom: 5px; }
+    .subtitle { text-align: center; color: #666; margin-bottom: 20px; font-size: 16px; font-weight: bold; }
+
+    table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
+    th { background-color: #f2f2f2; border: 1px solid #ddd; padding: 10px; text-align: left; font-weight: bold; }
+    td { border: 1px solid #ddd; padding: 8px; vertical-align: top; }
+
+    .summary-box { background-color: #f9f9f9; border: 1px solid #ddd; padding: 15px; text-align: center; }
+    .amount { font-size: 18px; font-weight: bold; display: block; margin-top: 5px; }
+    .income { color: #2e7d32; }
+    .expense { color: #c62828; }
+
+    h2 { border-bottom: 2px solid #5288c1; color: #5288c1; padding-bottom: 5px; margin-top: 30px; font-size: 18px; }
+    .text-right { text-align: right; }
+"""
+
+
+def chunked(iterable, size: int = ROWS_PER_CHUNK):
+    """Yields lists of up to `size` items without materializing the iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _signed(amount) -> str:
+    return f"{'+$' if amount >= 0 else '-$'}{abs(Money(amount)):,.2f}"
+
+
+def _month_label(month: str) -> str:
+    return datetime.strptime(month, "%Y-%m").strftime("%B %Y")
+
+
+def _summary_box(label, value_html, css_class=""):
+    return f"""
+                    <td style="border: none; width: 25%;">
+                        <div class="summary-box">
+                            <b>{label}</b><br/>
+                            <span class="amount {css_class}">{value_html}</span>
+                        </div>
+                    </td>"""
+
+
+def _summary_html(title, subtitle, summary) -> str:
+    net = summary["net_income"]
+    return "".join([
+        f"<h1>{escape(title)}</h1>",
+        f"<div class=\"subtitle\">{escape(subtitle)}</div>",
+        "<table style=\"width: 100%; border: none;\"><tr>",
+        _summary_box("Net Worth", f"${Money(summary['net_worth']):,.2f}"),
+        _summary_box("Income", f"+${Money(summary['income']):,.2f}", "income"),
+        _summary_box("Expenses", f"-${Money(summary['expenses']):,.2f}", "expense"),
+        _summary_box("Net Income", _signed(net), "income" if net >= 0 else "expense"),
+        "</tr></table>",
+    ])
+
+
+def category_table_html(categories) -> str:
+    """Expense categories, largest first, with their share of the total."""
+    parts = ["<table><thead><tr><th>Category</th><th class=\"text-right\">Amount</th>"
+             "<th class=\"text-right\">Percentage</th></tr></thead><tbody>"]
+    total_expense = sum(categories.values())
+    for cat, amount in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+        percentage = (amount / total_expense * 100) if total_expense > 0 else 0
+        parts.append(f"<tr><td>{escape(str(cat))}</td><td class=\"text-right\">${Money(amount):,.2f}</td>"
+                     f"<td class=\"text-right\">{percentage:.1f}%</td></tr>")
+    if not categories:
+        parts.append("<tr><td colspan='3' style='text-align:center;'>No expense data found.</td></tr>")
+    parts.append("</tbody></table>")
+    return "".join(parts)
+
+
+def header_html(data) -> str:
+    """Title, summary boxes and category breakdown of a monthly report."""
+    return (_summary_html("Budget App Report", f"Monthly Summary: {data['month']}", data["summary"])
+            + "<h2>Category Breakdown</h2>" + category_table_html(data["categories"])
+            + "<h2>Transaction Log</h2>")
+
+
+def year_over_year_html(months, previous_year) -> str:
+    """Per-month totals next to the same month a year earlier."""
+    parts = ["<table><thead><tr><th>Month</th><th class=\"text-right\">Income</th>"
+             "<th class=\"text-right\">Expenses</th><th class=\"text-right\">Net</th>"
+             "<th class=\"text-right\">Net Last Year</th><th class=\"text-right\">Change</th>"
+             "</tr></thead><tbody>"]
+    totals = dict.fromkeys(("income", "expenses", "net_income"), Money(0))
+    previous_total = Money(0)
+    rows = [(_month_label(m), months[m]["summary"], previous_year.get(m)) for m in months]
+    for label, summary, previous in rows:
+        for k in totals:
+            totals[k] += summary[k]
+        previous_total += previous["net_income"] if previous else 0
+    rows.append(("<b>Total</b>", totals, {"net_income": previous_total}))
+
+    for label, summary, previous in rows:
+        previous_net = previous["net_income"] if previous else 0
+        if previous_net:
+            change = f"{(summary['net_income'] - previous_net) / abs(previous_net) * 100:+.1f}%"
+        else:
+            change = "&mdash;"
+        parts.append(f"<tr><td>{label}</td><td class=\"text-right\">${Money(summary['income']):,.2f}</td>"
+                     f"<td class=\"text-right\">${Money(summary['expenses']):,.2f}</td>"
+                     f"<td class=\"text-right\">{_signed(summary['net_income'])}</td>"
+                     f"<td class=\"text-right\">{_signed(previous_net)}</td>"
+                     f"<td class=\"text-right\">{change}</td></tr>")
+    parts.append("</tbody></table>")
+    return "".join(parts)
+
+
+def transaction_table_html(transactions) -> str:
+    """One transaction log table; the header row repeats on every printed page."""
+    parts = ["<table><thead><tr><th>Date</th><th>Category</th><th>Note</th>"
+             "<th class=\"text-right\">Amount</th></tr></thead><tbody>"]
+    for t in transactions:
+        amount_str = f"+${Money(t.amount):,.2f}" if t.type == "Income" else f"-${Money(t.amount):,.2f}"
+        amount_style = 'color: #2e7d32;' if t.type == "Income" else 'color: #c62828;'
+        parts.append(f"<tr><td>{t.date}</td><td>{escape(t.category or '')}</td><td>{escape(t.note or '')}</td>"
+                     f"<td class=\"text-right\" style=\"{amount_style} font-weight: bold;\">{amount_str}</td></tr>")
+    if len(parts) == 1:
+        parts.append("<tr><td colspan='4' style='text-align:center;'>No transactions found.</td></tr>")
+    parts.append("</tbody></table>")
+    return "".join(parts)
+
+
+def footer_html() -> str:
+    return ("<div style=\"margin-top: 50px; text-align: center; color: #999; font-size: 12px;\">"
+            "Generated by Budget App</div>")
+
+
+def _log_sections(head, transactions, rows_per_chunk):
+    """Yields head plus the first chunk of the log, then one fragment per further chunk."""
+    chunks = chunked(transactions, rows_per_chunk)
+    yield head + transaction_table_html(next(chunks, []))
+    for chunk in chunks:
+        yield transaction_table_html(chunk)
+
+
+def _chunk_count(transactions, rows_per_chunk):
+    return max(1, -(-len(transactions) // rows_per_chunk))
+
+
+def section_count(data, rows_per_chunk: int = ROWS_PER_CHUNK):
+    """Number of fragments report_sections() yields, or None for an unsized transaction iterable."""
+    if not hasattr(data["transactions"], "__len__"):
+        return None
+    return _chunk_count(data["transactions"], rows_per_chunk)
+
+
+def range_section_count(data, rows_per_chunk: int = ROWS_PER_CHUNK):
+    """Number of fragments range_report_sections() yields, or None if any month's log is unsized."""
+    if not all(hasattr(m["transactions"], "__len__") for m in data["months"].values()):
+        return None
+    return 1 + sum(_chunk_count(m["transactions"], rows_per_chunk) for m in data["months"].values())
+
+
+def _with_footer(sections):
+    """Appends the footer to the last fragment instead of giving it a page of its own."""
+    previous = None
+    for html in sections:
+        if previous is not None:
+            yield previous
+        previous = html
+    yield (previous or "") + footer_html()
+
+
+def report_sections(data, rows_per_chunk: int = ROWS_PER_CHUNK):
+    """Yields a monthly report as HTML fragments, one per layout chunk.
+
+    The first fragment carries the header and the first rows of the log,
+    the last one the footer. data["transactions"] may be any iterable
+    (a list or a generator of pages); it is consumed one chunk at a time.
+    """
+    return _with_footer(_log_sections(header_html(data), data["transactions"], rows_per_chunk))
+
+
+def range_report_sections(data, rows_per_chunk: int = ROWS_PER_CHUNK):
+    """Yields a multi-month report (see MainController.get_range_report_data) as HTML fragments.
+
+    An overview with the year-over-year table comes first; every month
+    then starts a new fragment with its own summary, categories and log.
+    """
+    def sections():
+        yield (_summary_html("Budget App Report", f"Period: {data['period']}", data["summary"])
+               + "<h2>Month by Month</h2>" + year_over_year_html(data["months"], data["previous_year"])
+               + "<h2>Category Breakdown</h2>" + category_table_html(data["categories"]))
+        for month, section in data["months"].items():
+            summary = section["summary"]
+            head = "".join([
+                f"<h2>{_month_label(month)}</h2>",
+                f"<p>Income: +${Money(summary['income']):,.2f} &nbsp; Expenses: -${Money(summary['expenses']):,.2f}"
+                f" &nbsp; Net: {_signed(summary['net_income'])}</p>",
+                category_table_html(section["categories"]),
+            ])
+            yield from _log_sections(head, section["transactions"], rows_per_chunk)
+    return _with_footer(sections())
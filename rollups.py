@@ -0,0 +1,62 @@
+"""Incrementally maintained per-month totals of transactions.
+
+monthly_rollups holds one row per (month, account, category id, type) with the
+summed amount and number of transactions. Every write path that touches
+transactions applies the matching delta inside its own unit of work, so
+reports can read a handful of rollup rows instead of re-aggregating history.
+
+Rebuild from scratch with `python rollups.py [path/to/budget.db]`.
+"""
+import sys
+
+UPSERT_SQL = """
+    INSERT INTO monthly_rollups (month, account_id, category_id, type, total, count)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (month, account_id, category_id, type) DO UPDATE SET
+        total = total + excluded.total,
+        count = count + excluded.count
+"""
+
+REBUILD_SQL = """
+    INSERT INTO monthly_rollups (month, account_id, category_id, type, total, count)
+    SELECT month, account_id, COALESCE(category_id, 0), COALESCE(type, ''),
+           SUM(amount), COUNT(*)
+    FROM transactions
+    GROUP BY 1, 2, 3, 4
+"""
+
+
+def rollup_key(date: str, account_id: int, category_id: int, type: str):
+    """The monthly_rollups primary key a transaction contributes to; uncategorized is 0."""
+    return (date[:7], account_id, category_id or 0, type or "")
+
+
+def record(conn, date: str, account_id: int, category_id: int, type: str, amount: int, sign: int = 1):
+    """Adds (sign=1) or removes (sign=-1) one transaction from its rollup row."""
+    apply_deltas(conn, {rollup_key(date, account_id, category_id, type): (sign * amount, sign)})
+
+
+def apply_deltas(conn, deltas: dict):
+    """Applies {rollup_key: (total_delta, count_delta)} and drops emptied rows."""
+    if not deltas:
+        return
+    conn.executemany(UPSERT_SQL, [key + delta for key, delta in deltas.items()])
+    if any(count < 0 for _total, count in deltas.values()):
+        conn.execute("DELETE FROM monthly_rollups WHERE count <= 0")
+
+
+def rebuild(conn):
+    """Recomputes every rollup row from the transactions table."""
+    conn.execute("DELETE FROM monthly_rollups")
+    conn.execute(REBUILD_SQL)
+
+
+if __name__ == "__main__":
+    from database import DatabaseManager, DB_NAME
+
+    db = DatabaseManager(sys.argv[1] if len(sys.argv) > 1 else DB_NAME)
+    with db.transaction() as conn:
+        rebuild(conn)
+        count = conn.execute("SELECT COUNT(*) FROM monthly_rollups").fetchone()[0]
+    db.close()
+    print(f"Rebuilt {count} rollup rows in {db.db_name}")
@@ -1,11 +1,13 @@
 from PySide2.QtWidgets import QFrame, QVBoxLayout, QLabel
 from PySide2.QtCore import Qt
+from models import Money
 
-def format_currency(amount: float, currency_symbol: str = "TT$") -> str:
-    return f"{currency_symbol}{amount:,.2f}"
+def format_currency(amount: int, currency_symbol: str = "TT$") -> str:
+    """Formats an amount in cents."""
+    return f"{currency_symbol}{Money(amount):,.2f}"
 
 class StatCard(QFrame):
-    def __init__(self, title: str, value: float, color: str = None, parent=None):
+    def __init__(self, title: str, value: int, color: str = None, parent=None):
         super().__init__(parent)
         self.setObjectName("StatCard")
         self.setFixedSize(220, 120)
@@ -28,5 +30,5 @@ class StatCard(QFrame):
         layout.addStretch()
         layout.addWidget(self.valueLbl)
 
-    def updateValue(self, value: float):
+    def updateValue(self, value: int):
         self.valueLbl.setText(format_currency(value))
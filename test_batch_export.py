@@ -0,0 +1,25 @@
+import os
+import pytest
+from batch_export import plan_jobs, main
+
+
+def test_plan_jobs_expands_and_dedupes(tmp_path):
+    out = str(tmp_path)
+    assert plan_jobs(["2024-01", "2024-Q1"], out) == [
+        ("2024-01", os.path.join(out, "Budget_Report_2024-01.pdf")),
+        ("2024-Q1", os.path.join(out, "Budget_Report_2024-Q1.pdf")),
+    ]
+    monthly = plan_jobs(["2024-01", "2023-12..2024-02"], out, monthly=True)
+    assert [period for period, _ in monthly] == ["2024-01", "2023-12", "2024-02"]
+    (span,) = plan_jobs(["2024-01-05..2024-02-10"], out)
+    assert span[1].endswith("Budget_Report_2024-01-05_to_2024-02-10.pdf")
+
+
+def test_main_rejects_bad_input(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "missing.db"), "2024-01"])
+    db = tmp_path / "ledger.db"
+    db.touch()
+    with pytest.raises(SystemExit):
+        main([str(db), "2024-13"])
+    assert "2024-13" in capsys.readouterr().err
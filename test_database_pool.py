@@ -0,0 +1,106 @@
+import sqlite3
+import threading
+import pytest
+from database import DatabaseManager, ConnectionPool
+
+
+def test_pool_reuses_connection(tmp_path):
+    db = DatabaseManager(str(tmp_path / "pool.db"), pool_size=2)
+    for _ in range(20):
+        db.fetch_one("SELECT COUNT(*) as count FROM categories")
+        db.execute_query("UPDATE categories SET name = name")
+    assert db.pool.opened == 1
+    db.close()
+
+
+def test_nested_calls_share_thread_connection(tmp_path):
+    db = DatabaseManager(str(tmp_path / "pool.db"), pool_size=2)
+    with db.connection() as outer:
+        with db.connection() as inner:
+            assert inner is outer
+    db.close()
+
+
+def test_threads_get_separate_connections(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), pool_size=2)
+    seen = []
+    inside = threading.Barrier(2)
+
+    def worker():
+        with pool.connection() as conn:
+            seen.append(conn)
+            inside.wait(timeout=5)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(seen) == 2
+    assert seen[0] is not seen[1]
+    pool.close()
+
+
+def test_exhausted_pool_times_out(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "pool.db"), pool_size=1, timeout=0.05)
+    errors = []
+
+    with pool.connection():
+        def worker():
+            try:
+                with pool.connection():
+                    pass
+            except sqlite3.OperationalError as e:
+                errors.append(e)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+    assert len(errors) == 1
+    pool.close()
+
+
+def test_closed_pool_rejects_new_checkouts(controller):
+    controller.add_account("Closing", 10_00)
+    controller.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        with controller.db.pool.connection():
+            pass
+    # Query helpers keep their print-and-return-empty behavior.
+    assert controller.get_all_accounts() == []
+
+
+def test_unpooled_mode_still_works(make_controller):
+    controller = make_controller(pool_size=0)
+    acc = controller.add_account("Unpooled", 50_00)
+    assert controller.add_transaction(acc.id, "2024-01-02", 20_00, "Food", "Expense", "")
+    assert controller.get_all_accounts()[0].balance == 30_00
+    assert controller.db.pool is None
+
+
+def test_profiles_apply_pragmas(tmp_path):
+    path = str(tmp_path / "profiles.db")
+    db = DatabaseManager(path)
+    with db.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    db.close()
+
+    bulk = DatabaseManager(path, profile="bulk-load")
+    with bulk.connection() as conn:
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0  # OFF
+    bulk.close()
+    with pytest.raises(ValueError):
+        DatabaseManager(path, profile="turbo")
+
+
+def test_reporting_profile_is_read_only(make_controller):
+    make_controller("profiles.db").close()
+    reports = make_controller("profiles.db", profile="reporting")
+    assert reports.get_unique_categories()
+    assert reports.add_account("Nope", 0) is None
@@ -0,0 +1,67 @@
+import pytest
+from datetime import date
+from date_range import DateRange
+
+
+def test_parse_periods():
+    assert DateRange.parse("2024-12").bounds == ("2024-12-01", "2025-01-01")
+    assert DateRange.parse("2024-q2").bounds == ("2024-04-01", "2024-07-01")
+    assert DateRange.parse("2024").bounds == ("2024-01-01", "2025-01-01")
+    assert DateRange.parse("2024-01-15..2024-02-14").bounds == ("2024-01-15", "2024-02-15")
+    assert DateRange.parse("2023-11..2024-02").months() == ["2023-11", "2023-12", "2024-01", "2024-02"]
+    span = DateRange(date(2024, 1, 1), date(2024, 2, 1))
+    assert DateRange.parse(span) is span
+
+
+def test_parse_rejects_bad_input():
+    for bad in ("2024-13", "24-01", "2024-Q5", "2024-02-10..2024-02-01", "soon"):
+        with pytest.raises(ValueError):
+            DateRange.parse(bad)
+
+
+def test_sql_fragment_and_membership():
+    month = DateRange.month("2024-02")
+    assert month.sql("t.date") == ("t.date >= ? AND t.date < ?", ("2024-02-01", "2024-03-01"))
+    assert "2024-02-29" in month
+    assert "2024-03-01" not in month
+
+
+def test_reporting_methods_accept_ranges(controller):
+    acc = controller.add_account("Ranges", 0)
+    controller.add_transaction(acc.id, "2024-01-31", 10_00, "Food", "Expense", "")
+    controller.add_transaction(acc.id, "2024-02-01", 20_00, "Food", "Expense", "")
+    controller.add_transaction(acc.id, "2024-04-01", 5_00, "Rent", "Expense", "")
+
+    assert len(controller.get_transactions(month_str="2024-02")) == 1
+    assert controller.get_category_spending("2024-Q1") == {"Food": 30_00}
+    assert controller.get_monthly_summary("2024")["expenses"] == 35_00
+    assert controller.get_monthly_summary("2024-02") == {
+        "net_worth": -35_00, "income": 0, "expenses": 20_00, "net_income": -20_00
+    }
+    summaries = controller.get_monthly_summaries("2024-Q1")
+    assert list(summaries) == ["2024-01", "2024-02", "2024-03"]
+    assert summaries["2024-02"]["expenses"] == 20_00
+    assert summaries["2024-03"] == {"income": 0, "expenses": 0, "net_income": 0}
+    assert controller.get_daily_transaction_summary("2024-01") == {31: {"has_income": False, "has_expense": True}}
+
+
+def test_aggregate_groups_on_stored_time_buckets(controller):
+    acc = controller.add_account("Buckets", 0)
+    # 2024-12-30 falls in ISO week 1 of 2025
+    controller.add_transaction(acc.id, "2024-12-30", 10_00, "Food", "Expense", "")
+    controller.add_transaction(acc.id, "2024-12-30", 50_00, "Salary", "Income", "")
+    controller.add_transaction(acc.id, "2025-01-05", 5_00, "Food", "Expense", "")
+    controller.add_transaction(acc.id, "2025-01-06", 7_00, "Rent", "Expense", "")
+
+    assert controller.aggregate("2024-12-01..2025-01-31", bucket="week", type="Expense") == {
+        "2025-W01": 15_00, "2025-W02": 7_00}
+    assert controller.aggregate("2024-12-30..2025-01-06", bucket="year", by="type") == {
+        2024: {"Expense": 10_00, "Income": 50_00}, 2025: {"Expense": 12_00}}
+    # Whole months come from the rollups, with the same keys
+    assert controller.aggregate("2024-12..2025-01", bucket="year", by="category", type="Expense") == {
+        2024: {"Food": 10_00}, 2025: {"Food": 5_00, "Rent": 7_00}}
+    assert controller.aggregate("2025-01", bucket="day_of_month") == {5: 5_00, 6: 7_00}
+    assert controller.aggregate("2025-01", bucket="day", by="account") == {
+        "2025-01-05": {acc.id: 5_00}, "2025-01-06": {acc.id: 7_00}}
+    with pytest.raises(ValueError):
+        controller.aggregate("2025", bucket="fortnight")
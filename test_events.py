@@ -0,0 +1,100 @@
+from events import (EventBus, AccountAdded, AccountBalanceChanged, AccountEvent, CategoryCreated, CategoryRenamed,
+                    TransactionAdded, TransactionDeleted, TransactionUpdated, TransactionsImported)
+
+
+def _record(controller, event_type=None):
+    received = []
+    if event_type:
+        controller.events.subscribe(received.append, event_type)
+    else:
+        controller.events.subscribe(received.append)
+    return received
+
+
+def test_transaction_writes_publish_typed_events(controller):
+    acc = controller.add_account("Checking", 100_00)
+    events = _record(controller)
+
+    assert controller.add_transaction(acc.id, "2024-03-05", 20_00, "Brand New", "Expense", "")
+    assert [type(e) for e in events] == [CategoryCreated, TransactionAdded, AccountBalanceChanged]
+    added = events[1].transaction
+    assert (added.amount, added.category) == (20_00, "Brand New")
+
+    del events[:]
+    controller.update_transaction(added.id, {"account_id": acc.id, "date": "2024-03-06", "amount": 25_00,
+                                             "category": "Brand New", "type": "Expense", "note": ""})
+    assert [type(e) for e in events] == [TransactionUpdated, AccountBalanceChanged]
+    assert (events[0].old.amount, events[0].new.amount) == (20_00, 25_00)
+
+    del events[:]
+    controller.delete_transaction(added.id)
+    assert [type(e) for e in events] == [TransactionDeleted, AccountBalanceChanged]
+
+
+def test_subscribers_read_fresh_data(controller):
+    acc = controller.add_account("Checking", 100_00)
+    controller.get_all_accounts()  # Warm the cache
+    balances = []
+    controller.events.subscribe(lambda e: balances.append(controller.get_all_accounts()[0].balance),
+                                AccountBalanceChanged)
+
+    controller.add_transaction(acc.id, "2024-03-05", 30_00, "Food", "Expense", "")
+    assert balances == [70_00]
+
+
+def test_failed_and_unchanged_writes_publish_nothing(controller):
+    events = _record(controller)
+    assert not controller.delete_transaction(999)
+    assert not controller.add_transaction(None, "2024-03-05", 1_00, "Rolled Back", "Expense", "")
+    assert not controller.ensure_category_exists("Food")  # Seeded default
+    assert events == []
+    assert "Rolled Back" not in controller.get_unique_categories()
+
+
+def test_bulk_import_is_one_transaction_event(controller, tmp_path):
+    acc = controller.add_account("Checking", 0)
+    path = tmp_path / "bank.csv"
+    rows = "\n".join(f"2024-01-{i % 28 + 1:02d},{i}.00,Imported,Expense,row {i}" for i in range(500))
+    path.write_text("date,amount,category,type,note\n" + rows + "\n")
+    events = _record(controller)
+
+    controller.import_transactions(str(path), acc.id)
+    assert [type(e) for e in events] == [TransactionsImported, AccountBalanceChanged, CategoryCreated]
+    assert events[0].count == 500 and events[0].account_ids == (acc.id,)
+
+
+def test_rename_and_delete_keep_transaction_history(controller):
+    acc = controller.add_account("Checking", 0)
+    controller.add_transaction(acc.id, "2024-03-05", 12_00, "Food", "Expense", "")
+    events = _record(controller)
+
+    assert controller.rename_category("Food", "Groceries")
+    assert events == [CategoryRenamed("Food", "Groceries")]
+    assert [t.category for t in controller.get_transactions()] == ["Groceries"]
+    assert controller.get_category_spending("2024-03") == {"Groceries": 12_00}
+    assert not controller.rename_category("Groceries", "Rent")  # Name taken
+    assert not controller.rename_category("Nope", "Other")  # No such category
+    assert events == [CategoryRenamed("Food", "Groceries")]
+    assert "Other" not in controller.get_unique_categories()
+
+    assert controller.delete_category("Groceries")
+    assert "Groceries" not in controller.get_unique_categories()
+    assert [t.category for t in controller.get_transactions()] == ["Groceries"]
+    # Using the name again brings the same category back
+    controller.add_transaction(acc.id, "2024-03-06", 3_00, "Groceries", "Expense", "")
+    assert "Groceries" in controller.get_unique_categories()
+    assert controller.get_category_spending("2024-03") == {"Groceries": 15_00}
+
+
+def test_bus_filters_by_type_and_isolates_failures():
+    bus = EventBus()
+    accounts = []
+    bus.subscribe(lambda e: 1 / 0)
+    bus.subscribe(accounts.append, AccountEvent)
+    bus.publish(AccountAdded(None), CategoryCreated("x"))
+    assert [type(e) for e in accounts] == [AccountAdded]
+
+    bus.queue(AccountBalanceChanged(1))
+    assert len(accounts) == 1
+    bus.flush()
+    assert len(accounts) == 2
@@ -0,0 +1,45 @@
+import os
+from export_diagnostics import ExportDiagnostics, DEBUG_ENV, DATA_FETCH, PAINT, debug_html_path, diagnostics_enabled
+
+
+def test_debug_path_only_replaces_pdf_extension():
+    assert debug_html_path("out/report.pdf") == "out/report.debug.html"
+    assert debug_html_path("out/report.PDF") == "out/report.debug.html"
+    assert debug_html_path("my.pdf.files/report") == "my.pdf.files/report.debug.html"
+    assert debug_html_path("report.pdf.bak") == "report.pdf.bak.debug.html"
+
+
+def test_disabled_by_default(monkeypatch, tmp_path):
+    monkeypatch.delenv(DEBUG_ENV, raising=False)
+    assert not diagnostics_enabled()
+    monkeypatch.setenv(DEBUG_ENV, "yes")
+    assert diagnostics_enabled()
+    assert not diagnostics_enabled(False)
+
+    pdf = str(tmp_path / "report.pdf")
+    diagnostics = ExportDiagnostics(pdf, enabled=False)
+    diagnostics.write("<p>hidden</p>")
+    diagnostics.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_streams_html_and_records_timings(tmp_path):
+    pdf = str(tmp_path / "report.pdf")
+    diagnostics = ExportDiagnostics(pdf, enabled=True)
+    with diagnostics.phase(DATA_FETCH):
+        pass
+    diagnostics.write("<p>first</p>")
+    assert os.path.exists(diagnostics.path)  # Written as it goes, not at the end
+    with diagnostics.phase(PAINT):
+        diagnostics.write("<p>second</p>")
+    diagnostics.close()
+
+    with open(diagnostics.path, encoding="utf-8") as f:
+        html = f.read()
+    assert html.index("first") < html.index("second") < html.index("Export Timings")
+    assert all(name in html for name in ("data fetch", "html build", "layout", "paint"))
+
+    cancelled = ExportDiagnostics(str(tmp_path / "other.pdf"), enabled=True)
+    cancelled.write("<p>partial</p>")
+    cancelled.discard()
+    assert not os.path.exists(cancelled.path)
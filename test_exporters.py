@@ -0,0 +1,63 @@
+import csv
+import json
+import sys
+import pytest
+from exporters import EXPORTERS, CSVExporter, Exporter, JSONLinesExporter, export_transactions, get_exporter
+
+
+@pytest.fixture
+def controller(controller):
+    acc = controller.add_account("Checking", 0)
+    controller.add_transaction(acc.id, "2024-02-03", 1050, "Food", "Expense", 'say "hi", ok')
+    controller.add_transaction(acc.id, "2024-01-09", 9900, "Salary", "Income", "")
+    return controller
+
+
+def test_csv_and_jsonl_stream_from_cursor(controller, tmp_path):
+    csv_path = tmp_path / "all.csv"
+    assert export_transactions(controller, "csv", str(csv_path)) == 2
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["date"] for r in rows] == ["2024-01-09", "2024-02-03"]  # Oldest first
+    assert rows[1]["note"] == 'say "hi", ok' and rows[1]["amount"] == "10.50"
+
+    jsonl_path = tmp_path / "feb.jsonl"
+    assert export_transactions(controller, "JSONL", str(jsonl_path), month_str="2024-02") == 1
+    (line,) = jsonl_path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(line)["category"] == "Food" and json.loads(line)["amount"] == "10.50"
+
+
+def test_exporters_consume_rows_lazily():
+    consumed = []
+
+    def rows():
+        for i in range(3):
+            consumed.append(i)
+            yield (i, f"row {i}")
+
+    class Probe:
+        def __init__(self):
+            self.consumed_at_write = []
+
+        def write(self, text):
+            self.consumed_at_write.append(len(consumed))
+
+    for exporter in (CSVExporter(), JSONLinesExporter()):
+        consumed.clear()
+        probe = Probe()
+        assert exporter.write(["id", "note"], rows(), probe) == 3
+        # Each row is written before the next one is read
+        assert probe.consumed_at_write[0] <= 1
+        assert sorted(set(probe.consumed_at_write)) in ([0, 1, 2, 3], [1, 2, 3])
+
+
+def test_registry_and_no_qt():
+    assert set(EXPORTERS) >= {"csv", "jsonl"}
+    with pytest.raises(ValueError):
+        get_exporter("xlsx")
+    assert not any(name.startswith("PySide2") for name in sys.modules)
+
+    class NoWrite(Exporter):
+        format = "none"
+    with pytest.raises(TypeError):
+        NoWrite()
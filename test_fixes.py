@@ -17,7 +17,7 @@ class TestFixes(unittest.TestCase):
         self.assertTrue(hasattr(controller, 'delete_account'), "MainController missing delete_account method")
 
     def test_account_card_sizing(self):
-        card = AccountCard("test_id", "Test Account", 1000.0)
+        card = AccountCard("test_id", "Test Account", 100000)
         
         # Test Grid Mode (Default)
         card.set_view_mode("grid")
@@ -0,0 +1,84 @@
+import pytest
+from importer import TransactionImporter, read_csv_rows, read_ofx_rows
+
+CSV_DATA = """Date,Amount,Category,Note,Account
+2024-01-05,-12.50,Coffee,beans,
+05/01/2024,2000,Salary,january,
+2024-01-07,-40,Food,groceries,Savings
+not a date,-1,Food,,
+2024-01-08,-5,Food,,Unknown Account
+2024-02-30,-1,Food,,
+"""
+
+OFX_DATA = """OFXHEADER:100
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN>
+<TRNTYPE>DEBIT
+<DTPOSTED>20240210120000
+<TRNAMT>-25.00
+<NAME>Corner Shop
+</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20240215
+<TRNAMT>100.00
+<MEMO>Refund
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+
+def test_read_csv_rows(tmp_path):
+    path = tmp_path / "bank.csv"
+    path.write_text(CSV_DATA)
+    rows = list(read_csv_rows(str(path)))
+
+    assert rows[0] == ("2024-01-05", 12_50, "Coffee", "Expense", "beans", None)
+    assert rows[1] == ("2024-01-05", 2000_00, "Salary", "Income", "january", None)
+    assert rows[2][5] == "Savings"
+    assert rows[3] is None
+    assert rows[5] is None  # ISO shaped, but not a real day
+
+
+def test_read_ofx_rows(tmp_path):
+    path = tmp_path / "bank.ofx"
+    path.write_text(OFX_DATA)
+    rows = list(read_ofx_rows(str(path)))
+
+    assert rows == [
+        ("2024-02-10", 25_00, "Imported", "Expense", "Corner Shop", None),
+        ("2024-02-15", 100_00, "Imported", "Income", "Refund", None),
+    ]
+
+
+def test_import_file_updates_balances_and_categories(controller, tmp_path):
+    checking = controller.add_account("Checking", 100_00)
+    savings = controller.add_account("Savings", 100_00)
+    path = tmp_path / "bank.csv"
+    path.write_text(CSV_DATA)
+
+    result = TransactionImporter(controller.db, batch_size=2).import_file(str(path), checking.id)
+
+    assert result["imported"] == 3
+    assert result["skipped"] == 3
+    assert result["new_categories"] == ["Coffee"]
+    balances = {a.name: a.balance for a in controller.get_all_accounts()}
+    assert balances == {"Checking": 2087_50, "Savings": 60_00}
+    assert len(controller.get_transactions(savings.id)) == 1
+    assert "Coffee" in controller.get_unique_categories()
+
+
+def test_import_rejects_unknown_format(controller, tmp_path):
+    with pytest.raises(ValueError):
+        controller.import_transactions(str(tmp_path / "bank.xlsx"), 1)
+
+
+def test_database_errors_fail_the_import(controller, tmp_path):
+    path = tmp_path / "bank.csv"
+    path.write_text(CSV_DATA)
+    events = []
+    controller.events.subscribe(events.append)
+
+    assert controller.import_transactions(str(path), 999) is None  # No such account
+    assert events == [] and controller.get_transactions() == []
+    assert "Coffee" not in controller.get_unique_categories()
@@ -0,0 +1,33 @@
+import pytest
+from decimal import Decimal
+from models import Money
+
+
+def test_parse_and_format():
+    assert Money.parse("1,234.505") == 123451  # Half up, from the exact text
+    assert Money.parse(" $-12.5 ") == -1250 and Money.parse(0.1) == 10
+    assert f"{Money(123451):,.2f}" == "1,234.51" and str(Money(-5)) == "-0.05"
+    with pytest.raises(ValueError):
+        Money.parse("ten")
+    for not_cents in (10.5, Decimal("12.5"), "1250"):
+        with pytest.raises(TypeError):
+            Money(not_cents)
+    assert Money.parse(Decimal("12.5")) == 12_50
+
+
+def test_arithmetic_stays_exact_money():
+    total = sum([Money(10), Money(20)], Money(0)) - 5
+    assert type(total) is Money and total == 25
+    assert type(-total) is Money and abs(-total) == 25
+    with pytest.raises(TypeError):
+        Money(10) + 0.1
+
+
+def test_balances_do_not_drift(controller):
+    acc = controller.add_account("Cents", 0)
+    for _ in range(10):
+        controller.add_transaction(acc.id, "2024-01-02", Money.parse("0.10"), "Food", "Income", "")
+    assert controller.get_account(acc.id).balance == 100
+    assert controller.get_monthly_summary("2024-01")["income"] == Money.parse("1.00")
+    with pytest.raises(TypeError):
+        controller.add_transaction(acc.id, "2024-01-02", 0.1, "Food", "Income", "")
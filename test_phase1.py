@@ -15,7 +15,7 @@ def test_persistence():
     
     # 2. Add Account
     print("Adding account 'Test Bank'...")
-    acc = controller.add_account("Test Bank", 1000.50)
+    acc = controller.add_account("Test Bank", 1000_50)
     print(f"Added: {acc}")
     
     # 3. Verify it's in the list
@@ -32,7 +32,7 @@ def test_persistence():
     # 5. Verify persistence
     assert len(saved_accounts) == 1
     assert saved_accounts[0].name == "Test Bank"
-    assert saved_accounts[0].balance == 1000.50
+    assert saved_accounts[0].balance == 1000_50
     print("Verification 2 passed: Account persisted after restart.")
 
     print("Phase 1 Test Successful!")
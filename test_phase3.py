@@ -9,13 +9,13 @@ def test_transactions():
     controller = MainController()
     
     # 2. Add Account (if not exists)
-    acc = controller.add_account("Trans Test Bank", 500.00)
+    acc = controller.add_account("Trans Test Bank", 500_00)
     print(f"Added Account: {acc.name} with balance {acc.balance}")
     
     # 3. Add Expense
     print("Adding Expense of 100.00...")
     success = controller.add_transaction(
-        acc.id, "2023-10-27", 100.00, "Food", "Expense", "Lunch"
+        acc.id, "2023-10-27", 100_00, "Food", "Expense", "Lunch"
     )
     assert success, "Failed to add expense"
     
@@ -23,18 +23,18 @@ def test_transactions():
     updated_acc = controller.get_all_accounts()[-1] # Get last added
     assert updated_acc.id == acc.id
     print(f"New Balance: {updated_acc.balance}")
-    assert updated_acc.balance == 400.00, f"Expected 400.0, got {updated_acc.balance}"
+    assert updated_acc.balance == 400_00, f"Expected 40000 cents, got {updated_acc.balance}"
     
     # 5. Add Income
     print("Adding Income of 200.00...")
     success = controller.add_transaction(
-        acc.id, "2023-10-28", 200.00, "Salary", "Income", "Freelance"
+        acc.id, "2023-10-28", 200_00, "Salary", "Income", "Freelance"
     )
     assert success
     
     # 6. Verify Balance Update (400 + 200 = 600)
     updated_acc = controller.get_all_accounts()[-1]
-    assert updated_acc.balance == 600.00, f"Expected 600.0, got {updated_acc.balance}"
+    assert updated_acc.balance == 600_00, f"Expected 60000 cents, got {updated_acc.balance}"
     
     # 7. Verify Transaction History
     trans = controller.get_transactions(acc.id)
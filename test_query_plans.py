@@ -0,0 +1,155 @@
+import sqlite3
+import pytest
+from migrations import MIGRATIONS, LATEST_VERSION, get_version, migrate
+
+def _read_cursor(controller, month_str):
+    with controller.transaction_cursor(month_str=month_str) as cursor:
+        return cursor.fetchall()
+
+
+# Controller read paths that filter transactions. Listing the whole history
+# (get_transactions() without filters) is a full scan by definition and is
+# deliberately not included.
+CONTROLLER_QUERIES = {
+    "transactions_by_account": lambda c, acc: c.get_transactions(acc),
+    "transaction_by_id": lambda c, acc: c.get_transaction(c.get_transactions(acc)[0].id),
+    "transactions_by_ids": lambda c, acc: c.get_transactions_by_ids([1, 2]),
+    "transactions_page": lambda c, acc: c.get_transactions_page(month_str="2024-02", after=("2024-02-04", 2)),
+    "report_log": lambda c, acc: list(c.iter_transactions(month_str="2024-02", page_size=1)),
+    "transactions_for_day": lambda c, acc: c.get_transactions_for_day("2024-02-03"),
+    "date_range": lambda c, acc: c.get_transaction_date_range(),
+    "transactions_by_month": lambda c, acc: c.get_transactions(month_str="2024-02"),
+    "transactions_by_account_and_month": lambda c, acc: c.get_transactions(acc, "2024-02"),
+    "monthly_summary": lambda c, acc: c.get_monthly_summary("2024-02"),
+    "daily_summary": lambda c, acc: c.get_daily_transaction_summary("2024-02"),
+    "category_spending": lambda c, acc: c.get_category_spending("2024-02"),
+    "quarter_spending": lambda c, acc: c.get_category_spending("2024-Q1"),
+    "year_summary": lambda c, acc: c.get_monthly_summary("2024"),
+    "monthly_summaries": lambda c, acc: c.get_monthly_summaries("2023-11..2024-02"),
+    "custom_span_spending": lambda c, acc: c.get_category_spending("2024-02-03..2024-02-20"),
+    "monthly_category_spending": lambda c, acc: c.get_monthly_category_spending("2024"),
+    "range_report": lambda c, acc: c.get_range_report_data("2024-Q1"),
+    "export_cursor": lambda c, acc: _read_cursor(c, "2024-02"),
+    "aggregate_by_week": lambda c, acc: c.aggregate("2024-02-01..2024-03-15", bucket="week", by="category"),
+    "aggregate_by_year": lambda c, acc: c.aggregate("2023-06-15..2024-02-10", bucket="year", by="type"),
+    "aggregate_by_day": lambda c, acc: c.aggregate("2024-02", bucket="day", by="account"),
+}
+
+
+# Tables whose size grows with history and must never be fully scanned
+SCANNED_TABLES = ("transactions", "monthly_rollups")
+
+
+@pytest.fixture
+def controller(controller):
+    acc = controller.add_account("Plans", 0)
+    controller.add_transaction(acc.id, "2024-02-03", 10_00, "Food", "Expense", "")
+    controller.add_transaction(acc.id, "2024-02-04", 99_00, "Salary", "Income", "")
+    controller.acc_id = acc.id
+    return controller
+
+
+def _transaction_selects(controller, call):
+    statements = []
+    with controller.db.connection() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            call(controller, controller.acc_id)
+        finally:
+            conn.set_trace_callback(None)
+    return [s for s in statements if s.lstrip().upper().startswith("SELECT")
+            and any(table in s for table in SCANNED_TABLES)]
+
+
+def _full_scans(controller, sql):
+    with controller.db.connection() as conn:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    return [row["detail"] for row in plan
+            if any(row["detail"].startswith(f"SCAN {table}") for table in SCANNED_TABLES)]
+
+
+@pytest.mark.parametrize("name", list(CONTROLLER_QUERIES))
+def test_controller_query_uses_index(controller, name):
+    selects = _transaction_selects(controller, CONTROLLER_QUERIES[name])
+    assert selects, f"{name} issued no queries against {SCANNED_TABLES}"
+    for sql in selects:
+        assert not _full_scans(controller, sql), f"Full table scan in {name}: {sql}"
+
+
+def test_fresh_database_is_at_latest_version(controller):
+    with controller.db.connection() as conn:
+        assert get_version(conn) == LATEST_VERSION
+        assert conn.execute("SELECT COUNT(*) FROM monthly_rollups").fetchone()[0] == 2
+        indexes = {row["name"] for row in conn.execute("PRAGMA index_list(transactions)")}
+    assert {"idx_transactions_date", "idx_transactions_account_date", "idx_transactions_type_date",
+            "idx_transactions_year", "idx_transactions_month", "idx_transactions_week"} <= indexes
+
+
+def test_unversioned_database_is_upgraded(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE accounts (id TEXT PRIMARY KEY, name TEXT NOT NULL, balance REAL DEFAULT 0.0)")
+    conn.execute("INSERT INTO accounts VALUES ('a1', 'Legacy', 12.5)")
+    conn.execute("""CREATE TABLE transactions (id TEXT PRIMARY KEY, account_id TEXT NOT NULL, date TEXT NOT NULL,
+                    amount REAL NOT NULL, category TEXT, type TEXT, note TEXT)""")
+    conn.execute("INSERT INTO transactions VALUES ('t1', 'a1', '2024-01-02', 0.1, 'Food', 'Expense', '')")
+    conn.execute("INSERT INTO transactions VALUES ('t2', 'gone', '2024-01-03', 5, 'Food', 'Expense', '')")
+    conn.execute("INSERT INTO transactions VALUES ('t3', 'a1', '2024-01-04', 1, 'Old Stuff', 'Expense', '')")
+    conn.commit()
+
+    assert migrate(conn) == [version for version, _, _ in MIGRATIONS]
+    assert get_version(conn) == LATEST_VERSION
+    assert migrate(conn) == []
+    (account,) = conn.execute("SELECT id, name, balance FROM accounts").fetchall()
+    assert tuple(account) == (1, "Legacy", 12_50)
+    # Re-keyed to the account's integer id; the orphaned row is dropped.
+    # Category names no longer offered come back as hidden categories.
+    rows = conn.execute("""SELECT t.id, account_id, amount, c.name, c.hidden
+                           FROM transactions t JOIN categories c ON c.id = t.category_id ORDER BY t.id""").fetchall()
+    assert [tuple(row) for row in rows] == [(1, 1, 10, "Food", 0), (3, 1, 1_00, "Old Stuff", 1)]
+    conn.close()
+
+
+def test_deleted_ids_are_not_reused(controller):
+    acc = controller.get_account(controller.acc_id)
+    last = max(t.id for t in controller.get_transactions())
+    assert controller.delete_transaction(last)
+    controller.add_transaction(acc.id, "2024-02-05", 1_00, "Food", "Expense", "")
+    assert max(t.id for t in controller.get_transactions()) == last + 1
+
+    assert controller.delete_account(acc.id)
+    assert controller.add_account("Replacement", 0).id == acc.id + 1
+
+
+def test_failed_migration_rolls_back(tmp_path, monkeypatch):
+    path = str(tmp_path / "broken.db")
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    migrate(conn)
+
+    def broken(c):
+        c.execute("CREATE TABLE half_done (id INTEGER)")
+        raise sqlite3.OperationalError("boom")
+
+    monkeypatch.setattr("migrations.MIGRATIONS", MIGRATIONS + [(LATEST_VERSION + 1, "broken", broken)])
+    monkeypatch.setattr("migrations.LATEST_VERSION", LATEST_VERSION + 1)
+    with pytest.raises(sqlite3.OperationalError):
+        migrate(conn, LATEST_VERSION + 1)
+
+    assert get_version(conn) == LATEST_VERSION
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'half_done'").fetchone() is None
+    conn.close()
+
+
+def test_models_are_built_from_row_tuples(controller):
+    from models import Account, Transaction
+    (acc,) = controller.get_all_accounts()
+    assert type(acc) is Account and acc.id == controller.acc_id
+    transactions = controller.get_transactions(controller.acc_id)
+    assert all(type(t) is Transaction for t in transactions)
+    assert [(t.date, t.amount, t.category) for t in transactions] == [
+        ("2024-02-04", 99_00, "Salary"), ("2024-02-03", 10_00, "Food")]
+    assert not hasattr(transactions[0], "__dict__")
+    with pytest.raises(AttributeError):
+        transactions[0].amount = 1_00
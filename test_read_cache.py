@@ -0,0 +1,121 @@
+from read_cache import ReadCache
+
+
+def _count_queries(controller, call):
+    statements = []
+    with controller.db.connection() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            call()
+        finally:
+            conn.set_trace_callback(None)
+    return len([s for s in statements if s.lstrip().upper().startswith("SELECT")])
+
+
+def test_repeated_navigation_hits_cache(controller):
+    controller.add_account("Cached", 10_00)
+
+    def navigate():
+        controller.get_all_accounts()
+        controller.get_unique_categories()
+        controller.get_transaction_date_range()
+        controller.get_monthly_summary("2024-01")
+
+    assert _count_queries(controller, navigate) == 4
+    assert _count_queries(controller, navigate) == 0
+    stats = controller.cache_stats()
+    assert stats["hits"] == 4 and stats["misses"] == 4
+
+
+def test_writes_invalidate_affected_results(controller):
+    acc = controller.add_account("Cached", 10_00)
+    assert controller.get_all_accounts()[0].balance == 10_00
+    assert "Gifts" not in controller.get_unique_categories()
+    assert controller.get_monthly_summary("2024-01")["expenses"] == 0
+
+    controller.add_transaction(acc.id, "2024-01-02", 4_00, "Gifts", "Expense", "")
+    assert controller.get_all_accounts()[0].balance == 6_00
+    assert "Gifts" in controller.get_unique_categories()
+    assert controller.get_monthly_summary("2024-01")["expenses"] == 4_00
+
+    controller.update_account(acc.id, "Renamed", 6_00)
+    assert controller.get_all_accounts()[0].name == "Renamed"
+
+    controller.delete_category("Gifts")
+    assert "Gifts" not in controller.get_unique_categories()
+
+
+def test_cached_lists_are_copied(controller):
+    controller.add_account("Cached", 10_00)
+    controller.get_all_accounts().clear()
+    assert len(controller.get_all_accounts()) == 1
+
+    controller.add_transaction(controller.get_all_accounts()[0].id, "2024-01-02", 3_00, "Food", "Expense", "")
+    controller.get_monthly_summaries("2024-01")["2024-01"]["expenses"] = 0
+    assert controller.get_monthly_summaries("2024-01")["2024-01"]["expenses"] == 3_00
+
+
+def test_lru_bound_and_namespace_invalidation():
+    cache = ReadCache(max_entries=2)
+    for month in ("2024-01", "2024-02", "2024-03"):
+        cache.get_or_load("summary", month, lambda: month)
+    assert len(cache) == 2
+    loads = []
+    cache.get_or_load("summary", "2024-01", lambda: loads.append(1))
+    assert loads == [1]
+
+    cache.get_or_load("accounts", (), lambda: "accounts")
+    cache.invalidate("summary")
+    assert cache.get_or_load("accounts", (), lambda: "reloaded") == "accounts"
+
+
+def test_lookup_by_id(controller):
+    acc = controller.add_account("Lookup", 10_00)
+    controller.add_transaction(acc.id, "2024-01-02", 4_00, "Food", "Expense", "first")
+    controller.add_transaction(acc.id, "2024-01-03", 5_00, "Food", "Expense", "second")
+    first, second = sorted(controller.get_transactions(acc.id), key=lambda t: t.note)
+
+    assert controller.get_account(acc.id).name == "Lookup"
+    assert controller.get_account(999) is None
+    assert controller.get_transaction(second.id).note == "second"
+    assert controller.get_transaction(999) is None
+    by_ids = controller.get_transactions_by_ids([second.id, 999, first.id, second.id])
+    assert [t.note for t in by_ids] == ["second", "first"]
+
+
+def test_transactions_page_walks_history(controller):
+    acc = controller.add_account("Pages", 0)
+    for day in range(1, 8):
+        for _ in range(2):
+            controller.add_transaction(acc.id, f"2024-01-{day:02d}", 1_00, "Food", "Expense", "")
+    expected = [(t.date, t.id) for t in sorted(controller.get_transactions(), key=lambda t: (t.date, t.id), reverse=True)]
+
+    seen, after = [], None
+    while True:
+        page = controller.get_transactions_page(month_str="2024-01", after=after, limit=3)
+        seen.extend((t.date, t.id) for t in page)
+        if len(page) < 3:
+            break
+        after = seen[-1]
+    assert seen == expected
+
+
+def test_methods_sharing_a_namespace_do_not_collide(controller):
+    acc = controller.add_account("Shared", 0)
+    controller.add_transaction(acc.id, "2024-02-03", 10_00, "Food", "Expense", "")
+    assert controller.get_daily_transaction_summary("2024-02") == {3: {"has_income": False, "has_expense": True}}
+    assert controller.get_category_spending("2024-02") == {"Food": 10_00}
+
+
+def test_failed_reads_are_not_cached(controller):
+    controller.add_account("Starved", 0)
+    pool = controller.db.pool
+    pool.timeout = 0.05
+    for _ in range(pool.pool_size):
+        pool._slots.acquire()
+    try:
+        assert controller.get_all_accounts() == []  # Timed out waiting for a connection
+    finally:
+        for _ in range(pool.pool_size):
+            pool._slots.release()
+    assert [a.name for a in controller.get_all_accounts()] == ["Starved"]
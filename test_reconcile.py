@@ -0,0 +1,31 @@
+import random
+from models import Account
+from reconcile import diff_ops, apply_ops
+
+
+def _key(acc):
+    return acc.id
+
+
+def test_single_insert_is_one_op():
+    rows = [Account(id=i, name=f"A{i}", balance=i * 1_00) for i in range(1000)]
+    new = rows[:500] + [Account(id=1000, name="New", balance=1_00)] + rows[500:]
+    assert diff_ops(rows, new, _key) == [("insert", 500, new[500])]
+
+
+def test_update_remove_and_move():
+    a, b, c = (Account(id=i, name=name, balance=0) for i, name in enumerate("abc", 1))
+    b2 = Account(id=2, name="b", balance=5_00)
+
+    assert diff_ops([a, b, c], [a, b2, c], _key) == [("update", 1, b2)]
+    assert diff_ops([a, b, c], [a, c], _key) == [("remove", 1)]
+    assert apply_ops([a, b, c], diff_ops([a, b, c], [c, a, b2], _key)) == [c, a, b2]
+    assert diff_ops([a, b, c], [a, b, c], _key) == []
+
+
+def test_random_edits_converge():
+    rng = random.Random(7)
+    for _ in range(200):
+        current = [Account(id=i, name="x", balance=rng.randint(0, 3) * 1_00) for i in rng.sample(range(40), 20)]
+        new = [Account(id=i, name="x", balance=rng.randint(0, 3) * 1_00) for i in rng.sample(range(40), 20)]
+        assert apply_ops(list(current), diff_ops(current, new, _key)) == new
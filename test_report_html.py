@@ -0,0 +1,68 @@
+from models import Transaction
+from report_html import chunked, report_sections, range_report_sections, section_count, range_section_count
+
+
+def _data(count):
+    transactions = (Transaction(id=i, account_id=1, date="2024-01-01", amount=1_00,
+                                category="Food", type="Expense", note=f"row {i}") for i in range(count))
+    return {
+        "month": "2024-01",
+        "summary": {"net_worth": 10_00, "income": 0, "expenses": count * 1_00, "net_income": -count * 1_00},
+        "categories": {"Food": count * 1_00},
+        "transactions": transactions,
+    }
+
+
+def test_chunked_is_lazy():
+    consumed = []
+    source = (consumed.append(i) or i for i in range(10))
+    chunks = chunked(source, 4)
+    assert next(chunks) == [0, 1, 2, 3]
+    assert len(consumed) == 4
+    assert list(chunks) == [[4, 5, 6, 7], [8, 9]]
+
+
+def test_sections_split_the_log_into_chunks():
+    sections = list(report_sections(_data(1200), rows_per_chunk=500))
+    assert len(sections) == 3
+    assert section_count(_data(1200), 500) is None  # Generator: size unknown up front
+    assert section_count(dict(_data(0), transactions=[None] * 1200), 500) == 3
+    assert "Budget App Report" in sections[0] and "Budget App Report" not in sections[1]
+    assert [s.count("<td>2024-01-01</td>") for s in sections] == [500, 500, 200]
+    assert "Generated by Budget App" in sections[-1]
+    assert all("<thead>" in s for s in sections)
+
+
+def test_empty_report_and_escaping():
+    (section,) = report_sections(_data(0))
+    assert "No transactions found." in section and "Generated by Budget App" in section
+
+    data = _data(0)
+    data["transactions"] = [Transaction(id=1, account_id=1, date="2024-01-01", amount=5_00,
+                                        category="A&B", type="Income", note="<b>bold</b>")]
+    (section,) = report_sections(data)
+    assert "A&amp;B" in section and "&lt;b&gt;bold&lt;/b&gt;" in section and "+$5.00" in section
+
+
+def test_range_report_data_and_sections(controller):
+    acc = controller.add_account("Range", 0)
+    controller.add_transaction(acc.id, "2023-02-10", 50_00, "Salary", "Income", "")
+    controller.add_transaction(acc.id, "2024-01-05", 10_00, "Food", "Expense", "")
+    controller.add_transaction(acc.id, "2024-02-07", 100_00, "Salary", "Income", "")
+    controller.add_transaction(acc.id, "2024-02-08", 5_00, "Food", "Expense", "")
+
+    data = controller.get_range_report_data("2024-Q1")
+    assert list(data["months"]) == ["2024-01", "2024-02", "2024-03"]
+    assert data["summary"]["expenses"] == 15_00 and data["categories"] == {"Food": 15_00}
+    assert data["months"]["2024-02"]["categories"] == {"Food": 5_00}
+    assert data["previous_year"]["2024-02"]["net_income"] == 50_00
+    # Logs are read lazily, one keyset page at a time
+    assert range_section_count(data) is None
+    assert [t.date for t in controller.iter_transactions(month_str="2024-Q1", page_size=1)] == [
+        "2024-02-08", "2024-02-07", "2024-01-05"]
+
+    sections = list(range_report_sections(data, rows_per_chunk=1))
+    assert "Period: 2024-Q1" in sections[0] and "+90.0%" in sections[0]
+    assert "<h2>February 2024</h2>" in sections[2] and "<h2>February 2024</h2>" not in sections[3]
+    assert len(sections) == 5  # Overview, Jan, Feb x2, Mar
+    assert "Generated by Budget App" in sections[-1]
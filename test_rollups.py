@@ -0,0 +1,65 @@
+from importer import TransactionImporter
+
+
+def _rollups(controller):
+    rows = controller.db.fetch_all(
+        "SELECT month, account_id, category_id, type, total, count "
+        "FROM monthly_rollups ORDER BY 1, 2, 3, 4"
+    )
+    return [tuple(row.values()) for row in rows]
+
+
+def test_incremental_rollups_match_rebuild(controller):
+    a = controller.add_account("A", 0)
+    b = controller.add_account("B", 0)
+    controller.add_transaction(a.id, "2024-01-05", 10_00, "Food", "Expense", "")
+    controller.add_transaction(a.id, "2024-01-09", 15_50, "Food", "Expense", "")
+    controller.add_transaction(b.id, "2024-02-01", 900_00, "Salary", "Income", "")
+    t = controller.get_transactions(a.id)[0]
+    controller.update_transaction(t.id, {
+        "account_id": b.id, "date": "2024-03-02", "amount": 20_00,
+        "category": "Rent", "type": "Expense", "note": ""
+    })
+    controller.delete_transaction(controller.get_transactions(month_str="2024-02")[0].id)
+    TransactionImporter(controller.db).import_rows(
+        [("2024-01-20", 4_50, "Food", "Expense", "", None), ("2024-03-03", 1_00, "Rent", "Expense", "", None)],
+        a.id
+    )
+
+    incremental = _rollups(controller)
+    assert controller.rebuild_rollups()
+    assert incremental == _rollups(controller)
+    assert all(type(total) is int for *_, total, _count in incremental)
+    food = controller._category_ids()["Food"]
+    assert ("2024-01", a.id, food, "Expense", 10_00 + 4_50, 2) in incremental
+    salary = controller._category_ids()["Salary"]
+    assert ("2024-02", b.id, salary, "Income", 900_00, 1) not in incremental
+
+
+def test_reports_read_rollups(controller):
+    acc = controller.add_account("A", 0)
+    controller.add_transaction(acc.id, "2024-01-05", 10_00, "Food", "Expense", "")
+    controller.add_transaction(acc.id, "2024-01-25", 30_00, "Salary", "Income", "")
+    # Rollups are the source of truth for whole-month reports
+    controller.db.execute_query("UPDATE monthly_rollups SET total = 9900 "
+                                "WHERE category_id = (SELECT id FROM categories WHERE name = 'Food')")
+
+    assert controller.get_category_spending("2024-01") == {"Food": 99_00}
+    assert controller.get_monthly_summary("2024-01")["expenses"] == 99_00
+    # Custom spans that do not line up with months aggregate raw transactions
+    assert controller.get_category_spending("2024-01-01..2024-01-10") == {"Food": 10_00}
+
+    controller.rebuild_rollups()
+    assert controller.get_category_spending("2024-01") == {"Food": 10_00}
+
+
+def test_delete_account_removes_its_transactions_and_rollups(controller):
+    a = controller.add_account("A", 0)
+    b = controller.add_account("B", 0)
+    controller.add_transaction(a.id, "2024-01-05", 10_00, "Food", "Expense", "")
+    controller.add_transaction(b.id, "2024-01-06", 20_00, "Food", "Expense", "")
+    assert controller.get_category_spending("2024-01") == {"Food": 30_00}
+    assert controller.delete_account(a.id)
+    assert controller.get_transactions(a.id) == []
+    assert [row[1] for row in _rollups(controller)] == [b.id]
+    assert controller.get_category_spending("2024-01") == {"Food": 20_00}
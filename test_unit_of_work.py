@@ -0,0 +1,66 @@
+import sqlite3
+import threading
+import pytest
+
+
+def _balance(controller, account_id):
+    return controller.db.fetch_one("SELECT balance FROM accounts WHERE id = ?", (account_id,))["balance"]
+
+
+def test_transaction_rolls_back_on_error(controller):
+    acc = controller.add_account("Rollback", 100_00)
+
+    with pytest.raises(sqlite3.Error):
+        with controller.db.transaction() as conn:
+            conn.execute("UPDATE accounts SET balance = 0 WHERE id = ?", (acc.id,))
+            controller.db.execute_query("INSERT INTO missing_table VALUES (1)")
+
+    assert _balance(controller, acc.id) == 100_00
+
+
+def test_add_transaction_commits_once(controller):
+    acc = controller.add_account("Commits", 100_00)
+    statements = []
+    with controller.db.connection() as conn:
+        conn.set_trace_callback(statements.append)
+        assert controller.add_transaction(acc.id, "2024-03-01", 40_00, "Brand New", "Expense", "")
+        conn.set_trace_callback(None)
+
+    assert [s for s in statements if s.startswith(("BEGIN", "COMMIT"))] == ["BEGIN IMMEDIATE", "COMMIT"]
+    assert _balance(controller, acc.id) == 60_00
+    assert "Brand New" in controller.get_unique_categories()
+
+
+def test_update_and_delete_correct_balances(controller):
+    a = controller.add_account("A", 100_00)
+    b = controller.add_account("B", 100_00)
+    controller.add_transaction(a.id, "2024-03-01", 30_00, "Food", "Expense", "")
+    t = controller.get_transactions(a.id)[0]
+
+    assert controller.update_transaction(t.id, {
+        "account_id": b.id, "date": "2024-03-02", "amount": 50_00,
+        "category": "Salary", "type": "Income", "note": "moved"
+    })
+    assert _balance(controller, a.id) == 100_00
+    assert _balance(controller, b.id) == 150_00
+
+    assert controller.delete_transaction(t.id)
+    assert _balance(controller, b.id) == 100_00
+    assert not controller.delete_transaction(t.id)
+
+
+def test_concurrent_adds_do_not_lose_updates(controller):
+    acc = controller.add_account("Busy", 0)
+
+    def worker():
+        for _ in range(25):
+            controller.add_transaction(acc.id, "2024-03-01", 1_00, "Salary", "Income", "")
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert _balance(controller, acc.id) == 100_00
+    assert len(controller.get_transactions(acc.id)) == 100
@@ -0,0 +1,203 @@
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex, QRectF, QSize
+from PySide2.QtGui import QColor, QFont, QPainter, QPainterPath
+from PySide2.QtWidgets import QStyle, QStyledItemDelegate
+from controllers import PAGE_SIZE
+from models import Money
+from reconcile import diff_ops
+
+# Item data role that returns the row's Transaction object
+TransactionRole = Qt.UserRole + 1
+
+INCOME_COLOR = "#a6e3a1"
+EXPENSE_COLOR = "#f38ba8"
+NOTE_COLOR = "#a6adc8"
+
+
+def format_amount(t) -> str:
+    amount = Money(t.amount)
+    return f"+${amount:,.2f}" if t.type == "Income" else f"-${amount:,.2f}"
+
+
+class TransactionTableModel(QAbstractTableModel):
+    """Lazily loaded transactions for one account/month filter.
+
+    Rows are pulled from the controller a page at a time through
+    canFetchMore/fetchMore, so the view only ever asks for the rows the
+    user has scrolled to.
+    """
+    COLUMNS = ["Date", "Category", "Note", "Amount"]
+
+    def __init__(self, controller, parent=None, page_size: int = PAGE_SIZE):
+        super().__init__(parent)
+        self.controller = controller
+        self.page_size = page_size
+        self.month_str = None
+        self.account_id = None
+        self._rows = []
+        self._exhausted = True
+        self._loaded = False
+
+    def load(self, month_str: str = None, account_id: int = None):
+        """Resets the model to a new filter; the first page loads on demand."""
+        self.beginResetModel()
+        self.month_str = month_str
+        self.account_id = account_id
+        self._rows = []
+        self._exhausted = False
+        self._loaded = True
+        self.endResetModel()
+
+    def reload(self):
+        """Re-runs the current filter from scratch."""
+        self.load(self.month_str, self.account_id)
+
+    def refresh(self):
+        """Re-reads the loaded rows and patches only those that changed.
+
+        Used after writes: inserted, edited and deleted transactions become
+        row inserts, dataChanged and row removals, so the view keeps its
+        scroll position and untouched rows are not repainted.
+        """
+        if not self._loaded:
+            return
+        # One row past the loaded window shows whether more pages remain; once
+        # everything is loaded, leave room for new rows
+        limit = len(self._rows) + (self.page_size if self._exhausted else 1)
+        fresh = self.controller.get_transactions_page(self.account_id, self.month_str, limit=limit)
+        last_column = len(self.COLUMNS) - 1
+
+        for op in diff_ops(self._rows, fresh, key=lambda t: t.id):
+            row = op[1]
+            if op[0] == "remove":
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+            elif op[0] == "insert":
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._rows.insert(row, op[2])
+                self.endInsertRows()
+            else:
+                self._rows[row] = op[2]
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+        self._exhausted = len(fresh) < limit
+
+    def transaction_at(self, row: int):
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        t = self._rows[index.row()]
+        column = index.column()
+
+        if role == TransactionRole:
+            return t
+        if role == Qt.DisplayRole:
+            return (t.date, t.category, t.note, format_amount(t))[column]
+        if role == Qt.ForegroundRole and column == 3:
+            return QColor(INCOME_COLOR if t.type == "Income" else EXPENSE_COLOR)
+        if role == Qt.TextAlignmentRole and column == 3:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted:
+            return
+        after = (self._rows[-1].date, self._rows[-1].id) if self._rows else None
+        page = self.controller.get_transactions_page(self.account_id, self.month_str,
+                                                     after=after, limit=self.page_size)
+        if len(page) < self.page_size:
+            self._exhausted = True
+        if not page:
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        self.endInsertRows()
+
+
+class TransactionDelegate(QStyledItemDelegate):
+    """Paints a whole transaction row as a card, like the old TransactionRow frames.
+
+    Card colors come from the view's palette (AlternateBase for the card,
+    Highlight when hovered) so the light and dark themes can style it.
+    """
+    ROW_HEIGHT = 64
+    SPACING = 10
+    DATE_WIDTH = 100
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT + self.SPACING)
+
+    def paint(self, painter, option, index):
+        t = index.data(TransactionRole)
+        if t is None:
+            return super().paint(painter, option, index)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = QRectF(option.rect).adjusted(0, 0, 0, -self.SPACING)
+        path = QPainterPath()
+        path.addRoundedRect(card, 8, 8)
+        hovered = option.state & QStyle.State_MouseOver
+        painter.fillPath(path, option.palette.highlight() if hovered else option.palette.alternateBase())
+
+        content = card.adjusted(15, 10, -15, -10)
+        text_color = option.palette.text().color()
+
+        # Date
+        painter.setFont(option.font)
+        painter.setPen(text_color)
+        painter.drawText(QRectF(content.left(), content.top(), self.DATE_WIDTH, content.height()),
+                         Qt.AlignLeft | Qt.AlignVCenter, t.date)
+
+        # Amount
+        amount_font = QFont(option.font)
+        amount_font.setBold(True)
+        amount_font.setPixelSize(16)
+        painter.setFont(amount_font)
+        painter.setPen(QColor(INCOME_COLOR if t.type == "Income" else EXPENSE_COLOR))
+        amount_str = format_amount(t)
+        amount_width = painter.fontMetrics().horizontalAdvance(amount_str) + 10
+        painter.drawText(QRectF(content.right() - amount_width, content.top(), amount_width, content.height()),
+                         Qt.AlignRight | Qt.AlignVCenter, amount_str)
+
+        # Category & Note
+        details = QRectF(content.left() + self.DATE_WIDTH, content.top(),
+                         content.width() - self.DATE_WIDTH - amount_width, content.height() / 2)
+        cat_font = QFont(option.font)
+        cat_font.setBold(True)
+        cat_font.setPixelSize(14)
+        painter.setFont(cat_font)
+        painter.setPen(text_color)
+        painter.drawText(details, Qt.AlignLeft | Qt.AlignVCenter,
+                         painter.fontMetrics().elidedText(t.category or "", Qt.ElideRight, int(details.width())))
+
+        note_font = QFont(option.font)
+        note_font.setPixelSize(12)
+        painter.setFont(note_font)
+        painter.setPen(QColor(NOTE_COLOR))
+        details.translate(0, details.height())
+        painter.drawText(details, Qt.AlignLeft | Qt.AlignVCenter,
+                         painter.fontMetrics().elidedText(t.note or "", Qt.ElideRight, int(details.width())))
+
+        painter.restore()
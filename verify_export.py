@@ -11,19 +11,19 @@ def test_export():
     data = {
         "month": "2026-02",
         "summary": {
-            "net_worth": 5000.0,
-            "income": 3000.0,
-            "expenses": 1200.0,
-            "net_income": 1800.0
+            "net_worth": 5000_00,
+            "income": 3000_00,
+            "expenses": 1200_00,
+            "net_income": 1800_00
         },
         "categories": {
-            "Food": 400.0,
-            "Rent": 800.0
+            "Food": 400_00,
+            "Rent": 800_00
         },
         "transactions": [
-            Transaction(id="1", account_id="acc1", date="2026-02-01", amount=3000.0, category="Salary", type="Income", note="Test Income"),
-            Transaction(id="2", account_id="acc1", date="2026-02-05", amount=400.0, category="Food", type="Expense", note="Groceries"),
-            Transaction(id="3", account_id="acc1", date="2026-02-10", amount=800.0, category="Rent", type="Expense", note="Monthly Rent")
+            Transaction(id="1", account_id="acc1", date="2026-02-01", amount=3000_00, category="Salary", type="Income", note="Test Income"),
+            Transaction(id="2", account_id="acc1", date="2026-02-05", amount=400_00, category="Food", type="Expense", note="Groceries"),
+            Transaction(id="3", account_id="acc1", date="2026-02-10", amount=800_00, category="Rent", type="Expense", note="Monthly Rent")
         ]
     }
     